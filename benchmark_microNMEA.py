@@ -0,0 +1,231 @@
+"""
+Throughput benchmark of microNMEA parser and Precise arithmetic.
+
+Synthetic mixed-constellation workload (GGA, RMC, GSA, multi-part GSV and
+STI,030 per epoch) is parsed to measure sentences per second overall and per
+sentence type. Precise operations are timed separately and tracemalloc reports
+memory allocated while parsing. Results are printed as JSON and may be saved
+and compared with results of another version:
+
+    python benchmark_microNMEA.py --output before.json
+    python benchmark_microNMEA.py --compare before.json
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+import microNMEA
+
+# Talker, GNSS system ID of GSA and first satellite ID of the constellation.
+CONSTELLATIONS = (
+    ("GP", 1, 1),
+    ("GL", 2, 65),
+    ("GA", 3, 1),
+    ("GB", 4, 1),
+)
+
+
+def make_sentence(body: str) -> str:
+    """
+    Complete sentence with start character and checksum.
+    """
+    return f"${body}*{microNMEA.MicroNMEA.checksum('$' + body):02X}"
+
+
+def _coordinate(value: float, degree_digits: int) -> str:
+    degrees = int(value)
+    return f"{degrees:0{degree_digits}d}{(value - degrees) * 60:010.7f}"
+
+
+def synthetic_workload(epochs: int = 1000, rate: float = 10.0, constellations: int = 4,
+                       satellites: int = 10, seed: int = 0) -> list:
+    """
+    Sentences of the given number of epochs received at rate epochs per second.
+    Each epoch has GGA, RMC, GSA and GSV group per constellation and STI,030.
+    """
+    generator = random.Random(seed)
+    lat = 55.779943
+    lon = 11.422644
+    sentences = []
+    for epoch in range(epochs):
+        seconds = 12 * 3600 + epoch / rate
+        time_str = f"{int(seconds // 3600):02d}{int(seconds % 3600 // 60):02d}{seconds % 60:06.3f}"
+        lat += generator.uniform(-1e-6, 1e-6)
+        lon += generator.uniform(-1e-6, 1e-6)
+        lat_str = _coordinate(lat, 2)
+        lon_str = _coordinate(lon, 3)
+        alt = 225 + generator.uniform(-0.5, 0.5)
+        hdop = generator.uniform(0.5, 1.5)
+        sentences.append(make_sentence(f"GPGGA,{time_str},{lat_str},N,{lon_str},E,4,{satellites * constellations},"
+                                       f"{hdop:.1f},{alt:.3f},M,36.900,M,1.0,0000"))
+        sentences.append(make_sentence(f"GNRMC,{time_str},A,{lat_str},N,{lon_str},E,000.1,123.4,080225,,,R,S"))
+        for talker, system_id, first_id in CONSTELLATIONS[:constellations]:
+            used = ",".join(f"{first_id + i:02d}" for i in range(min(satellites, 12)))
+            used += "," * (12 - min(satellites, 12))
+            sentences.append(make_sentence(f"GNGSA,A,3,{used},1.2,{hdop:.1f},1.0,{system_id}"))
+            parts = (satellites + 3) // 4
+            for part in range(parts):
+                in_view = ",".join(f"{first_id + i:02d},{generator.randint(5, 90):02d},"
+                                   f"{generator.randint(0, 359):03d},{generator.randint(20, 50):02d}"
+                                   for i in range(part * 4, min(satellites, part * 4 + 4)))
+                sentences.append(make_sentence(f"{talker}GSV,{parts},{part + 1},{satellites:02d},{in_view},1"))
+        sentences.append(make_sentence(f"PSTI,030,{time_str},A,{lat_str},N,{lon_str},E,{alt:.3f},0.01,-0.02,0.00,"
+                                       f"080225,R,1.0,3.7"))
+    return sentences
+
+
+def benchmark_parser(sentences: list, repeat: int = 3, **parser_options) -> dict:
+    """
+    Best of repeat runs of overall throughput and per sentence type timings.
+    """
+    best_total = None
+    for _ in range(repeat):
+        nmea = microNMEA.MicroNMEA(**parser_options)
+        parse = nmea.parse
+        start = time.perf_counter_ns()
+        for sentence in sentences:
+            parse(sentence)
+        elapsed = time.perf_counter_ns() - start
+        best_total = elapsed if best_total is None else min(best_total, elapsed)
+
+    per_type = {}
+    for _ in range(repeat):
+        nmea = microNMEA.MicroNMEA(**parser_options)
+        parse = nmea.parse
+        clock = time.perf_counter_ns
+        timings = {}
+        for sentence in sentences:
+            start = clock()
+            sentence_type = parse(sentence)
+            elapsed = clock() - start
+            timing = timings.get(sentence_type)
+            if timing is None:
+                timings[sentence_type] = [1, elapsed]
+            else:
+                timing[0] += 1
+                timing[1] += elapsed
+        for sentence_type, (count, elapsed) in timings.items():
+            key = str(sentence_type)
+            if key not in per_type or elapsed < per_type[key]["total_ns"]:
+                per_type[key] = {"count": count, "total_ns": elapsed, "ns_per_sentence": elapsed // count,
+                                 "sentences_per_second": round(count * 1e9 / elapsed)}
+    return {"sentences": len(sentences), "total_ns": best_total,
+            "sentences_per_second": round(len(sentences) * 1e9 / best_total), "per_type": per_type}
+
+
+def benchmark_precise(iterations: int = 2000, seed: int = 0) -> dict:
+    """
+    Nanoseconds per call of Precise operations on random arguments.
+    """
+    generator = random.Random(seed)
+    values = [microNMEA.Precise(f"{generator.uniform(-10, 10):.10f}") for _ in range(iterations)]
+    positives = [microNMEA.Precise(f"{generator.uniform(0.001, 10000):.10f}") for _ in range(iterations)]
+    angles = [microNMEA.Precise(f"{generator.uniform(-3, 3):.10f}") for _ in range(iterations)]
+    operations = {
+        "add": lambda i: values[i] + values[-i],
+        "multiply": lambda i: values[i] * values[-i],
+        "divide": lambda i: values[i] / positives[i],
+        "parse": lambda i: microNMEA.Precise("46.7965950"),
+        "format": lambda i: values[i].value_str,
+        "from_degrees_minutes": lambda i: microNMEA.Precise.from_degrees_minutes("55", "46.7965950"),
+        "sqrt": lambda i: microNMEA.Precise.sqrt(positives[i]),
+        "cos": lambda i: microNMEA.Precise.cos(angles[i]),
+        "sin": lambda i: microNMEA.Precise.sin(angles[i]),
+        "atan2": lambda i: microNMEA.Precise.atan2(values[i], values[-i - 1]),
+        "asin": lambda i: microNMEA.Precise.asin(angles[i] / "3"),
+    }
+    results = {}
+    for name, operation in operations.items():
+        start = time.perf_counter_ns()
+        for i in range(iterations):
+            operation(i)
+        results[name] = {"ns_per_call": (time.perf_counter_ns() - start) // iterations}
+    return results
+
+
+def measure_allocations(sentences: list, **parser_options) -> dict:
+    """
+    Memory allocated by tracemalloc while parsing the sentences.
+    """
+    nmea = microNMEA.MicroNMEA(**parser_options)
+    # Warm up, so caches created on first use are not counted.
+    for sentence in sentences[:100]:
+        nmea.parse(sentence)
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        for sentence in sentences:
+            nmea.parse(sentence)
+        current, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    retained_blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    return {"peak_bytes": peak, "retained_bytes": current, "retained_blocks": retained_blocks,
+            "peak_bytes_per_sentence": round(peak / len(sentences), 1)}
+
+
+def compare(results: dict, baseline: dict) -> list:
+    """
+    Lines describing change of throughput and timings against baseline results.
+    """
+    lines = []
+    old = baseline["parser"]["sentences_per_second"]
+    new = results["parser"]["sentences_per_second"]
+    lines.append(f"parser: {old} -> {new} sentences/s ({new / old:.2f}x)")
+    for sentence_type, timing in results["parser"]["per_type"].items():
+        old_timing = baseline["parser"]["per_type"].get(sentence_type)
+        if old_timing:
+            lines.append(f"  {sentence_type}: {old_timing['ns_per_sentence']} -> {timing['ns_per_sentence']} "
+                         f"ns/sentence ({old_timing['ns_per_sentence'] / timing['ns_per_sentence']:.2f}x)")
+    for name, timing in results["precise"].items():
+        old_timing = baseline["precise"].get(name)
+        if old_timing:
+            lines.append(f"precise {name}: {old_timing['ns_per_call']} -> {timing['ns_per_call']} ns/call "
+                         f"({old_timing['ns_per_call'] / max(timing['ns_per_call'], 1):.2f}x)")
+    old = baseline["allocations"]["peak_bytes"]
+    new = results["allocations"]["peak_bytes"]
+    lines.append(f"allocations peak: {old} -> {new} bytes")
+    return lines
+
+
+def main(argv: list = None) -> dict:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--epochs", type=int, default=1000, help="number of epochs of the workload")
+    parser.add_argument("--rate", type=float, default=10.0, help="epochs per second of the workload")
+    parser.add_argument("--constellations", type=int, default=4, choices=range(1, len(CONSTELLATIONS) + 1),
+                        help="number of GNSS constellations")
+    parser.add_argument("--satellites", type=int, default=10, help="satellites in view per constellation")
+    parser.add_argument("--formats", type=int, default=2, choices=(1, 2, 3, 4), help="MicroNMEA formats option")
+    parser.add_argument("--repeat", type=int, default=3, help="runs of each benchmark, the best one is kept")
+    parser.add_argument("--seed", type=int, default=0, help="random seed of the workload")
+    parser.add_argument("--output", help="save results to JSON file")
+    parser.add_argument("--compare", help="compare results with JSON file of previous run")
+    args = parser.parse_args(argv)
+
+    sentences = synthetic_workload(args.epochs, args.rate, args.constellations, args.satellites, args.seed)
+    results = {
+        "python": platform.python_implementation() + " " + platform.python_version(),
+        "workload": {"epochs": args.epochs, "rate": args.rate, "constellations": args.constellations,
+                     "satellites": args.satellites, "formats": args.formats, "seed": args.seed},
+        "parser": benchmark_parser(sentences, args.repeat, formats=args.formats),
+        "precise": benchmark_precise(seed=args.seed),
+        "allocations": measure_allocations(sentences, formats=args.formats),
+    }
+    print(json.dumps(results, indent=2))
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+    if args.compare:
+        with open(args.compare) as file:
+            print("\n".join(compare(results, json.load(file))), file=sys.stderr)
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -1,200 +1,410 @@
+import math
+from array import array
+
+try:
+    from time import perf_counter_ns as _clock_ns
+except ImportError:
+    # MicroPython.
+    from time import ticks_us
+
+    def _clock_ns() -> int:
+        return ticks_us() * 1000
+
+try:
+    from math import isqrt as _isqrt
+except ImportError:
+    # MicroPython.
+    def _isqrt(value: int) -> int:
+        x = value
+        y = (x + 1) // 2
+        while y < x:
+            x = y
+            y = (x + value // x) // 2
+        return x
+
+try:
+    from threading import local as _thread_local
+except ImportError:
+    # MicroPython without threading, precision context is shared.
+    class _thread_local:
+        pass
+
+
+class _PrecisionState(_thread_local):
+    # Decimal places set by Precise.context in the thread, class attribute is the default of other threads.
+    places = None
+
+
+NAN = float("nan")
+
+
 class Precise:
 
+    __slots__ = ("_value", "_places")
+
+    # Decimal places of numbers created outside of any precision context.
     DECIMAL_PLACES = 10
-    multiplier = 10 ** DECIMAL_PLACES
+    MAX_DECIMAL_PLACES = 30
+    _SCALES = tuple(10 ** places for places in range(MAX_DECIMAL_PLACES + 1))
 
-    def __init__(self, value_str: str) -> None:
-        self.parts = value_str.split('.')
-        self.whole_part_with_sign = self.parts[0]
-        self.decimal_part = self._ljust(self.parts[1]) if len(self.parts) == 2 else self._ljust("0")
-        self.value_str = self.whole_part_with_sign + "." + self.decimal_part
+    # Trigonometric functions run CORDIC on integers scaled by 10 ** (places + TRIG_GUARD_DIGITS),
+    # see _trig_tables.
+    TRIG_GUARD_DIGITS = 3
 
-    def _ljust(self, data: str) -> str:
-        return f"{data:<{self.DECIMAL_PLACES}}".replace(" ", "0")
+    _context = _PrecisionState()
 
-    def _rjust(self, data: str) -> str:
-        return f"{data:>{self.DECIMAL_PLACES}}".replace(" ", "0")
+    def __init__(self, value_str: str, places: int = None) -> None:
+        # Value is kept as integer scaled by 10^places, string is built only on demand.
+        if places is None:
+            places = self._context.places or self.DECIMAL_PLACES
+        else:
+            self._check_places(places)
+        self._places = places
+        self._value = self._to_fixed_point(value_str, places)
+
+    @classmethod
+    def _from_fixed_point(cls, fixed_point_value: int, places: int = None) -> "Precise":
+        result = cls.__new__(cls)
+        result._value = fixed_point_value
+        result._places = places or cls._context.places or cls.DECIMAL_PLACES
+        return result
+
+    @classmethod
+    def current_places(cls) -> int:
+        """
+        Decimal places of new numbers in the current thread.
+        """
+        return cls._context.places or cls.DECIMAL_PLACES
+
+    @classmethod
+    def context(cls, places: int) -> "PrecisionContext":
+        """
+        Context manager setting decimal places of numbers created in the current
+        thread, e.g. with Precise.context(7): ...
+        """
+        return PrecisionContext(places)
+
+    @classmethod
+    def _check_places(cls, places: int) -> None:
+        if not isinstance(places, int) or not 1 <= places <= cls.MAX_DECIMAL_PLACES:
+            raise ValueError(f"Decimal places must be in [1, {cls.MAX_DECIMAL_PLACES}]")
+
+    @property
+    def places(self) -> int:
+        return self._places
+
+    @property
+    def multiplier(self) -> int:
+        return self._SCALES[self._places]
+
+    @property
+    def value_str(self) -> str:
+        whole_part, decimal_part = divmod(abs(self._value), self._SCALES[self._places])
+        return f"{'-' if self._value < 0 else ''}{whole_part}.{decimal_part:0{self._places}d}"
+
+    def with_places(self, places: int) -> "Precise":
+        """
+        Number with other decimal places, extra places are truncated as when parsing.
+        """
+        self._check_places(places)
+        if places >= self._places:
+            return self._from_fixed_point(self._value * self._SCALES[places - self._places], places)
+        value = abs(self._value) // self._SCALES[self._places - places]
+        return self._from_fixed_point(-value if self._value < 0 else value, places)
+
+    @classmethod
+    def _ljust(cls, data: str, places: int = None) -> str:
+        return f"{data:<{places or cls.current_places()}}".replace(" ", "0")
+
+    @classmethod
+    def _rjust(cls, data, places: int = None) -> str:
+        return f"{data:>{places or cls.current_places()}}".replace(" ", "0")
 
-    def _to_fixed_point(self, value_str: str) -> float:
+    @classmethod
+    def _to_fixed_point(cls, value_str: str, places: int = None) -> int:
+        places = places or cls._context.places or cls.DECIMAL_PLACES
         try:
-            # Split by decimal point.
             sign = 1
             if value_str[0] == "-":
                 sign = -1
                 value_str = value_str[1:]
-            if '.' in value_str:
-                whole_part, decimal_part = value_str.split('.')
-                # Pad decimal part to our precision.
-                decimal_part = self._ljust(decimal_part)[:self.DECIMAL_PLACES]
-                # Convert to our internal integer representation.
-                return sign * (int(whole_part) * self.multiplier + int(self._ljust(decimal_part)[:self.DECIMAL_PLACES]))
-            else:
-                return sign * int(value_str) * self.multiplier
-        except ValueError:
+            # Split by decimal point.
+            whole_part, _, decimal_part = value_str.partition(".")
+            if decimal_part:
+                # Scale decimal part to our precision and convert to our internal integer representation.
+                decimal_part = decimal_part[:places]
+                return sign * (int(whole_part) * cls._SCALES[places] +
+                               int(decimal_part) * cls._SCALES[places - len(decimal_part)])
+            return sign * int(whole_part) * cls._SCALES[places]
+        except (ValueError, IndexError):
             raise ValueError(f"Invalid number format: {value_str}")
 
-    def _to_string(self, fixed_point_value: float) -> str:
+    @classmethod
+    def _to_string(cls, fixed_point_value: int, places: int = None) -> str:
+        places = places or cls.current_places()
         sign = "-" if fixed_point_value < 0 else ""
-        whole_part = int(fixed_point_value / self.multiplier)
-        decimal_part = abs(fixed_point_value) % self.multiplier
-        # Format with leading zeros in decimal part.
-        decimal_str = self._rjust(decimal_part)
-        # Combine parts.
-        result = f"{sign}{abs(whole_part)}.{decimal_str}"
-        # Remove trailing zeros but keep one zero after decimal point if needed.
-        if '.' in result:
-            result = result.rstrip('0').rstrip('.') if (result.rstrip('0') != result.rstrip('0').
-                                                        rstrip('.')) else result.rstrip('0')
-        return result
+        whole_part, decimal_part = divmod(abs(fixed_point_value), cls._SCALES[places])
+        # Format with leading zeros in decimal part and remove trailing zeros.
+        decimal_str = cls._rjust(decimal_part, places).rstrip("0")
+        if decimal_str:
+            return f"{sign}{whole_part}.{decimal_str}"
+        return f"{sign}{whole_part}"
 
-    def _get_parameter(self, b):
+    @classmethod
+    def _argument(cls, value) -> tuple:
+        # Scaled integer and decimal places of str or Precise argument.
+        if isinstance(value, Precise):
+            return value._value, value._places
+        elif isinstance(value, str):
+            places = cls.current_places()
+            return cls._to_fixed_point(value, places), places
+        else:
+            raise TypeError("Incorrect attribute type. Must be str or Precise.")
+
+    def _operands(self, b) -> tuple:
+        # Scaled integers of both operands with common decimal places, mixed precision is promoted to the larger.
+        places = self._places
         if isinstance(b, Precise):
-            return self._to_fixed_point(b.value_str)
+            if b._places == places:
+                return self._value, b._value, places
+            if b._places > places:
+                return self._value * self._SCALES[b._places - places], b._value, b._places
+            return self._value, b._value * self._SCALES[places - b._places], places
         elif isinstance(b, str):
-            return self._to_fixed_point(b)
+            return self._value, self._to_fixed_point(b, places), places
         else:
             raise TypeError("Incorrect attribute type. Must be str or Precise.")
 
+    @classmethod
+    def _arguments(cls, a, b) -> tuple:
+        if not isinstance(a, Precise):
+            a = cls._from_fixed_point(*cls._argument(a))
+        return a._operands(b)
+
     def __add__(self, b):
-        fixed_a = self._to_fixed_point(self.value_str)
-        fixed_b = self._get_parameter(b)
-        result = fixed_a + fixed_b
-        return Precise(self._to_string(result))
+        a, b, places = self._operands(b)
+        return self._from_fixed_point(a + b, places)
 
     def __sub__(self, b):
-        fixed_a = self._to_fixed_point(self.value_str)
-        fixed_b = self._get_parameter(b)
-        result = fixed_a - fixed_b
-        return Precise(self._to_string(result))
+        a, b, places = self._operands(b)
+        return self._from_fixed_point(a - b, places)
 
     def __mul__(self, b):
-        fixed_a = self._to_fixed_point(self.value_str)
-        fixed_b = self._get_parameter(b)
+        a, b, places = self._operands(b)
         # When multiplying, we need to divide by the multiplier to maintain precision.
-        result = (fixed_a * fixed_b) // self.multiplier
-        return Precise(self._to_string(result))
+        return self._from_fixed_point((a * b) // self._SCALES[places], places)
 
     def __truediv__(self, b):
-        fixed_a = self._to_fixed_point(self.value_str)
-        fixed_b = self._get_parameter(b)
+        fixed_a, fixed_b, places = self._operands(b)
         if fixed_b == 0:
             raise ZeroDivisionError("Division by zero")
-        # When dividing, we need to multiply by the multiplier to maintain precision.
-        result = int((fixed_a * self.multiplier) / fixed_b)
-        return Precise(self._to_string(result))
+        # When dividing, we need to multiply by the multiplier to maintain precision. Result is truncated.
+        result = (abs(fixed_a) * self._SCALES[places]) // abs(fixed_b)
+        return self._from_fixed_point(-result if (fixed_a < 0) != (fixed_b < 0) else result, places)
 
     def __repr__(self):
         return self.value_str
 
     @classmethod
-    def radians(cls, dd: str):
-        if isinstance(dd, Precise):
-            _dd = dd.value_str
-        elif isinstance(dd, str):
-            _dd = dd
-        else:
-            raise TypeError("Incorrect attribute type. Must be str or Precise.")
-        return Precise("3.141592653589793") / Precise("180") * _dd
+    def from_degrees_minutes(cls, degrees: str, minutes: str) -> "Precise":
+        """
+        Decimal degrees from degrees and minutes parts of NMEA coordinate, computed
+        in one step with the same truncation as Precise(degrees) + Precise(minutes) / "60".
+        """
+        places = cls._context.places or cls.DECIMAL_PLACES
+        return cls._from_fixed_point(int(degrees) * cls._SCALES[places] + cls._to_fixed_point(minutes, places) // 60,
+                                     places)
 
     @classmethod
-    def atan2(cls, y, x):
-        if isinstance(y, str):
-            y = Precise(y)
-        if isinstance(x, str):
-            x = Precise(x)
-        y_fp = y._to_fixed_point(y.value_str) if isinstance(y, Precise) else 0
-        x_fp = x._to_fixed_point(x.value_str) if isinstance(x, Precise) else 0
-        if x_fp == 0 and y_fp == 0:
-            return Precise("0")
-        pi = Precise("3.141592653589793")
-        half_pi = Precise("1.5707963267948966")
-        if x_fp == 0:
-            if y_fp > 0:
-                return half_pi
-            else:
-                return Precise("-1.5707963267948966")
-        if y_fp == 0:
-            if x_fp > 0:
-                return Precise("0")
-            else:
-                return pi
-        atan_table = [
-            "0.7853981633974483",  # atan(2^0)
-            "0.4636476090008061",  # atan(2^-1)
-            "0.2449786631268641",  # atan(2^-2)
-            "0.1243549945467614",  # atan(2^-3)
-            "0.0624188099959574",  # atan(2^-4)
-            "0.0312398334302683",  # atan(2^-5)
-            "0.0156237286204768",  # atan(2^-6)
-            "0.0078123410601011",  # atan(2^-7)
-            "0.0039062301319670",  # atan(2^-8)
-            "0.0019531225164788",  # atan(2^-9)
-            "0.0009765621895593",  # atan(2^-10)
-            "0.0004882812111948",  # atan(2^-11)
-            "0.0002441406201493",  # atan(2^-12)
-            "0.0001220703118937",  # atan(2^-13)
-            "0.0000610351561742",  # atan(2^-14)
-            "0.0000305175781155",  # atan(2^-15)
-        ]
-        angle_offset = Precise("0")
-        if x_fp < 0:
-            if y_fp >= 0:
-                angle_offset = pi
+    def radians(cls, dd):
+        value, places = cls._argument(dd)
+        tables = cls._trig(places)
+        return cls._from_trig(value * tables[4] // (180 * cls._SCALES[places]), places, tables[0])
+
+    @classmethod
+    def _trig(cls, places: int) -> tuple:
+        # Tables of trigonometric engine for the decimal places, built on first use.
+        tables = _TRIG_TABLES.get(places)
+        if tables is None:
+            tables = _TRIG_TABLES[places] = _trig_tables(places, cls.TRIG_GUARD_DIGITS)
+        return tables
+
+    @classmethod
+    def _from_trig(cls, value: int, places: int, guard: int) -> "Precise":
+        # Round result of trigonometric engine to decimal places.
+        return cls._from_fixed_point((value + guard // 2) // guard, places)
+
+    @staticmethod
+    def _rotate(angle: int, tables: tuple) -> tuple:
+        """
+        Cosine and sine of angle in [-pi/2, pi/2], all scaled by trigonometric scale.
+        """
+        _, scale, atan_table, x, _ = tables
+        y = 0
+        for i, atan_i in enumerate(atan_table):
+            if angle >= 0:
+                x, y = x - (y >> i), y + (x >> i)
+                angle -= atan_i
             else:
-                angle_offset = Precise("-3.141592653589793")
-            x_fp = -x_fp
-            y_fp = -y_fp
-        angle = Precise("0")
-        for i in range(16):
-            if y_fp < 0:
-                new_x = x_fp - (y_fp >> i)
-                new_y = y_fp + (x_fp >> i)
-                angle = angle - Precise(atan_table[i])
+                x, y = x + (y >> i), y - (x >> i)
+                angle += atan_i
+        # Rotate by remaining angle a with cos(a) = 1 - a^2/2 and sin(a) = a - a^3/6.
+        angle_2 = angle * angle // scale
+        cos = scale - angle_2 // 2
+        sin = angle - angle * angle_2 // (6 * scale)
+        return (x * cos - y * sin) // scale, (y * cos + x * sin) // scale
+
+    @staticmethod
+    def _vector(x: int, y: int, tables: tuple) -> int:
+        """
+        Angle of vector with x > 0 scaled by trigonometric scale.
+        """
+        _, scale, atan_table, _, _ = tables
+        # Angle does not depend on length, short vector is stretched to keep precision.
+        length = x if x > abs(y) else abs(y)
+        if length < scale:
+            factor = 4 * scale // length + 1
+            x *= factor
+            y *= factor
+        angle = 0
+        for i, atan_i in enumerate(atan_table):
+            if y < 0:
+                x, y = x - (y >> i), y + (x >> i)
+                angle -= atan_i
             else:
-                new_x = x_fp + (y_fp >> i)
-                new_y = y_fp - (x_fp >> i)
-                angle = angle + Precise(atan_table[i])
-            x_fp = new_x
-            y_fp = new_y
-        return angle + angle_offset
+                x, y = x + (y >> i), y - (x >> i)
+                angle += atan_i
+        # Remaining angle with atan(t) = t - t^3/3.
+        t = y * scale // x
+        return angle + t - t * (t * t // scale) // (3 * scale)
+
+    @classmethod
+    def _angle(cls, y: int, x: int, tables: tuple) -> int:
+        # atan2 of integers with common scale, result scaled by trigonometric scale.
+        pi = tables[4]
+        if y == 0:
+            return 0 if x >= 0 else pi
+        if x > 0:
+            return cls._vector(x, y, tables)
+        if x < 0:
+            return cls._vector(-x, -y, tables) + (pi if y > 0 else -pi)
+        return pi // 2 if y > 0 else -(pi // 2)
+
+    @classmethod
+    def _sin_cos(cls, angle) -> tuple:
+        angle, places = cls._argument(angle)
+        tables = cls._trig(places)
+        pi = tables[4]
+        angle = (angle * tables[0] + pi) % (2 * pi) - pi
+        sign = 1
+        if angle > pi // 2:
+            angle = pi - angle
+            sign = -1
+        elif angle < -(pi // 2):
+            angle = -pi - angle
+            sign = -1
+        cos, sin = cls._rotate(angle, tables)
+        return sin, sign * cos, places, tables[0]
+
+    @classmethod
+    def _asin_cos(cls, value) -> tuple:
+        # Value and sqrt(1 - value^2) scaled by trigonometric scale.
+        value_fp, places = cls._argument(value)
+        multiplier = cls._SCALES[places]
+        if abs(value_fp) > multiplier:
+            raise ValueError("Math domain error, value must be in [-1, 1]")
+        tables = cls._trig(places)
+        guard = tables[0]
+        return (value_fp * guard, _isqrt((multiplier * multiplier - value_fp * value_fp) * guard * guard),
+                places, tables)
+
+    @classmethod
+    def sin(cls, angle):
+        sin, _, places, guard = cls._sin_cos(angle)
+        return cls._from_trig(sin, places, guard)
+
+    @classmethod
+    def cos(cls, angle):
+        _, cos, places, guard = cls._sin_cos(angle)
+        return cls._from_trig(cos, places, guard)
+
+    @classmethod
+    def tan(cls, angle):
+        sin, cos, places, _ = cls._sin_cos(angle)
+        if cos == 0:
+            raise ZeroDivisionError("Tangent of odd multiple of pi/2")
+        numerator = sin * cls._SCALES[places]
+        if cos < 0:
+            numerator, cos = -numerator, -cos
+        # Rounded quotient.
+        return cls._from_fixed_point((2 * numerator + cos) // (2 * cos), places)
+
+    @classmethod
+    def atan(cls, value):
+        value, places = cls._argument(value)
+        tables = cls._trig(places)
+        return cls._from_trig(cls._vector(cls._SCALES[places], value, tables), places, tables[0])
+
+    @classmethod
+    def atan2(cls, y, x):
+        y, x, places = cls._arguments(y, x)
+        tables = cls._trig(places)
+        return cls._from_trig(cls._angle(y, x, tables), places, tables[0])
+
+    @classmethod
+    def asin(cls, value):
+        sin, cos, places, tables = cls._asin_cos(value)
+        return cls._from_trig(cls._angle(sin, cos, tables), places, tables[0])
+
+    @classmethod
+    def acos(cls, value):
+        cos, sin, places, tables = cls._asin_cos(value)
+        return cls._from_trig(cls._angle(sin, cos, tables), places, tables[0])
+
+    @classmethod
+    def hypot(cls, a, b):
+        """
+        sqrt(a^2 + b^2) computed on exact squares, so small values do not vanish.
+        """
+        a_fp, b_fp, places = cls._arguments(a, b)
+        return cls._from_fixed_point(_isqrt(a_fp * a_fp + b_fp * b_fp), places)
 
     @classmethod
     def sqrt(cls, value):
-        if isinstance(value, str):
-            value = Precise(value)
-        value_fp = value._to_fixed_point(value.value_str) if isinstance(value, Precise) else 0
+        value_fp, places = cls._argument(value)
+        multiplier = cls._SCALES[places]
         if value_fp < 0:
             raise ValueError("Cannot compute square root of negative number")
         if value_fp == 0:
-            return Precise("0")
-        if value_fp == cls.multiplier:  # sqrt(1) = 1
-            return Precise("1")
-        if value_fp >= cls.multiplier:
+            return cls._from_fixed_point(0, places)
+        if value_fp == multiplier:  # sqrt(1) = 1
+            return cls._from_fixed_point(multiplier, places)
+        if value_fp >= multiplier:
             x = value_fp // 2
         else:
             x = value_fp
-        if x < cls.multiplier:
-            x = cls.multiplier
+        if x < multiplier:
+            x = multiplier
         iteration = 0
         max_iterations = 30
         while iteration < max_iterations:
-            quotient = (value_fp * cls.multiplier) // x
+            quotient = (value_fp * multiplier) // x
             x_new = (x + quotient) // 2
             if abs(x_new - x) <= 1:
                 break
             x = x_new
             iteration += 1
-        return Precise(value._to_string(x))
+        return cls._from_fixed_point(x, places)
 
     def __pow__(self, exponent):
         if not isinstance(exponent, int):
             raise TypeError("Exponent must be an integer")
+        one = self._from_fixed_point(self._SCALES[self._places], self._places)
         if exponent == 0:
-            return Precise("1")
+            return one
         if exponent < 0:
-            result = self ** (-exponent)
-            return Precise("1") / result
-        result = Precise("1")
+            return one / (self ** (-exponent))
+        result = one
         base = self
         exp = exponent
         while exp > 0:
@@ -204,64 +414,384 @@ class Precise:
             exp = exp // 2
         return result
 
-    @classmethod
-    def cos(cls, angle):
-        if isinstance(angle, str):
-            angle = Precise(angle)
-        angle_fp = angle._to_fixed_point(angle.value_str) if isinstance(angle, Precise) else 0
-        pi = Precise("3.141592653589793")
-        two_pi = Precise("6.283185307179586")
-        half_pi = Precise("1.5707963267948966")
-        pi_fp = pi._to_fixed_point(pi.value_str)
-        two_pi_fp = two_pi._to_fixed_point(two_pi.value_str)
-        half_pi_fp = half_pi._to_fixed_point(half_pi.value_str)
-        while angle_fp > pi_fp:
-            angle_fp -= two_pi_fp
-        while angle_fp < -pi_fp:
-            angle_fp += two_pi_fp
-        sign = 1
-        if angle_fp < 0:
-            angle_fp = -angle_fp
-        if angle_fp > half_pi_fp:
-            angle_fp = pi_fp - angle_fp
-            sign = -1
-        atan_table = [
-            "0.7853981633974483",
-            "0.4636476090008061",
-            "0.2449786631268641",
-            "0.1243549945467614",
-            "0.0624188099959574",
-            "0.0312398334302683",
-            "0.0156237286204768",
-            "0.0078123410601011",
-            "0.0039062301319670",
-            "0.0019531225164788",
-            "0.0009765621895593",
-            "0.0004882812111948",
-            "0.0002441406201493",
-            "0.0001220703118937",
-            "0.0000610351561742",
-            "0.0000305175781155",
-        ]
-        K_inv_fp = 6072529350
-        x = cls.multiplier
-        y = 0
-        z = angle_fp  # Remaining angle to rotate.
-        for i in range(16):
-            atan_i_fp = Precise(atan_table[i])._to_fixed_point(atan_table[i])
-            if z >= 0:
-                new_x = x - (y >> i)
-                new_y = y + (x >> i)
-                z = z - atan_i_fp
-            else:
-                new_x = x + (y >> i)
-                new_y = y - (x >> i)
-                z = z + atan_i_fp
-            x = new_x
-            y = new_y
-        result = (x * K_inv_fp) // cls.multiplier
-        result = sign * result
-        return Precise(angle._to_string(result))
+
+class PrecisionContext:
+    """
+    Context manager of Precise.context, restores previous decimal places of the thread on exit.
+    """
+
+    __slots__ = ("places", "__previous")
+
+    def __init__(self, places: int) -> None:
+        Precise._check_places(places)
+        self.places = places
+        self.__previous = None
+
+    def __enter__(self) -> "PrecisionContext":
+        context = Precise._context
+        self.__previous = context.places
+        context.places = self.places
+        return self
+
+    def __exit__(self, *args) -> None:
+        Precise._context.places = self.__previous
+
+
+def _arccot(n: int, scale: int) -> int:
+    """
+    atan(1 / n) scaled by scale, summed from Taylor series on integers.
+    """
+    term = scale // n
+    total = term
+    n2 = n * n
+    divisor = 1
+    while term:
+        term //= n2
+        divisor += 2
+        total += -(term // divisor) if divisor & 2 else term // divisor
+    return total
+
+
+def _trig_tables(places: int, guard_digits: int) -> tuple:
+    """
+    Guard multiplier, scale, CORDIC angles atan(2^-i), gain of the iterations and
+    pi of trigonometric engine for the decimal places. Each iteration adds about
+    one bit, the residual angle is finished by cubic polynomial with error below
+    residual^4, so iterations cover a quarter of the bits of the scale.
+    """
+    guard = 10 ** guard_digits
+    scale = 10 ** places * guard
+    iterations = (places + guard_digits) * 5 // 6 + 2
+    extra = 10 ** 6
+    wide = scale * extra
+    # Machin formula pi / 4 = 4 * atan(1/5) - atan(1/239).
+    pi = 4 * (4 * _arccot(5, wide) - _arccot(239, wide))
+    angles = [pi // 4] + [_arccot(1 << i, wide) for i in range(1, iterations)]
+    gain = wide
+    square = wide * wide
+    for i in range(iterations):
+        # Each iteration scales vector by sqrt(1 + 2^-2i).
+        gain = gain * wide // _isqrt(square + (square >> (2 * i)))
+    half = extra // 2
+    return (guard, scale, tuple((angle + half) // extra for angle in angles), (gain + half) // extra,
+            (pi + half) // extra)
+
+
+# Tables of trigonometric engine per decimal places, default precision is built at import.
+_TRIG_TABLES = {}
+Precise._trig(Precise.DECIMAL_PLACES)
+
+
+class Fix:
+    """
+    Immutable snapshot of MicroNMEA attributes taken when an epoch completes.
+    """
+
+    __slots__ = ("time", "date", "lat", "lat_ns", "lon", "lon_ew", "alt", "quality", "mode", "nav_status",
+                 "number_of_satellites_used", "satellites_used", "hdop", "vdop", "pdop", "geoidal_separation",
+                 "speed", "course", "heading", "east_velocity", "north_velocity", "up_velocity", "rtk_age",
+                 "rtk_ratio", "gsv_data")
+
+    def __init__(self, nmea) -> None:
+        set_attribute = object.__setattr__
+        for name in self.__slots__:
+            set_attribute(self, name, getattr(nmea, name))
+        # Mutable attributes of the parser, copied so later sentences do not change the snapshot. Entries
+        # of gsv_data are replaced, not changed, by the parser.
+        set_attribute(self, "satellites_used", dict(nmea.satellites_used))
+        set_attribute(self, "gsv_data", dict(nmea.gsv_data))
+
+    def __setattr__(self, name, value) -> None:
+        raise AttributeError("Fix is immutable")
+
+    def __delattr__(self, name) -> None:
+        raise AttributeError("Fix is immutable")
+
+    def __repr__(self) -> str:
+        return f"Fix(time={self.time}, lat={self.lat}, lon={self.lon}, alt={self.alt}, quality={self.quality})"
+
+
+class _MonotonicQueue:
+    # Ring positions of window values in increasing (minimum) or decreasing (maximum) order,
+    # the front is the extreme of the window.
+    __slots__ = ("positions", "head", "size", "minimum")
+
+    def __init__(self, capacity: int, minimum: bool) -> None:
+        self.positions = array("i", (0,) * capacity)
+        self.head = 0
+        self.size = 0
+        self.minimum = minimum
+
+    def push(self, values: array, position: int) -> None:
+        positions = self.positions
+        capacity = len(positions)
+        value = values[position]
+        size = self.size
+        while size:
+            back = values[positions[(self.head + size - 1) % capacity]]
+            if (back < value) if self.minimum else (back > value):
+                break
+            size -= 1
+        positions[(self.head + size) % capacity] = position
+        self.size = size + 1
+
+    def expire(self, position: int) -> None:
+        if self.size and self.positions[self.head] == position:
+            self.head = (self.head + 1) % len(self.positions)
+            self.size -= 1
+
+    def front(self, values: array) -> float:
+        return values[self.positions[self.head]] if self.size else NAN
+
+
+class _WindowStatistic:
+    # Welford mean and variance of window values updated on add and remove, nan is skipped.
+    __slots__ = ("values", "count", "mean", "m2", "low", "high")
+
+    def __init__(self, values: array) -> None:
+        self.values = values
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.low = _MonotonicQueue(len(values), True)
+        self.high = _MonotonicQueue(len(values), False)
+
+    def add(self, position: int) -> None:
+        value = self.values[position]
+        if value != value:
+            return
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.low.push(self.values, position)
+        self.high.push(self.values, position)
+
+    def remove(self, position: int) -> None:
+        value = self.values[position]
+        if value != value:
+            return
+        self.low.expire(position)
+        self.high.expire(position)
+        self.count -= 1
+        if self.count == 0:
+            self.mean = 0.0
+            self.m2 = 0.0
+            return
+        delta = value - self.mean
+        self.mean -= delta / self.count
+        self.m2 -= delta * (value - self.mean)
+        # Rounding must not make variance negative.
+        if self.m2 < 0.0:
+            self.m2 = 0.0
+
+
+class FixHistory:
+    """
+    The last capacity Fix snapshots in array columns with windowed statistics.
+
+    Append is O(1): columns are rings of array("d") and mean, variance, minimum
+    and maximum of STATISTICS are updated incrementally, so the parser may append
+    every epoch with on_fix=history.append. Missing values are nan and skipped by
+    statistics. Coordinates are decimal degrees (formats 2, 3 and 4), east and
+    north are offsets in meters from the first position for position scatter.
+    """
+
+    COLUMNS = ("time", "lat", "lon", "alt", "hdop", "speed", "east", "north")
+    STATISTICS = ("alt", "hdop", "speed", "east", "north")
+    # Mean radius of the Earth in meters, scatter is small enough for the sphere.
+    EARTH_RADIUS = 6371008.8
+    # CEP of bivariate normal distribution approximated from standard deviations of east and north.
+    CEP_FACTOR = 0.5887
+
+    def __init__(self, capacity: int = 60) -> None:
+        if capacity < 1:
+            raise ValueError(f"Incorrect capacity: {capacity}")
+        self.capacity = capacity
+        self.__columns = {name: array("d", (NAN,) * capacity) for name in self.COLUMNS}
+        self.__statistics = {name: _WindowStatistic(self.__columns[name]) for name in self.STATISTICS}
+        self.__next = 0
+        self.__size = 0
+        self.__origin = None
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def append(self, fix) -> None:
+        """
+        Add Fix (or parser) attributes, the oldest fix is dropped when the history is full.
+        """
+        # Values are converted before the history changes, incorrect time is stored as nan.
+        time = MicroNMEA._to_seconds(fix.time)
+        lat = self._to_degrees(fix.lat)
+        lon = self._to_degrees(fix.lon)
+        position = self.__next
+        statistics = self.__statistics
+        if self.__size == self.capacity:
+            for statistic in statistics.values():
+                statistic.remove(position)
+        else:
+            self.__size += 1
+        columns = self.__columns
+        columns["time"][position] = time
+        columns["lat"][position] = lat
+        columns["lon"][position] = lon
+        columns["alt"][position] = MicroNMEA._to_float(fix.alt)
+        columns["hdop"][position] = MicroNMEA._to_float(fix.hdop)
+        columns["speed"][position] = MicroNMEA._to_float(fix.speed)
+        if self.__origin is None and lat == lat and lon == lon:
+            self.__origin = (lat, lon, math.cos(math.radians(lat)))
+        if self.__origin is None:
+            columns["east"][position] = NAN
+            columns["north"][position] = NAN
+        else:
+            origin_lat, origin_lon, cos_lat = self.__origin
+            columns["east"][position] = math.radians(lon - origin_lon) * self.EARTH_RADIUS * cos_lat
+            columns["north"][position] = math.radians(lat - origin_lat) * self.EARTH_RADIUS
+        for statistic in statistics.values():
+            statistic.add(position)
+        self.__next = (position + 1) % self.capacity
+
+    @staticmethod
+    def _to_degrees(value) -> float:
+        if value is None:
+            return NAN
+        # formats=4, degrees scaled by 10^7.
+        if isinstance(value, int):
+            return value / 10000000
+        return float(value)
+
+    def column(self, name: str) -> array:
+        """
+        Values of the column from the oldest to the latest fix.
+        """
+        column = self.__columns[name]
+        if self.__size < self.capacity:
+            return column[:self.__size]
+        return column[self.__next:] + column[:self.__next]
+
+    def count(self, name: str) -> int:
+        """
+        Number of values of the statistic column in the window, missing values are not counted.
+        """
+        return self.__statistics[name].count
+
+    def mean(self, name: str) -> float:
+        statistic = self.__statistics[name]
+        return statistic.mean if statistic.count else NAN
+
+    def variance(self, name: str) -> float:
+        """
+        Sample variance of the statistic column, nan for less than two values.
+        """
+        statistic = self.__statistics[name]
+        return statistic.m2 / (statistic.count - 1) if statistic.count > 1 else NAN
+
+    def minimum(self, name: str) -> float:
+        statistic = self.__statistics[name]
+        return statistic.low.front(statistic.values)
+
+    def maximum(self, name: str) -> float:
+        statistic = self.__statistics[name]
+        return statistic.high.front(statistic.values)
+
+    def cep(self) -> float:
+        """
+        Circular error probable of positions in the window in meters, radius around
+        the mean position holding half of the positions.
+        """
+        return self.CEP_FACTOR * (math.sqrt(self.variance("east")) + math.sqrt(self.variance("north")))
+
+
+class NMEAError(ValueError):
+    """
+    Sentence decoding error reported by MicroNMEA, raised when the parser is
+    created with errors="raise" and passed to the errors callback.
+    """
+
+    def __init__(self, kind: str, sentence_type: str, message: str) -> None:
+        super().__init__(message)
+        self.kind = kind
+        self.sentence_type = sentence_type
+        self.message = message
+
+    def __reduce__(self):
+        # Pickled with all arguments, e.g. raised in worker process of decode_parallel.
+        return type(self), (self.kind, self.sentence_type, self.message)
+
+
+class ParserStats:
+    """
+    Counters and handler latencies of MicroNMEA, collected when the parser is
+    created with stats=True.
+
+    Counters are dicts keyed by sentence type, filtered counts sentences dropped
+    by sentence types of the parser, incomplete counts sentences without start
+    or checksum and errors other failures of parse. crc_ns and split_ns are
+    total time of checksum validation and field splitting, handler_ns is total
+    time of handlers per sentence type and latency holds histogram of handler
+    time per sentence type with LATENCY_BUCKETS_US upper bounds (last bucket is
+    unbounded).
+    """
+
+    LATENCY_BUCKETS_US = (5, 10, 20, 50, 100, 200, 500, 1000)
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.seen = {}
+        self.parsed = {}
+        self.rejected = {}
+        self.crc_failures = {}
+        self.unsupported = {}
+        self.filtered = {}
+        self.incomplete = 0
+        self.errors = 0
+        self.crc_ns = 0
+        self.split_ns = 0
+        self.handler_ns = {}
+        self.latency = {}
+
+    @staticmethod
+    def count(counter: dict, sentence_type: str) -> None:
+        counter[sentence_type] = counter.get(sentence_type, 0) + 1
+
+    def record_handler(self, sentence_type: str, elapsed_ns: int) -> None:
+        self.handler_ns[sentence_type] = self.handler_ns.get(sentence_type, 0) + elapsed_ns
+        histogram = self.latency.get(sentence_type)
+        if histogram is None:
+            histogram = self.latency[sentence_type] = [0] * (len(self.LATENCY_BUCKETS_US) + 1)
+        elapsed_us = elapsed_ns // 1000
+        bucket = 0
+        for bound in self.LATENCY_BUCKETS_US:
+            if elapsed_us < bound:
+                break
+            bucket += 1
+        histogram[bucket] += 1
+
+    def as_dict(self) -> dict:
+        return {"seen": dict(self.seen), "parsed": dict(self.parsed), "rejected": dict(self.rejected),
+                "crc_failures": dict(self.crc_failures), "unsupported": dict(self.unsupported),
+                "filtered": dict(self.filtered), "incomplete": self.incomplete, "errors": self.errors,
+                "crc_ns": self.crc_ns, "split_ns": self.split_ns, "handler_ns": dict(self.handler_ns),
+                "latency": {sentence_type: list(histogram) for sentence_type, histogram in self.latency.items()},
+                "latency_buckets_us": self.LATENCY_BUCKETS_US}
+
+    def __repr__(self) -> str:
+        return f"ParserStats({self.as_dict()})"
+
+
+class _GSVGroup:
+    # Reassembly state of GSV group of one talker and signal. List of satellite records is
+    # reused by every group of the talker and signal.
+    __slots__ = ("messages", "next_number", "satellites_in_view", "satellites")
+
+    def __init__(self) -> None:
+        self.messages = 0
+        self.next_number = 0
+        self.satellites_in_view = 0
+        self.satellites = []
 
 
 class MicroNMEA:
@@ -336,21 +866,101 @@ class MicroNMEA:
                                                          "4": "L2 P(Y) "}}
     }
 
+    # Flat views of the tables above, looked up once per field while decoding.
+    TALKER_SYSTEMS = {gnss["talker"]: gnss["system"] for gnss in GNSS_IDS.values()}
+    GNSS_SYSTEMS = {gnss_id: gnss["system"] for gnss_id, gnss in GNSS_IDS.items()}
+    INVALID_NAV_STATUS = (NAV_STATUS["V"], NAV_STATUS["U"])
+
     HEMISPHERES = (
         "N", "S", "E", "W"
     )
 
+    # Attributes collected by parse_many() after each decoded sentence of the type.
+    COLUMNS = {
+        "GGA": ("time", "lat", "lon", "alt", "quality", "number_of_satellites_used", "hdop", "geoidal_separation"),
+        "GLL": ("time", "lat", "lon", "mode"),
+        "GSA": ("pdop", "hdop", "vdop"),
+        "RMC": ("time", "date", "lat", "lon", "speed", "course", "mode", "nav_status"),
+        "VTG": ("speed", "course", "mode"),
+        "ZDA": ("time", "date"),
+        "THS": ("heading", "heading_mode"),
+        "STI,005": ("time", "date"),
+        "STI,030": ("time", "date", "lat", "lon", "alt", "east_velocity", "north_velocity", "up_velocity", "mode",
+                    "rtk_age", "rtk_ratio"),
+        "STI,032": ("time", "date", "mode", "east_pob", "north_pob", "up_pob", "baseline_length", "baseline_course"),
+        "STI,035": ("time", "date", "mode", "east_pob", "north_pob", "up_pob", "baseline_length", "baseline_course"),
+    }
+    # Attributes kept as text columns, all others are stored as float.
+    TEXT_COLUMNS = ("date", "mode", "nav_status", "heading_mode")
+    # Index of UTC time field of sentences which carry it.
+    TIME_FIELDS = {
+        "GGA": 1,
+        "GLL": 5,
+        "RMC": 1,
+        "ZDA": 1,
+        "STI,005": 2,
+        "STI,030": 2,
+        "STI,032": 2,
+        "STI,035": 2,
+    }
+    # Attributes decoded anew in each epoch, cleared when a new epoch starts with on_fix. Date, DGPS
+    # and GSV data are kept, receivers send them less often than the fix.
+    EPOCH_ATTRIBUTES = ("time", "lat", "lat_ns", "lon", "lon_ew", "alt", "quality", "mode", "nav_status",
+                        "number_of_satellites_used", "hdop", "vdop", "pdop", "geoidal_separation", "speed", "course",
+                        "heading", "heading_mode", "east_velocity", "north_velocity", "up_velocity", "rtk_age",
+                        "rtk_ratio", "east_pob", "north_pob", "up_pob", "baseline_length", "baseline_course")
+
     SEN_START = "$"
     SEN_SEPARATOR = ","
     SEN_CRC = "*"
+    # Longest partial sentence kept by feed() while waiting for the line end.
+    MAX_SENTENCE_LENGTH = 256
+
+    # Error kinds and their messages.
+    ERROR_MESSAGES = {
+        "incomplete": "Sentence empty or incomplete.",
+        "crc": "Incorrect CRC for {sentence_type}",
+        "unsupported": "Not supported sentence: {sentence_type}",
+        "handler": "ERROR of {sentence_type} sentence. {detail}",
+        "parse": "ERROR of parse. {detail}",
+        "overflow": "Sentence too long, input dropped.",
+    }
+    # Number of the most recent errors kept with errors="ring".
+    ERROR_LOG_SIZE = 32
+    # Shared value of fields attribute when fields are not kept after dispatch.
+    NO_FIELDS = ()
     VALID = "A"
+    # Shortest sentence header, start character, talker and formatter, e.g. "$GPGGA".
+    HEADER_SIZE = 6
     SPEED_KNOTS_2_KMH = 1.852
-
-    def __init__(self, units: int = 1, formats: int = 2, crc: bool = True) -> None:
+    # Fixed set of attributes, state of a parser is a compact slotted object without per instance dict.
+    __slots__ = ("units", "formats", "crc", "on_fix", "stats", "errors", "keep_fields", "sentence_types",
+                 "error_counts", "__error_log", "__error_log_index", "fix", "fields", "time", "lat", "lat_ns", "lon",
+                 "lon_ew", "alt", "quality", "mode", "number_of_satellites_used", "satellites_used", "hdop", "vdop",
+                 "pdop", "dgps_station_id", "dgps_age", "geoidal_separation", "__gsv_groups", "__gsv_cycles",
+                 "gsv_data", "gsv_signals", "speed", "course", "date", "heading", "heading_mode", "east_velocity",
+                 "north_velocity", "up_velocity", "rtk_age", "rtk_ratio", "east_pob", "north_pob", "up_pob",
+                 "baseline_length", "baseline_course", "nav_status", "__rx_buffer", "__handlers", "__epoch_time",
+                 "__epoch_field")
+
+    def __init__(self, units: int = 1, formats: int = 2, crc: bool = True, on_fix=None,
+                 stats: bool = False, errors="print", keep_fields: bool = True, sentence_types=None) -> None:
         self.units = units
         self.formats = formats
         self.crc = crc
-        self.fields = []
+        self.on_fix = on_fix
+        self.stats = ParserStats() if stats else None
+        if not (callable(errors) or errors in ("print", "count", "ring", "raise")):
+            raise ValueError(f"Incorrect errors policy: {errors}")
+        self.errors = errors
+        self.keep_fields = keep_fields
+        self.subscribe(sentence_types)
+        self.error_counts = dict()
+        # Created on the first error with errors="ring".
+        self.__error_log = None
+        self.__error_log_index = 0
+        self.fix = None
+        self.fields = [] if keep_fields else self.NO_FIELDS
         self.time = None
         self.lat = None
         self.lat_ns = None
@@ -367,8 +977,10 @@ class MicroNMEA:
         self.dgps_station_id = None
         self.dgps_age = None
         self.geoidal_separation = None
-        self.__tmp_gsv_part = dict()
+        self.__gsv_groups = dict()
+        self.__gsv_cycles = dict()
         self.gsv_data = dict()
+        self.gsv_signals = dict()
         self.speed = None
         self.course = None
         self.date = None
@@ -385,79 +997,535 @@ class MicroNMEA:
         self.baseline_length = None
         self.baseline_course = None
         self.nav_status = None
+        self.__rx_buffer = bytearray()
+        self.__handlers = self.HANDLERS
+        self.__epoch_time = None
+        self.__epoch_field = None
+
+    def feed(self, data) -> int:
+        """
+        Parse raw chunk of bytes read from UART or socket.
+
+        Chunk may hold any number of sentences and sentences may be split between
+        chunks. Incomplete sentence is kept in the internal buffer until its line
+        end arrives. Returns number of complete sentences dispatched to parse.
+        """
+        buffer = self.__rx_buffer
+        buffer.extend(data)
+        count = 0
+        position = 0
+        while True:
+            start = buffer.find(b"$", position)
+            if start < 0:
+                # Only noise left.
+                position = len(buffer)
+                break
+            end = buffer.find(b"\n", start)
+            if end < 0:
+                # Sentence not complete yet.
+                position = start
+                break
+            # Sentence cut by noise, start from the last sentence start before line end.
+            start = buffer.rfind(b"$", start, end)
+            stop = end - 1 if buffer[end - 1] == 13 else end
+            position = end + 1
+            try:
+                self.__parse_buffer(buffer, start, stop)
+            except Exception:
+                # Raised by errors="raise" or on_fix, sentence is consumed anyway.
+                del buffer[:position]
+                raise
+            count += 1
+        if position:
+            del buffer[:position]
+        if len(buffer) > self.MAX_SENTENCE_LENGTH:
+            del buffer[:]
+            self.report_error("overflow")
+        return count
+
+    def report_error(self, kind: str, sentence_type: str = None, detail=None) -> None:
+        """
+        Report decoding error according to errors policy of the instance.
+
+        Policies: "print" - print message (default), "count" - only count errors
+        in error_counts, "ring" - keep ERROR_LOG_SIZE most recent errors (see
+        recent_errors), "raise" - raise NMEAError, callable - call it with
+        NMEAError. Errors are counted in error_counts by kind in every policy.
+        Message is built only when the policy needs it.
+        """
+        self.error_counts[kind] = self.error_counts.get(kind, 0) + 1
+        errors = self.errors
+        if errors == "count":
+            return
+        message = self.ERROR_MESSAGES.get(kind, "{detail}").format(sentence_type=sentence_type, detail=detail)
+        if errors == "print":
+            print(message)
+            return
+        error = NMEAError(kind, sentence_type, message)
+        if errors == "ring":
+            if self.__error_log is None:
+                self.__error_log = []
+            if len(self.__error_log) < self.ERROR_LOG_SIZE:
+                self.__error_log.append(error)
+            else:
+                self.__error_log[self.__error_log_index] = error
+            self.__error_log_index = (self.__error_log_index + 1) % self.ERROR_LOG_SIZE
+        elif errors == "raise":
+            raise error
+        else:
+            errors(error)
+
+    def recent_errors(self) -> list:
+        """
+        Errors kept with errors="ring", the oldest first.
+        """
+        log = self.__error_log or []
+        if len(log) < self.ERROR_LOG_SIZE:
+            return list(log)
+        return log[self.__error_log_index:] + log[:self.__error_log_index]
 
-    def parse(self, raw_sentence: str) -> None:
+    def parse(self, raw_sentence: str):
+        """
+        Parse single NMEA sentence.
+
+        Returns sentence type (e.g. "GGA" or "STI,030") when the sentence was
+        decoded, otherwise None.
+        """
+        return self.__parse(raw_sentence, True)
+
+    def parse_bytes(self, raw_sentence):
+        """
+        Parse single NMEA sentence given as bytes, bytearray or memoryview.
+
+        Checksum is validated on the bytes, sentence is decoded to str only when
+        it is correct.
+        """
+        if isinstance(raw_sentence, memoryview):
+            raw_sentence = bytes(raw_sentence)
+        return self.__parse_buffer(raw_sentence, 0, len(raw_sentence))
+
+    def __parse_buffer(self, buffer, start: int, stop: int):
+        # Memoryview slices are temporary, buffer must stay resizable when an error is raised.
+        # Unwanted sentence is dropped by its header, before the checksum and decoding.
+        if self.sentence_types is not None and stop - start > 6 and buffer[start] == 0x24:
+            header = str(buffer[start:min(stop, start + 12)], "ascii", "replace")
+            if self.__filtered(self.get_sentence_type(header)):
+                return None
+        if self.crc:
+            stats = self.stats
+            if stats is not None:
+                crc_start = _clock_ns()
+            crc_position = buffer.find(b"*", start, stop)
+            valid = (crc_position < 0 or
+                     self.crc_check(memoryview(buffer)[start:crc_position], buffer[crc_position + 1:stop]))
+            if stats is not None:
+                stats.crc_ns += _clock_ns() - crc_start
+            if not valid:
+                sentence_type = self.get_sentence_type(str(buffer[start:min(stop, start + 12)], "ascii", "replace"))
+                if stats is not None:
+                    stats.count(stats.seen, sentence_type)
+                    stats.count(stats.crc_failures, sentence_type)
+                self.report_error("crc", sentence_type)
+                return None
+        return self.__parse(str(memoryview(buffer)[start:stop], "ascii", "replace"), False)
+
+    def __filtered(self, sentence_type: str) -> bool:
+        sentence_types = self.sentence_types
+        if sentence_type in sentence_types or sentence_type[:3] in sentence_types:
+            return False
+        stats = self.stats
+        if stats is not None:
+            stats.count(stats.filtered, sentence_type)
+        return True
+
+    def __parse(self, raw_sentence: str, crc: bool):
+        stats = self.stats
+        fix = None
         try:
-            if raw_sentence == "" or raw_sentence[0] != self.SEN_START or self.SEN_CRC not in raw_sentence:
-                print("Sentence empty or incomplete.")
-                return
-            # STI messages key differs from other sentences. They have shorter sentence prefix and additional ID field.
-            sentence_type = raw_sentence[2:5] if "STI" in raw_sentence else raw_sentence[3:6]
-            sentence, expected_crc = raw_sentence.split(self.SEN_CRC)
-            if self.crc_check(sentence, expected_crc):
-                __call = getattr(self, sentence_type.lower(), None)
+            if len(raw_sentence) < self.HEADER_SIZE or raw_sentence[0] != self.SEN_START:
+                if stats is not None:
+                    stats.incomplete += 1
+                self.report_error("incomplete")
+                return None
+            sentence_type = self.get_sentence_type(raw_sentence)
+            # Unwanted sentence is dropped by its header, before the checksum is searched.
+            if self.sentence_types is not None and self.__filtered(sentence_type):
+                return None
+            # One search of the checksum separator, sentence is split only once into fields.
+            crc_position = raw_sentence.find(self.SEN_CRC)
+            if crc_position < 0:
+                if stats is not None:
+                    stats.incomplete += 1
+                self.report_error("incomplete")
+                return None
+            if stats is not None:
+                stats.count(stats.seen, sentence_type)
+                start = _clock_ns()
+            sentence = raw_sentence[:crc_position]
+            valid = not crc or self.crc_check(sentence, raw_sentence[crc_position + 1:])
+            if stats is not None:
+                stats.crc_ns += _clock_ns() - start
+            if valid:
+                handlers = self.__handlers
+                # Sub ID specific handler first, e.g. "STI,030", then generic one, e.g. "STI".
+                handler = handlers.get(sentence_type) or handlers.get(sentence_type[:3])
+                if stats is not None:
+                    start = _clock_ns()
                 self.fields = sentence.split(self.SEN_SEPARATOR)
-                if __call:
+                if stats is not None:
+                    stats.split_ns += _clock_ns() - start
+                if handler:
+                    if self.on_fix is not None:
+                        fix = self.__check_epoch(sentence_type)
                     try:
-                        __call()
+                        if stats is None:
+                            handler(self)
+                        else:
+                            start = _clock_ns()
+                            handler(self)
+                            stats.record_handler(sentence_type, _clock_ns() - start)
+                            stats.count(stats.parsed, sentence_type)
+                        return sentence_type
+                    except NMEAError:
+                        raise
                     except Exception as e:
-                        print(f"ERROR of {sentence_type} sentence. {e}")
+                        if stats is not None:
+                            stats.count(stats.rejected, sentence_type)
+                        self.report_error("handler", sentence_type, e)
+                    finally:
+                        if not self.keep_fields:
+                            self.fields = self.NO_FIELDS
                 else:
-                    print(f"Not supported sentence: {sentence_type}")
+                    if not self.keep_fields:
+                        self.fields = self.NO_FIELDS
+                    if stats is not None:
+                        stats.count(stats.unsupported, sentence_type)
+                    self.report_error("unsupported", sentence_type)
             else:
-                print(f"Incorrect CRC for {sentence_type}")
+                if stats is not None:
+                    stats.count(stats.crc_failures, sentence_type)
+                self.report_error("crc", sentence_type)
+        except NMEAError:
+            raise
         except Exception as e:
-            print(f"ERROR of parse. {e}")
+            if stats is not None:
+                stats.errors += 1
+            self.report_error("parse", None, e)
+        finally:
+            # Outside of the decoding, exception of the consumer (e.g. queue.Full) is not reported as
+            # parse error and the sentence completing the epoch is decoded before.
+            if fix is not None:
+                self.on_fix(fix)
+        return None
+
+    def __check_epoch(self, sentence_type: str):
+        # Snapshot of the epoch completed by the sentence, taken before the sentence is decoded.
+        time_field = self.TIME_FIELDS.get(sentence_type)
+        if time_field is None or time_field >= len(self.fields) or not self.fields[time_field]:
+            return None
+        field = self.fields[time_field]
+        # Compared as number, sentences of one epoch may have different number of decimal places.
+        # Incorrect time is left to the handler, so on_fix does not change decoding of the sentence.
+        try:
+            epoch_time = float(field)
+        except ValueError:
+            return None
+        if epoch_time == self.__epoch_time:
+            return None
+        fix = None
+        if self.__epoch_time is not None:
+            fix = self.__epoch_fix()
+        self.__epoch_time = epoch_time
+        self.__epoch_field = field
+        # Values of the previous epoch are not carried to the new one.
+        for name in self.EPOCH_ATTRIBUTES:
+            setattr(self, name, None)
+        self.satellites_used = dict()
+        return fix
+
+    def __epoch_fix(self) -> Fix:
+        # Time of the snapshot is the time of the epoch, also when no sentence of the epoch set it.
+        self.get_time(self.__epoch_field)
+        self.fix = Fix(self)
+        return self.fix
+
+    def flush(self):
+        """
+        Complete current epoch. Fix snapshot is stored in fix attribute and passed
+        to on_fix callback (e.g. queue.put). Epoch completes automatically when a
+        sentence with different UTC time arrives, flush is needed only at the end
+        of the stream. Returns the snapshot or None when there is no open epoch.
+        """
+        if self.__epoch_time is None:
+            return None
+        self.__epoch_time = None
+        self.__epoch_fix()
+        if self.on_fix is not None:
+            self.on_fix(self.fix)
+        return self.fix
+
+    @staticmethod
+    def get_sentence_type(raw_sentence: str) -> str:
+        """
+        Get dispatch key of the sentence without splitting it.
+
+        Standard sentences are keyed by sentence formatter, e.g. "GGA". Proprietary
+        sentences have no talker, they are keyed by manufacturer and sentence ID
+        field, e.g. "STI,030". Sentence shorter than the header has empty type.
+        """
+        if raw_sentence[1:2] == "P":
+            sub_id_end = raw_sentence.find(",", 6)
+            return raw_sentence[2:sub_id_end] if sub_id_end > 0 else raw_sentence[2:5]
+        return raw_sentence[3:6]
 
-    def crc_check(self, message: str, expected_crc: str) -> bool:
+    def subscribe(self, sentence_types) -> None:
+        """
+        Decode only given sentence types, e.g. ("GGA", "STI,030"), None decodes all.
+
+        Generic type, e.g. "STI", subscribes all its sub IDs. Other sentences are
+        dropped by their header before checksum validation and splitting, without
+        error, and counted in filtered of stats. Single type may be given as str.
+        """
+        if isinstance(sentence_types, str):
+            sentence_types = (sentence_types,)
+        self.sentence_types = None if sentence_types is None else set(sentence_types)
+
+    def register_handler(self, sentence_type: str, handler) -> None:
+        """
+        Register handler of sentence type for this instance, e.g. "XYZ" or "STI,033".
+
+        Handler is called with MicroNMEA instance as the only argument, sentence
+        fields are available in its fields attribute. Class handlers are copied on
+        first registration, other instances are not affected. Parser state is slotted,
+        decoded values of new sentence types are kept by the handler or a subclass.
+        """
+        if self.__handlers is self.HANDLERS:
+            self.__handlers = dict(self.HANDLERS)
+        self.__handlers[sentence_type] = handler
+
+    def parse_many(self, sentences, numpy: bool = False) -> dict:
+        """
+        Parse iterable of sentences (str or bytes-like, line ends allowed) into
+        columns per sentence type.
+
+        Columns are attributes listed in COLUMNS taken right after each decoded
+        sentence, e.g. {"GGA": {"time": array("d", ...), "lat": array("d", ...), ...}}.
+        Numeric columns are array("d") with nan for missing values, time is in
+        seconds of day and quality is index of QUALITY. Text columns are lists.
+        With numpy=True numeric columns are returned as NumPy arrays. Column
+        attributes are cleared before each sentence, so a row has only values of
+        its own sentence, e.g. nan position of GGA without fix.
+        """
+        results = {}
+        collectors = {}
+        columns = self.COLUMNS
+        for sentence in sentences:
+            text = isinstance(sentence, str)
+            if text:
+                sentence = sentence.rstrip()
+                header = sentence[:12]
+            else:
+                sentence = bytes(sentence).rstrip()
+                header = str(sentence[:12], "ascii", "replace")
+            # Only columns of the sentence type are cleared, other sentences produce no row.
+            names = columns.get(self.get_sentence_type(header))
+            if names is not None:
+                for attribute in names:
+                    setattr(self, attribute, None)
+            sentence_type = self.parse(sentence) if text else self.parse_bytes(sentence)
+            if sentence_type is None:
+                continue
+            collector = collectors.get(sentence_type)
+            if collector is None:
+                if sentence_type not in self.COLUMNS:
+                    continue
+                collector = collectors[sentence_type] = self.__columns_collector(
+                    results.setdefault(sentence_type, {}), self.COLUMNS[sentence_type])
+            for attribute, append, convert in collector:
+                append(convert(getattr(self, attribute)))
+        if numpy:
+            self.columns_to_numpy(results)
+        return results
+
+    @staticmethod
+    def columns_to_numpy(results: dict) -> dict:
+        """
+        Replace numeric columns of parse_many results with NumPy arrays sharing
+        the same memory.
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError("NumPy is required for numpy=True.")
+        for columns in results.values():
+            for name, column in columns.items():
+                if isinstance(column, array):
+                    columns[name] = np.frombuffer(column, dtype=np.float64)
+        return results
+
+    def parse_file(self, path: str, numpy: bool = False) -> dict:
+        """
+        Parse NMEA log file into columns per sentence type, see parse_many.
+        """
+        with open(path, "rb") as file:
+            return self.parse_many(file, numpy)
+
+    def __columns_collector(self, columns: dict, attributes: tuple) -> tuple:
+        collector = []
+        for attribute in attributes:
+            if attribute in self.TEXT_COLUMNS:
+                column = columns[attribute] = []
+                convert = self._to_text
+            else:
+                column = columns[attribute] = array("d")
+                convert = {"time": self._to_seconds, "quality": self._to_quality_index}.get(attribute, self._to_float)
+            collector.append((attribute, column.append, convert))
+        return tuple(collector)
+
+    @staticmethod
+    def _to_text(value):
+        return value
+
+    @staticmethod
+    def _to_float(value) -> float:
+        return NAN if value is None else float(value)
+
+    @staticmethod
+    def _to_seconds(value) -> float:
+        if value is None:
+            return NAN
+        # Both raw hhmmss.sss and hh:mm:ss.sss are handled, incorrect time (e.g. "2152") is nan.
+        value = value.replace(":", "")
+        try:
+            return int(value[:2]) * 3600 + int(value[2:4]) * 60 + float(value[4:])
+        except ValueError:
+            return NAN
+
+    def _to_quality_index(self, value) -> float:
+        return NAN if value is None else float(self.QUALITY.index(value))
+
+    def crc_check(self, message, expected_crc) -> bool:
+        """
+        Compare checksum of the message (sentence without "*hh" suffix) with the
+        expected hex value. Both may be str or bytes-like objects.
+        """
         # Skip CRC check.
         if not self.crc:
             return True
 
-        crc = 0
-        for __char in message[1:]:
-            crc ^= ord(__char)
-        return f"0x{crc:02x}".lower()[2:] == expected_crc.lower()
+        try:
+            if not isinstance(expected_crc, (str, bytes)):
+                expected_crc = bytes(expected_crc)
+            return self.checksum(message) == int(expected_crc, 16)
+        except ValueError:
+            return False
+
+    def crc_check_many(self, sentences) -> list:
+        """
+        Validate checksums of many full sentences at once, e.g. "$GNTHS,121.15,A*1F".
+
+        Sentences may be str or bytes-like objects. Returns list of results in
+        the input order.
+        """
+        results = []
+        append = results.append
+        checksum = self.checksum
+        for sentence in sentences:
+            if not self.crc:
+                append(True)
+                continue
+            if isinstance(sentence, memoryview):
+                sentence = bytes(sentence)
+            crc_position = sentence.rfind(self.SEN_CRC if isinstance(sentence, str) else b"*")
+            try:
+                append(crc_position > 0 and
+                       checksum(sentence[:crc_position]) == int(sentence[crc_position + 1:crc_position + 3], 16))
+            except ValueError:
+                append(False)
+        return results
+
+    @staticmethod
+    def checksum(message) -> int:
+        """
+        XOR of all characters between sentence start and "*".
+
+        Message must begin with sentence start character. It is XOR-ed twice so it
+        cancels out and the message does not have to be sliced.
+        """
+        if isinstance(message, str):
+            message = message.encode()
+        crc = message[0]
+        for byte in message:
+            crc ^= byte
+        return crc
 
     def get_lat(self, lat: str, lns: str) -> None:
         if lat and lns and lns in self.HEMISPHERES:
             # Raw
             if self.formats == 1:
                 self.lat = lat
-                self.lat_ns = lns
             # dd
             elif self.formats == 2:
-                la_deg = lat[:2]
-                la_minutes = lat[2:]
-                decimal_degrees = Precise(la_deg) + (Precise(la_minutes) / "60")
-                self.lat = f"{'-' if lns.lower() == 's' else ''}{decimal_degrees}"
-                self.lat_ns = lns
+                decimal_degrees = Precise.from_degrees_minutes(lat[:2], lat[2:])
+                self.lat = f"{'-' if lns == 'S' else ''}{decimal_degrees}"
+            # dd float
+            elif self.formats == 3:
+                # Converted once without slicing, ddmm.mmmm is split to degrees and minutes as float.
+                value = float(lat)
+                degrees = value // 100
+                decimal_degrees = degrees + (value - degrees * 100) / 60
+                self.lat = -decimal_degrees if lns == "S" else decimal_degrees
+            # dd scaled by 10^7
+            elif self.formats == 4:
+                decimal_degrees = self._to_e7(lat[:2], lat[2:])
+                self.lat = -decimal_degrees if lns == "S" else decimal_degrees
+            self.lat_ns = lns
 
     def get_lon(self, lon: str, lew: str) -> None:
         if lon and lew and lew in self.HEMISPHERES:
             # Raw
             if self.formats == 1:
                 self.lon = lon
-                self.lon_ew = lew
             # dd
             elif self.formats == 2:
-                lo_deg = lon[:3]
-                lo_minutes = lon[3:]
-                decimal_degrees = Precise(lo_deg) + (Precise(lo_minutes) / "60")
-                self.lon = f"{'-' if lew.lower() == 's' else ''}{decimal_degrees}"
-                self.lon_ew = lew
+                decimal_degrees = Precise.from_degrees_minutes(lon[:3], lon[3:])
+                self.lon = f"{'-' if lew == 'W' else ''}{decimal_degrees}"
+            # dd float
+            elif self.formats == 3:
+                value = float(lon)
+                degrees = value // 100
+                decimal_degrees = degrees + (value - degrees * 100) / 60
+                self.lon = -decimal_degrees if lew == "W" else decimal_degrees
+            # dd scaled by 10^7
+            elif self.formats == 4:
+                decimal_degrees = self._to_e7(lon[:3], lon[3:])
+                self.lon = -decimal_degrees if lew == "W" else decimal_degrees
+            self.lon_ew = lew
+
+    @staticmethod
+    def _to_e7(degrees: str, minutes: str) -> int:
+        # Integer only, minutes are taken with 7 decimal places and degrees rounded to the nearest 1e-7.
+        whole_part, _, decimal_part = minutes.partition(".")
+        decimal_part = decimal_part[:7]
+        minutes_e7 = int(whole_part) * 10000000 + (int(decimal_part) * 10 ** (7 - len(decimal_part))
+                                                   if decimal_part else 0)
+        return int(degrees) * 10000000 + (minutes_e7 + 30) // 60
 
     def get_quality(self, field: str) -> None:
-        if field and int(field) in range(len(self.QUALITY)):
-            self.quality = self.QUALITY[int(field)]
+        if field:
+            quality = int(field)
+            if 0 <= quality < len(self.QUALITY):
+                self.quality = self.QUALITY[quality]
 
     def get_satellites_used(self, field: str) -> None:
         if field:
             self.number_of_satellites_used = int(field)
 
     def get_satellites_used_list(self, gnss_id: str, satellites: list) -> None:
-        if gnss_id and int(gnss_id) in self.GNSS_IDS and satellites:
-            self.satellites_used[self.GNSS_IDS[int(gnss_id)]["system"]] = satellites
+        if gnss_id and satellites:
+            system = self.GNSS_SYSTEMS.get(int(gnss_id))
+            if system is not None:
+                self.satellites_used[system] = satellites
 
     def get_pdop(self, field: str) -> None:
         if field and 0 < float(field) < 100:
@@ -524,12 +1592,14 @@ class MicroNMEA:
             return int(field)
 
     def get_mode(self, field: str) -> None:
-        if field and field in self.MODES:
-            self.mode = self.MODES.get(field)
+        mode = self.MODES.get(field)
+        if mode is not None:
+            self.mode = mode
 
     def get_heading_mode(self, field: str) -> None:
-        if field and field in self.MODES:
-            self.heading_mode = self.MODES.get(field)
+        mode = self.MODES.get(field)
+        if mode is not None:
+            self.heading_mode = mode
 
     def get_speed(self, field: str) -> None:
         if field:
@@ -588,165 +1658,293 @@ class MicroNMEA:
             self.baseline_course = float(field)
 
     def get_nav_status(self, field) -> None:
-        if field and field in self.NAV_STATUS:
-            self.nav_status = self.NAV_STATUS.get(field)
-
-    def gga(self) -> None:
-        """
-         Global positioning system fix data.
-        """
-        self.get_quality(self.fields[6])
-        if self.quality != self.QUALITY[0]:
-            self.get_time(self.fields[1])
-            self.get_lat(self.fields[2], self.fields[3])
-            self.get_lon(self.fields[4], self.fields[5])
-            self.get_satellites_used(self.fields[7])
-            self.get_hdop(self.fields[8])
-            self.get_alt(self.fields[9])
-            self.get_geoidal_separation(self.fields[11])
-            self.get_dgps_age(self.fields[13])
-            self.get_dgps_station_id(self.fields[14])
-
-    def gll(self) -> None:
-        """
-         Geographic position latitude and longitude.
-        """
-        self.get_mode(self.fields[7])
-        if (self.fields[6] == self.VALID
-                and self.fields[7] != self.MODES["N"]):
-            self.get_lat(self.fields[1], self.fields[2])
-            self.get_lon(self.fields[3], self.fields[4])
-            self.get_time(self.fields[5])
+        nav_status = self.NAV_STATUS.get(field)
+        if nav_status is not None:
+            self.nav_status = nav_status
 
-    def gsa(self) -> None:
+    def sti(self) -> None:
         """
-         GNSS DOP and active satellites.
+        STI 005 Time Stamp Output
+        STI 030 Recommended Minimum 3D GNSS Data
+        STI 032 RTK Baseline Data
+        STI 035 RTK Baseline Data of Rover Moving Base Receiver
+        Kept for callers of the former handler, the sentence is decoded by handler of its
+        proprietary sentence type, e.g. sti_030.
         """
-        self.get_satellites_used_list(self.fields[18], self.fields[3:15])
-        self.get_pdop(self.fields[15])
-        self.get_hdop(self.fields[16])
-        self.get_vdop(self.fields[17])
+        if len(self.fields) > 1:
+            handler = self.__handlers.get("STI," + self.fields[1])
+            if handler is not None:
+                handler(self)
+
+    # Source of get_* helpers inlined into compiled handlers, value is the field of
+    # the step. Helper overridden by a subclass is called instead.
+    INLINE_HELPERS = {
+        get_quality: ("if value:\n"
+                      "    value = int(value)\n"
+                      "    if 0 <= value < len(nmea.QUALITY):\n"
+                      "        nmea.quality = nmea.QUALITY[value]"),
+        get_satellites_used: "if value:\n    nmea.number_of_satellites_used = int(value)",
+        get_pdop: "if value:\n    value = float(value)\n    if 0 < value < 100:\n        nmea.pdop = value",
+        get_hdop: "if value:\n    value = float(value)\n    if 0 < value < 100:\n        nmea.hdop = value",
+        get_vdop: "if value:\n    value = float(value)\n    if 0 < value < 100:\n        nmea.vdop = value",
+        get_alt: "if value:\n    nmea.alt = float(value)",
+        get_dgps_station_id: "if value:\n    nmea.dgps_station_id = int(value)",
+        get_dgps_age: "if value:\n    nmea.dgps_age = value",
+        get_geoidal_separation: "if value:\n    nmea.geoidal_separation = float(value)",
+        get_time: ("if value:\n"
+                   "    if nmea.units == 1:\n"
+                   "        nmea.time = value\n"
+                   "    elif nmea.units == 2:\n"
+                   "        nmea.time = f\"{value[:2]}:{value[2:4]}:{value[4:]}\""),
+        get_mode: "value = nmea.MODES.get(value)\nif value is not None:\n    nmea.mode = value",
+        get_heading_mode: "value = nmea.MODES.get(value)\nif value is not None:\n    nmea.heading_mode = value",
+        get_nav_status: "value = nmea.NAV_STATUS.get(value)\nif value is not None:\n    nmea.nav_status = value",
+        get_course: "if value:\n    nmea.course = float(value)",
+        get_heading: "if value:\n    nmea.heading = float(value)",
+        get_east_velocity: "if value:\n    nmea.east_velocity = float(value)",
+        get_north_velocity: "if value:\n    nmea.north_velocity = float(value)",
+        get_up_velocity: "if value:\n    nmea.up_velocity = float(value)",
+        get_rtk_age: "if value:\n    nmea.rtk_age = float(value)",
+        get_rtk_ratio: "if value:\n    nmea.rtk_ratio = float(value)",
+        get_east_pob: "if value:\n    nmea.east_pob = float(value)",
+        get_north_pob: "if value:\n    nmea.north_pob = float(value)",
+        get_up_pob: "if value:\n    nmea.up_pob = float(value)",
+        get_baseline_length: "if value:\n    nmea.baseline_length = float(value)",
+        get_baseline_course: "if value:\n    nmea.baseline_course = float(value)",
+    }
 
     def gsv(self) -> None:
         """
         GNSS satellites in view.
 
-        GSV sentence may be part of bigger message. This means all sentences of the
-        message must be read to get correct content. Correct satellites data are in
-        gsv_data attribute.
+        GSV sentence may be part of bigger message. Sentences of the group are
+        reassembled per talker and signal ID, group with missing or out of order
+        sentence is dropped. Completed group is published as new snapshot, never
+        modified later, in gsv_signals by (talker, signal ID). gsv_data keeps new
+        snapshot per talker merged from the last groups of all its signals, with
+        the largest number in view of the signals. Cycle of the talker ends when
+        group of a signal repeats, signal not seen in the ended cycle is dropped.
         """
+        fields = self.fields
         # Check GNSS is supported.
-        talker = self.fields[0][1:3]
+        talker = fields[0][1:3]
 
-        if not any(talker in x["talker"] for x in self.GNSS_IDS.values()):
+        if talker not in self.TALKER_SYSTEMS:
             # Talker incorrect or not supported.
             return
 
-        if self.fields[1] and self.fields[2]:
-            number_of_messages = int(self.fields[1])
-            sentence_number = int(self.fields[2])
-            if self.fields[3]:
-                if talker not in self.__tmp_gsv_part:
-                    self.__tmp_gsv_part[talker] = {"satellites_in_view": 0, "satellites": dict()}
-                self.__tmp_gsv_part[talker]["satellites_in_view"] = int(self.fields[3])
-                if len(self.fields) <= 5:
-                    # Nothing else to update.
-                    return
-                else:
-                    for offset in range(4, len(self.fields[4:]), 4):
-                        satellite_id, elev, azim, snr = self.fields[offset:offset+4]
-                        if satellite_id:
-                            __sats = {int(satellite_id): [int(elev) if elev else "NA",
-                                                          int(azim) if azim else "NA",
-                                                          int(snr) if snr else "NA"]}
-                            self.__tmp_gsv_part[talker]["satellites"].update(__sats)
-            if (sentence_number == number_of_messages and
-                    len(self.__tmp_gsv_part[talker]["satellites"]) ==
-                    self.__tmp_gsv_part[talker]["satellites_in_view"]):
-                self.gsv_data = self.__tmp_gsv_part
+        if not (fields[1] and fields[2]):
+            return
+        number_of_messages = int(fields[1])
+        sentence_number = int(fields[2])
+        length = len(fields)
+        # NMEA 4.10 signal ID follows the satellites.
+        signal_id = fields[length - 1] if (length - 4) % 4 == 1 else ""
+        key = (talker, signal_id)
+        group = self.__gsv_groups.get(key)
+        if sentence_number == 1:
+            if group is None:
+                group = self.__gsv_groups[key] = _GSVGroup()
+            group.messages = number_of_messages
+            group.satellites_in_view = int(fields[3]) if fields[3] else 0
+            group.satellites.clear()
+        elif group is None or group.next_number != sentence_number or group.messages != number_of_messages:
+            # Gap in the group, wait for the next one.
+            if group is not None:
+                group.next_number = 0
+            return
+        satellites = group.satellites
+        append = satellites.append
+        for offset in range(4, length - 3, 4):
+            satellite_id = fields[offset]
+            if satellite_id:
+                elev = fields[offset + 1]
+                azim = fields[offset + 2]
+                snr = fields[offset + 3]
+                append((int(satellite_id), (int(elev) if elev else "NA", int(azim) if azim else "NA",
+                                            int(snr) if snr else "NA")))
+        if sentence_number < number_of_messages:
+            group.next_number = sentence_number + 1
+            return
+        group.next_number = 0
+        gsv_signals = self.gsv_signals
+        cycle = self.__gsv_cycles.get(talker)
+        if cycle is None:
+            cycle = self.__gsv_cycles[talker] = set()
+        elif signal_id in cycle:
+            # Receiver stopped sending the signals missing in the cycle.
+            for stopped in [signal for signal in gsv_signals if signal[0] == talker and signal[1] not in cycle]:
+                del gsv_signals[stopped]
+            cycle.clear()
+        cycle.add(signal_id)
+        gsv_signals[key] = {"satellites_in_view": group.satellites_in_view, "satellites": dict(satellites)}
+        merged = {}
+        satellites_in_view = 0
+        for (signal_talker, _), snapshot in gsv_signals.items():
+            if signal_talker == talker:
+                merged.update(snapshot["satellites"])
+                satellites_in_view = max(satellites_in_view, snapshot["satellites_in_view"])
+        self.gsv_data[talker] = {"satellites_in_view": satellites_in_view, "satellites": merged}
+
+    # Declarative schema of sentences decoded by get_* helpers, see compile_schema.
+    # (steps, guard, guarded steps), step is (helper, field index, ...), guard item is
+    # (field index or attribute, values, True if required or False if rejected).
+    SCHEMAS = {
+        # Global positioning system fix data.
+        "GGA": ((("get_quality", 6),),
+                (("quality", (QUALITY[0],), False),),
+                (("get_time", 1), ("get_lat", 2, 3), ("get_lon", 4, 5), ("get_satellites_used", 7),
+                 ("get_hdop", 8), ("get_alt", 9), ("get_geoidal_separation", 11), ("get_dgps_age", 13),
+                 ("get_dgps_station_id", 14))),
+        # Geographic position latitude and longitude.
+        "GLL": ((("get_mode", 7),),
+                ((6, (VALID,), True), (7, ("N", "V"), False)),
+                (("get_lat", 1, 2), ("get_lon", 3, 4), ("get_time", 5))),
+        # GNSS DOP and active satellites.
+        "GSA": ((("get_satellites_used_list", 18, slice(3, 15)), ("get_pdop", 15), ("get_hdop", 16),
+                 ("get_vdop", 17)),
+                (),
+                ()),
+        # Recommended minimum specific GNSS data.
+        "RMC": ((("get_mode", 12), ("get_nav_status", 13)),
+                ((2, (VALID,), True), ("nav_status", INVALID_NAV_STATUS, False), ("mode", (MODES["N"],), False)),
+                (("get_time", 1), ("get_lat", 3, 4), ("get_lon", 5, 6), ("get_speed", 7), ("get_course", 8),
+                 ("get_date", 9))),
+        # Course over ground and ground speed.
+        "VTG": ((("get_mode", 9),),
+                ((9, ("N",), False),),
+                (("get_speed", 1), ("get_course", 5))),
+        # Time and date.
+        "ZDA": ((("get_time", 1), ("get_date_2", 2, 3, 4)),
+                (),
+                ()),
+        # True heading and status.
+        "THS": ((("get_heading_mode", 2),),
+                ((2, ("V",), False),),
+                (("get_heading", 1),)),
+        # STI 005 Time Stamp Output.
+        "STI,005": ((("get_time", 2), ("get_date_2", 3, 4, 5)),
+                    (),
+                    ()),
+        # STI 030 Recommended Minimum 3D GNSS Data.
+        "STI,030": ((),
+                    ((3, (VALID,), True),),
+                    (("get_time", 2), ("get_lat", 4, 5), ("get_lon", 6, 7), ("get_alt", 8),
+                     ("get_east_velocity", 9), ("get_north_velocity", 10), ("get_up_velocity", 11),
+                     ("get_date", 12), ("get_mode", 13), ("get_rtk_age", 14), ("get_rtk_ratio", 15))),
+        # STI 032 RTK Baseline Data.
+        "STI,032": ((),
+                    ((4, (VALID,), True),),
+                    (("get_time", 2), ("get_date", 3), ("get_mode", 5), ("get_east_pob", 6),
+                     ("get_north_pob", 7), ("get_up_pob", 8), ("get_baseline_length", 9),
+                     ("get_baseline_course", 10))),
+    }
+    # STI 035 RTK Baseline Data of Rover Moving Base Receiver has the layout of STI 032.
+    SCHEMAS["STI,035"] = SCHEMAS["STI,032"]
+
+    # Handler methods by sentence type. Methods of SCHEMAS are compiled by
+    # compile_handlers once the class or its subclass is built, unless the class
+    # has a hand written one.
+    HANDLER_METHODS = {
+        "GGA": "gga",
+        "GLL": "gll",
+        "GSA": "gsa",
+        "GSV": "gsv",
+        "RMC": "rmc",
+        "VTG": "vtg",
+        "ZDA": "zda",
+        "THS": "ths",
+        "STI,005": "sti_005",
+        "STI,030": "sti_030",
+        "STI,032": "sti_032",
+        "STI,035": "sti_035",
+    }
+    # Handlers compiled by compile_handlers, a method of other value is hand written.
+    __compiled_handlers = set()
 
-    def rmc(self) -> None:
-        """
-        Recommended minimum specific GNSS data
-        """
-        self.get_mode(self.fields[12])
-        self.get_nav_status(self.fields[13])
-        if (self.fields[2] == self.VALID
-                and self.nav_status  not in [self.NAV_STATUS["V"], self.NAV_STATUS["U"]]
-                and self.mode != self.MODES["N"]):
-            self.get_time(self.fields[1])
-            self.get_lat(self.fields[3], self.fields[4])
-            self.get_lon(self.fields[5], self.fields[6])
-            self.get_speed(self.fields[7])
-            self.get_course(self.fields[8])
-            self.get_date(self.fields[9])
+    def __init_subclass__(cls, **kwargs) -> None:
+        # Handlers of subclass use its helpers and handler methods, unless it has own table.
+        super().__init_subclass__(**kwargs)
+        if "HANDLERS" not in cls.__dict__:
+            cls.HANDLERS = cls.compile_handlers()
 
-    def vtg(self) -> None:
+    @classmethod
+    def compile_schema(cls, schema: tuple):
         """
-        Course Over Ground and Ground Speed.
+        Build handler of sentence schema (steps, guard, guarded steps).
+
+        Step is get_* helper name, or function called with parser, followed by
+        indices (or slice) of its fields, the helper converts type and units. Steps
+        run in order, guarded steps only when every guard item holds. Guard item is
+        (field index or name of attribute decoded by steps, values, True if value
+        must be one of values or False if it must not). Source of the handler is
+        generated and compiled once, with helpers resolved on the class, so it has
+        no name lookups of helpers.
         """
-        self.get_mode(self.fields[9])
-        if self.fields[9] != "N":
-            self.get_speed(self.fields[1])
-            self.get_course(self.fields[5])
+        steps, guard, guarded_steps = schema
+        namespace = {}
+        lines = ["def handler(nmea):", "    fields = nmea.fields"]
+        cls._step_lines(steps, lines, namespace)
+        for key, values, required in guard:
+            name = f"values_{len(namespace)}"
+            namespace[name] = values
+            value = f"nmea.{key}" if isinstance(key, str) else f"fields[{key}]"
+            lines.append(f"    if {value} {'not in' if required else 'in'} {name}:")
+            lines.append("        return")
+        cls._step_lines(guarded_steps, lines, namespace)
+        exec("\n".join(lines), namespace)
+        return namespace["handler"]
 
-    def zda(self) -> None:
-        """
-        Time and date.
-        """
-        self.get_time(self.fields[1])
-        self.get_date_2(self.fields[2], self.fields[3], self.fields[4])
+    @classmethod
+    def _step_lines(cls, steps: tuple, lines: list, namespace: dict) -> None:
+        # Source lines of steps in handler, overridden by LazyMicroNMEA.
+        for step in steps:
+            helper = step[0]
+            if isinstance(helper, str):
+                helper = getattr(cls, helper)
+            source = cls.INLINE_HELPERS.get(helper)
+            if source is not None and len(step) == 2:
+                lines.append(f"    value = fields[{int(step[1])}]")
+                for line in source.split("\n"):
+                    lines.append("    " + line)
+                continue
+            name = f"helper_{len(namespace)}"
+            namespace[name] = helper
+            arguments = ["nmea"]
+            for index in step[1:]:
+                if isinstance(index, slice):
+                    arguments.append(f"fields[{index.start}:{index.stop}]")
+                else:
+                    arguments.append(f"fields[{int(index)}]")
+            lines.append(f"    {name}({', '.join(arguments)})")
 
-    def ths(self) -> None:
+    @classmethod
+    def compile_handlers(cls) -> dict:
         """
-        True Heading and Status.
+        Handlers of SCHEMAS compiled for get_* helpers of the class and set as its
+        HANDLER_METHODS, hand written methods of the class are kept.
         """
-        self.get_heading_mode(self.fields[2])
-        if self.fields[2] != "V":
-            self.get_heading(self.fields[1])
-
-    def sti(self) -> None:
+        handlers = {}
+        for sentence_type, schema in cls.SCHEMAS.items():
+            name = cls.HANDLER_METHODS.get(sentence_type)
+            handler = getattr(cls, name, None) if name else None
+            if handler is None or handler in cls.__compiled_handlers:
+                handler = cls.compile_schema(schema)
+                cls.__compiled_handlers.add(handler)
+                if name:
+                    setattr(cls, name, handler)
+            handlers[sentence_type] = handler
+        for sentence_type, name in cls.HANDLER_METHODS.items():
+            if sentence_type not in handlers:
+                handlers[sentence_type] = getattr(cls, name)
+        return handlers
+
+    def register_schema(self, sentence_type: str, schema: tuple) -> None:
         """
-        STI 005 Time Stamp Output
-        STI 030 Recommended Minimum 3D GNSS Data
-        STI 032 RTK Baseline Data
-        TODO STI 033 RTK RAW Measurement Monitoring Data
-        STI 035 RTK Baseline Data of Rover Moving Base Receiver
+        Register handler compiled from sentence schema for this instance, see
+        compile_schema and register_handler.
         """
-        if "005" in self.fields[1]:
-            self.get_time(self.fields[2])
-            self.get_date_2(self.fields[3], self.fields[4], self.fields[5])
-
-        elif "030" in self.fields[1]:
-            if self.fields[3] == self.VALID:
-                self.get_time(self.fields[2])
-                self.get_lat(self.fields[4], self.fields[5])
-                self.get_lon(self.fields[6], self.fields[7])
-                self.get_alt(self.fields[8])
-                self.get_east_velocity(self.fields[9])
-                self.get_north_velocity(self.fields[10])
-                self.get_up_velocity(self.fields[11])
-                self.get_date(self.fields[12])
-                self.get_mode(self.fields[13])
-                self.get_rtk_age(self.fields[14])
-                self.get_rtk_ratio(self.fields[15])
-
-        elif "032" in self.fields[1] or "035" in self.fields[1]:
-            if self.fields[4] == self.VALID:
-                self.get_time(self.fields[2])
-                self.get_date(self.fields[3])
-                self.get_mode(self.fields[5])
-                self.get_east_pob(self.fields[6])
-                self.get_north_pob(self.fields[7])
-                self.get_up_pob(self.fields[8])
-                self.get_baseline_length(self.fields[9])
-                self.get_baseline_course(self.fields[10])
-
-        elif "033" in self.fields[1]:
-            print("STI 033 not implemented")
-
-        else:
-            print(f"Unknown STI ID: {self.fields[1]}")
+        self.register_handler(sentence_type, self.compile_schema(schema))
 
     def __repr__(self) -> str:
         return (f"Time: {self.time}\n"
@@ -780,3 +1978,299 @@ class MicroNMEA:
                 f"Baseline course: {self.baseline_course}\n"
                 f"Navigation status: {self.nav_status}"
                 )
+
+
+MicroNMEA.HANDLERS = MicroNMEA.compile_handlers()
+
+
+def _lazy_attribute(name: str):
+    # Attribute of LazyMicroNMEA, decoded from fields of its pending source on the first read.
+    def get(self):
+        source = self._pending.get(name)
+        if source is not None:
+            fields, plan = source
+            plan[name](self, fields)
+        return self._values[name]
+
+    def set(self, value) -> None:
+        # Assigned value replaces field not decoded yet.
+        self._pending.pop(name, None)
+        self._values[name] = value
+
+    return property(get, set)
+
+
+class LazyMicroNMEA(MicroNMEA):
+    """
+    MicroNMEA converting fields on attribute access.
+
+    Handler keeps reference to fields of the sentence with static map of its
+    attributes to get_* helper and field indices, attributes of time, date,
+    coordinates and numeric values are decoded from it the first time the
+    attribute is read, the result is kept until the next sentence updating it.
+    Status attributes (quality, mode, nav_status, DOPs, satellites) are decoded
+    at once. Incorrect field is reported on read as "attribute" error and the
+    attribute is None.
+    """
+
+    __slots__ = ("_pending", "_values")
+
+    ERROR_MESSAGES = dict(MicroNMEA.ERROR_MESSAGES, attribute="Incorrect value of {sentence_type} attribute. {detail}")
+
+    # Helpers decoded on access with attributes they set.
+    LAZY_HELPERS = {
+        "get_time": ("time",),
+        "get_date": ("date",),
+        "get_date_2": ("date",),
+        "get_lat": ("lat", "lat_ns"),
+        "get_lon": ("lon", "lon_ew"),
+        "get_alt": ("alt",),
+        "get_satellites_used": ("number_of_satellites_used",),
+        "get_dgps_station_id": ("dgps_station_id",),
+        "get_dgps_age": ("dgps_age",),
+        "get_geoidal_separation": ("geoidal_separation",),
+        "get_speed": ("speed",),
+        "get_course": ("course",),
+        "get_heading": ("heading",),
+        "get_east_velocity": ("east_velocity",),
+        "get_north_velocity": ("north_velocity",),
+        "get_up_velocity": ("up_velocity",),
+        "get_rtk_age": ("rtk_age",),
+        "get_rtk_ratio": ("rtk_ratio",),
+        "get_east_pob": ("east_pob",),
+        "get_north_pob": ("north_pob",),
+        "get_up_pob": ("up_pob",),
+        "get_baseline_length": ("baseline_length",),
+        "get_baseline_course": ("baseline_course",),
+    }
+
+    def __init__(self, units: int = 1, formats: int = 2, crc: bool = True, on_fix=None,
+                 stats: bool = False, errors="print", keep_fields: bool = True, sentence_types=None) -> None:
+        self._pending = dict()
+        self._values = dict()
+        super().__init__(units, formats, crc, on_fix, stats, errors, keep_fields, sentence_types)
+
+    time = _lazy_attribute("time")
+    date = _lazy_attribute("date")
+    lat = _lazy_attribute("lat")
+    lat_ns = _lazy_attribute("lat_ns")
+    lon = _lazy_attribute("lon")
+    lon_ew = _lazy_attribute("lon_ew")
+    alt = _lazy_attribute("alt")
+    number_of_satellites_used = _lazy_attribute("number_of_satellites_used")
+    dgps_station_id = _lazy_attribute("dgps_station_id")
+    dgps_age = _lazy_attribute("dgps_age")
+    geoidal_separation = _lazy_attribute("geoidal_separation")
+    speed = _lazy_attribute("speed")
+    course = _lazy_attribute("course")
+    heading = _lazy_attribute("heading")
+    east_velocity = _lazy_attribute("east_velocity")
+    north_velocity = _lazy_attribute("north_velocity")
+    up_velocity = _lazy_attribute("up_velocity")
+    rtk_age = _lazy_attribute("rtk_age")
+    rtk_ratio = _lazy_attribute("rtk_ratio")
+    east_pob = _lazy_attribute("east_pob")
+    north_pob = _lazy_attribute("north_pob")
+    up_pob = _lazy_attribute("up_pob")
+    baseline_length = _lazy_attribute("baseline_length")
+    baseline_course = _lazy_attribute("baseline_course")
+
+    @classmethod
+    def _step_lines(cls, steps: tuple, lines: list, namespace: dict) -> None:
+        # Lazy steps only mark their attributes pending when the fields are not empty.
+        eager = []
+        plan = {}
+        conditions = []
+        for step in steps:
+            names = cls.LAZY_HELPERS.get(step[0]) if isinstance(step[0], str) else None
+            if names is None:
+                eager.append(step)
+                continue
+            decoder = cls.__decoder(getattr(cls, step[0]), step[1:], names)
+            for name in names:
+                plan[name] = decoder
+            conditions.append((" and ".join(f"fields[{int(index)}]" for index in step[1:]), names))
+        super()._step_lines(tuple(eager), lines, namespace)
+        if plan:
+            plan_name = f"plan_{len(namespace)}"
+            namespace[plan_name] = plan
+            lines.append(f"    source = (fields, {plan_name})")
+            lines.append("    pending = nmea._pending")
+            for condition, names in conditions:
+                targets = " = ".join(f"pending[{name!r}]" for name in names)
+                lines.append(f"    if {condition}:")
+                lines.append(f"        {targets} = source")
+
+    @classmethod
+    def __decoder(cls, helper, indices: tuple, names: tuple):
+        # Function decoding attributes of lazy step from fields, when one of them is read.
+        # Attributes set by the helper are no longer pending, the attribute is kept
+        # if the helper does not set it.
+        lines = ["def decoder(nmea, fields):", "    values = nmea._values", "    try:"]
+        source = cls.INLINE_HELPERS.get(helper)
+        if source is not None and len(indices) == 1:
+            # Inlined helper sets the value without the property.
+            for name in names:
+                source = source.replace(f"nmea.{name} = ", f"values[{name!r}] = ")
+            lines.append(f"        nmea._pending.pop({names[0]!r})")
+            lines.append(f"        value = fields[{int(indices[0])}]")
+            for line in source.split("\n"):
+                lines.append("        " + line)
+        else:
+            lines.append(f"        helper(nmea, {', '.join(f'fields[{int(index)}]' for index in indices)})")
+        lines.append("    except Exception as e:")
+        for name in names:
+            lines.append(f"        nmea._pending.pop({name!r}, None)")
+            lines.append(f"        values[{name!r}] = None")
+        lines.append(f"        nmea.report_error('attribute', {names[0]!r}, e)")
+        namespace = {"helper": helper}
+        exec("\n".join(lines), namespace)
+        return namespace["decoder"]
+
+
+class NMEAPool:
+    """
+    Parsers of many receivers in one process.
+
+    Sentences tagged by stream ID (any hashable, e.g. receiver serial number or
+    connection) are decoded by MicroNMEA of the stream, created on the first
+    sentence with options of the pool. Class tables are shared by all streams and
+    handlers registered in the pool are kept in one table of the pool, so state
+    of a stream is only its decoded values. on_fix and callable errors are called
+    with stream ID as the first argument. With max_streams, stream idle for the
+    longest time is dropped when a new one arrives, so memory of the pool is bounded.
+    """
+
+    def __init__(self, units: int = 1, formats: int = 2, crc: bool = True, on_fix=None,
+                 stats: bool = False, errors="print", max_streams: int = None, keep_fields: bool = True,
+                 sentence_types=None) -> None:
+        if not (callable(errors) or errors in ("print", "count", "ring", "raise")):
+            raise ValueError(f"Incorrect errors policy: {errors}")
+        self.units = units
+        self.formats = formats
+        self.crc = crc
+        self.on_fix = on_fix
+        self.stats = stats
+        self.errors = errors
+        self.max_streams = max_streams
+        self.keep_fields = keep_fields
+        self.sentence_types = sentence_types
+
+        class PoolMicroNMEA(MicroNMEA):
+            __slots__ = ()
+            # Handler table of the pool, streams keep reference to it.
+            HANDLERS = dict(MicroNMEA.HANDLERS)
+
+        self.__parser_class = PoolMicroNMEA
+        self.__streams = dict()
+
+    def __len__(self) -> int:
+        return len(self.__streams)
+
+    def __contains__(self, stream_id) -> bool:
+        return stream_id in self.__streams
+
+    def __iter__(self):
+        return iter(list(self.__streams))
+
+    def __getitem__(self, stream_id) -> MicroNMEA:
+        return self.__streams[stream_id]
+
+    def stream(self, stream_id) -> MicroNMEA:
+        """
+        Parser of the stream, created when the stream is new.
+        """
+        streams = self.__streams
+        nmea = streams.get(stream_id)
+        if nmea is None:
+            if self.max_streams is not None and len(streams) >= self.max_streams:
+                # Streams are ordered from the longest idle.
+                del streams[next(iter(streams))]
+            nmea = self.__parser_class(self.units, self.formats, self.crc,
+                                       self.__stream_callback(self.on_fix, stream_id), self.stats,
+                                       self.__stream_callback(self.errors, stream_id), self.keep_fields,
+                                       self.sentence_types)
+            streams[stream_id] = nmea
+        elif self.max_streams is not None:
+            streams[stream_id] = streams.pop(stream_id)
+        return nmea
+
+    @staticmethod
+    def __stream_callback(callback, stream_id):
+        if not callable(callback):
+            return callback
+        return lambda value: callback(stream_id, value)
+
+    def remove(self, stream_id) -> MicroNMEA:
+        """
+        Drop the stream, e.g. when its connection is closed. Returns its parser.
+        """
+        return self.__streams.pop(stream_id)
+
+    def register_handler(self, sentence_type: str, handler) -> None:
+        """
+        Register handler of sentence type for all streams of the pool.
+        """
+        self.__parser_class.HANDLERS[sentence_type] = handler
+
+    def parse(self, stream_id, raw_sentence: str):
+        """
+        Parse single sentence of the stream. Returns sentence type as MicroNMEA.parse.
+        """
+        nmea = self.__streams.get(stream_id)
+        if nmea is None or self.max_streams is not None:
+            nmea = self.stream(stream_id)
+        return nmea.parse(raw_sentence)
+
+    def parse_bytes(self, stream_id, raw_sentence):
+        nmea = self.__streams.get(stream_id)
+        if nmea is None or self.max_streams is not None:
+            nmea = self.stream(stream_id)
+        return nmea.parse_bytes(raw_sentence)
+
+    def feed(self, stream_id, data) -> int:
+        """
+        Parse raw chunk of bytes of the stream as MicroNMEA.feed.
+        """
+        return self.stream(stream_id).feed(data)
+
+    def flush(self) -> None:
+        """
+        Complete current epoch of all streams.
+        """
+        for nmea in self.__streams.values():
+            nmea.flush()
+
+
+class AsyncNMEAReader:
+    """
+    Async iterator of Fix snapshots decoded from asyncio StreamReader.
+
+    The stream is read only when the consumer asks for the next fix, so a slow
+    consumer holds back reading from its connection. on_fix of the given parser
+    is replaced by the reader.
+    """
+
+    def __init__(self, reader, nmea: MicroNMEA = None, chunk_size: int = 1024) -> None:
+        self.reader = reader
+        self.nmea = nmea if nmea is not None else MicroNMEA()
+        self.chunk_size = chunk_size
+        self.__fixes = []
+        self.__eof = False
+        self.nmea.on_fix = self.__fixes.append
+
+    def __aiter__(self) -> "AsyncNMEAReader":
+        return self
+
+    async def __anext__(self) -> Fix:
+        while not self.__fixes:
+            if self.__eof:
+                raise StopAsyncIteration
+            data = await self.reader.read(self.chunk_size)
+            if data:
+                self.nmea.feed(data)
+            else:
+                # Connection closed, complete the last epoch.
+                self.__eof = True
+                self.nmea.flush()
+        return self.__fixes.pop(0)
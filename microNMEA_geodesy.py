@@ -0,0 +1,269 @@
+"""
+Geodesic functions for coordinates decoded by MicroNMEA.
+
+Coordinates are decimal degrees given as float, str (formats=2) or Precise,
+altitudes are metres. Functions without suffix use float arithmetic. Functions
+with _precise suffix and LocalFrame(precise=True) use Precise fixed point
+arithmetic, which keeps resolution of about 1 mm on ports with single
+precision float (10 decimal places, finer within Precise.context). Formats=4 coordinates must be divided by 10^7 first.
+"""
+import math
+from array import array
+
+from microNMEA import Precise
+
+# WGS84 ellipsoid.
+WGS84_A = 6378137.0
+WGS84_F = 1 / 298.257223563
+WGS84_B = WGS84_A * (1 - WGS84_F)
+WGS84_E2 = WGS84_F * (2 - WGS84_F)
+# Mean radius of the Earth used by haversine.
+MEAN_RADIUS = 6371008.8
+
+_A_PRECISE = Precise("6378137")
+_E2_PRECISE = Precise("0.0066943799901413")
+_MEAN_RADIUS_PRECISE = Precise("6371008.8")
+_ONE = Precise("1")
+
+
+def _degrees(value) -> float:
+    if isinstance(value, Precise):
+        return float(value.value_str)
+    return float(value)
+
+
+def _precise(value) -> Precise:
+    if isinstance(value, Precise):
+        return value
+    if isinstance(value, str):
+        return Precise(value)
+    return Precise(f"{value:.{Precise.current_places()}f}")
+
+
+def _radians_precise(value) -> Precise:
+    return Precise.radians(_precise(value))
+
+
+def haversine(lat1, lon1, lat2, lon2, radius: float = MEAN_RADIUS) -> float:
+    """
+    Great circle distance in metres between two points on sphere of the radius.
+    """
+    phi1 = math.radians(_degrees(lat1))
+    phi2 = math.radians(_degrees(lat2))
+    sin_phi = math.sin((phi2 - phi1) / 2)
+    sin_lambda = math.sin(math.radians(_degrees(lon2) - _degrees(lon1)) / 2)
+    h = math.sqrt(sin_phi * sin_phi + math.cos(phi1) * math.cos(phi2) * sin_lambda * sin_lambda)
+    return 2 * radius * math.asin(min(h, 1.0))
+
+
+def haversine_precise(lat1, lon1, lat2, lon2, radius=_MEAN_RADIUS_PRECISE) -> Precise:
+    """
+    Great circle distance in metres as Precise. Half chord is computed with
+    Precise.hypot instead of squares, which would vanish in fixed point for short
+    baselines. Resolution is limited by 1e-10 rad, about 1 mm.
+    """
+    lat1 = _precise(lat1)
+    lat2 = _precise(lat2)
+    phi1 = _radians_precise(lat1)
+    phi2 = _radians_precise(lat2)
+    # Differences are taken in exact degrees before conversion to radians.
+    sin_phi = Precise.sin(_radians_precise(lat2 - lat1) / "2")
+    sin_lambda = Precise.sin(_radians_precise(_precise(lon2) - _precise(lon1)) / "2")
+    cos_product = Precise.cos(phi1) * Precise.cos(phi2)
+    h = Precise.hypot(sin_phi, sin_lambda * Precise.sqrt(cos_product))
+    if h._value > h.multiplier:
+        h = _ONE
+    return Precise.asin(h) * _precise(radius) * "2"
+
+
+def haversine_many(lats, lons, radius: float = MEAN_RADIUS) -> array:
+    """
+    Distances in metres between consecutive points, e.g. lat and lon columns of
+    MicroNMEA.parse_many. Cosine of every latitude is computed once.
+    """
+    distances = array("d")
+    previous_phi = previous_lambda = previous_cos = None
+    for lat, lon in zip(lats, lons):
+        phi = math.radians(_degrees(lat))
+        lambda_ = math.radians(_degrees(lon))
+        cos_phi = math.cos(phi)
+        if previous_phi is not None:
+            sin_phi = math.sin((phi - previous_phi) / 2)
+            sin_lambda = math.sin((lambda_ - previous_lambda) / 2)
+            h = math.sqrt(sin_phi * sin_phi + previous_cos * cos_phi * sin_lambda * sin_lambda)
+            distances.append(2 * radius * math.asin(min(h, 1.0)))
+        previous_phi, previous_lambda, previous_cos = phi, lambda_, cos_phi
+    return distances
+
+
+def vincenty(lat1, lon1, lat2, lon2, iterations: int = 200, tolerance: float = 1e-12) -> float:
+    """
+    Distance in metres on WGS84 ellipsoid by Vincenty inverse formula.
+    Raises ValueError when the formula does not converge (nearly antipodal points).
+    """
+    reduced = 1 - WGS84_F
+    u1 = math.atan(reduced * math.tan(math.radians(_degrees(lat1))))
+    u2 = math.atan(reduced * math.tan(math.radians(_degrees(lat2))))
+    sin_u1, cos_u1 = math.sin(u1), math.cos(u1)
+    sin_u2, cos_u2 = math.sin(u2), math.cos(u2)
+    longitude = math.radians(_degrees(lon2) - _degrees(lon1))
+    lambda_ = longitude
+    for _ in range(iterations):
+        sin_lambda, cos_lambda = math.sin(lambda_), math.cos(lambda_)
+        sin_sigma = math.sqrt((cos_u2 * sin_lambda) ** 2 + (cos_u1 * sin_u2 - sin_u1 * cos_u2 * cos_lambda) ** 2)
+        if sin_sigma == 0:
+            # Coincident points.
+            return 0.0
+        cos_sigma = sin_u1 * sin_u2 + cos_u1 * cos_u2 * cos_lambda
+        sigma = math.atan2(sin_sigma, cos_sigma)
+        sin_alpha = cos_u1 * cos_u2 * sin_lambda / sin_sigma
+        cos2_alpha = 1 - sin_alpha * sin_alpha
+        # Both points on equator have cos2_alpha = 0.
+        cos_2sigma_m = cos_sigma - 2 * sin_u1 * sin_u2 / cos2_alpha if cos2_alpha else 0.0
+        c = WGS84_F / 16 * cos2_alpha * (4 + WGS84_F * (4 - 3 * cos2_alpha))
+        previous = lambda_
+        lambda_ = longitude + (1 - c) * WGS84_F * sin_alpha * (
+            sigma + c * sin_sigma * (cos_2sigma_m + c * cos_sigma * (-1 + 2 * cos_2sigma_m * cos_2sigma_m)))
+        if abs(lambda_ - previous) < tolerance:
+            break
+    else:
+        raise ValueError("Vincenty formula did not converge")
+    u_2 = cos2_alpha * (WGS84_A * WGS84_A - WGS84_B * WGS84_B) / (WGS84_B * WGS84_B)
+    a = 1 + u_2 / 16384 * (4096 + u_2 * (-768 + u_2 * (320 - 175 * u_2)))
+    b = u_2 / 1024 * (256 + u_2 * (-128 + u_2 * (74 - 47 * u_2)))
+    delta_sigma = b * sin_sigma * (cos_2sigma_m + b / 4 * (
+        cos_sigma * (-1 + 2 * cos_2sigma_m * cos_2sigma_m) -
+        b / 6 * cos_2sigma_m * (-3 + 4 * sin_sigma * sin_sigma) * (-3 + 4 * cos_2sigma_m * cos_2sigma_m)))
+    return WGS84_B * a * (sigma - delta_sigma)
+
+
+def initial_bearing(lat1, lon1, lat2, lon2) -> float:
+    """
+    Initial great circle bearing in degrees [0, 360) from the first point to the second.
+    """
+    phi1 = math.radians(_degrees(lat1))
+    phi2 = math.radians(_degrees(lat2))
+    delta_lambda = math.radians(_degrees(lon2) - _degrees(lon1))
+    sin_half = math.sin(delta_lambda / 2)
+    # cos(phi1)sin(phi2) - sin(phi1)cos(phi2)cos(dl) rewritten without cancellation of short baselines.
+    x = math.sin(phi2 - phi1) + 2 * math.sin(phi1) * math.cos(phi2) * sin_half * sin_half
+    y = math.sin(delta_lambda) * math.cos(phi2)
+    return math.degrees(math.atan2(y, x)) % 360.0
+
+
+def initial_bearing_precise(lat1, lon1, lat2, lon2) -> Precise:
+    """
+    Initial great circle bearing in degrees [0, 360) as Precise.
+    """
+    lat1 = _precise(lat1)
+    lat2 = _precise(lat2)
+    phi1 = _radians_precise(lat1)
+    phi2 = _radians_precise(lat2)
+    delta_lambda = _radians_precise(_precise(lon2) - _precise(lon1))
+    sin_half = Precise.sin(delta_lambda / "2")
+    cos_phi2 = Precise.cos(phi2)
+    x = Precise.sin(_radians_precise(lat2 - lat1)) + Precise.sin(phi1) * cos_phi2 * sin_half * sin_half * "2"
+    y = Precise.sin(delta_lambda) * cos_phi2
+    bearing = Precise.atan2(y, x) * "180" / Precise.acos("-1")
+    return bearing + "360" if bearing._value < 0 else bearing
+
+
+def lla_to_ecef(lat, lon, alt=0.0) -> tuple:
+    """
+    Earth centered, earth fixed coordinates x, y, z in metres of WGS84 point.
+    """
+    phi = math.radians(_degrees(lat))
+    lambda_ = math.radians(_degrees(lon))
+    sin_phi = math.sin(phi)
+    cos_phi = math.cos(phi)
+    n = WGS84_A / math.sqrt(1 - WGS84_E2 * sin_phi * sin_phi)
+    alt = _degrees(alt)
+    return ((n + alt) * cos_phi * math.cos(lambda_), (n + alt) * cos_phi * math.sin(lambda_),
+            (n * (1 - WGS84_E2) + alt) * sin_phi)
+
+
+def lla_to_ecef_precise(lat, lon, alt="0") -> tuple:
+    """
+    Earth centered, earth fixed coordinates x, y, z in metres as Precise.
+    """
+    phi = _radians_precise(lat)
+    lambda_ = _radians_precise(lon)
+    sin_phi = Precise.sin(phi)
+    cos_phi = Precise.cos(phi)
+    n = _A_PRECISE / Precise.sqrt(_ONE - _E2_PRECISE * sin_phi * sin_phi)
+    n_alt = n + _precise(alt)
+    return (n_alt * cos_phi * Precise.cos(lambda_), n_alt * cos_phi * Precise.sin(lambda_),
+            (n * (_ONE - _E2_PRECISE) + _precise(alt)) * sin_phi)
+
+
+class LocalFrame:
+    """
+    East, north, up frame tangent to WGS84 ellipsoid at the reference point,
+    e.g. RTK base. Trigonometric functions and ECEF coordinates of the reference
+    point are computed once, conversion of each point costs one lla_to_ecef
+    and rotation.
+    """
+
+    def __init__(self, lat, lon, alt=0.0, precise: bool = False) -> None:
+        self.precise = precise
+        if precise:
+            phi = _radians_precise(lat)
+            lambda_ = _radians_precise(lon)
+            sin_phi, cos_phi = Precise.sin(phi), Precise.cos(phi)
+            sin_lambda, cos_lambda = Precise.sin(lambda_), Precise.cos(lambda_)
+            self.origin = lla_to_ecef_precise(lat, lon, alt)
+        else:
+            phi = math.radians(_degrees(lat))
+            lambda_ = math.radians(_degrees(lon))
+            sin_phi, cos_phi = math.sin(phi), math.cos(phi)
+            sin_lambda, cos_lambda = math.sin(lambda_), math.cos(lambda_)
+            self.origin = lla_to_ecef(lat, lon, alt)
+        self.__sin_lambda = sin_lambda
+        self.__cos_lambda = cos_lambda
+        self.__cos_phi = cos_phi
+        self.__sin_phi = sin_phi
+        self.__sin_phi_cos_lambda = sin_phi * cos_lambda
+        self.__sin_phi_sin_lambda = sin_phi * sin_lambda
+        self.__cos_phi_cos_lambda = cos_phi * cos_lambda
+        self.__cos_phi_sin_lambda = cos_phi * sin_lambda
+
+    def ecef_to_enu(self, x, y, z) -> tuple:
+        """
+        East, north and up offsets in metres of ECEF point from the reference.
+        """
+        origin_x, origin_y, origin_z = self.origin
+        dx = x - origin_x
+        dy = y - origin_y
+        dz = z - origin_z
+        east = self.__cos_lambda * dy - self.__sin_lambda * dx
+        north = self.__cos_phi * dz - self.__sin_phi_cos_lambda * dx - self.__sin_phi_sin_lambda * dy
+        up = self.__cos_phi_cos_lambda * dx + self.__cos_phi_sin_lambda * dy + self.__sin_phi * dz
+        return east, north, up
+
+    def enu(self, lat, lon, alt=0.0) -> tuple:
+        """
+        East, north and up offsets in metres of the point from the reference.
+        """
+        if self.precise:
+            return self.ecef_to_enu(*lla_to_ecef_precise(lat, lon, alt))
+        return self.ecef_to_enu(*lla_to_ecef(lat, lon, alt))
+
+    def enu_many(self, lats, lons, alts=None) -> tuple:
+        """
+        Columns of east, north and up offsets of the points, e.g. lat, lon and alt
+        columns of MicroNMEA.parse_many. Columns are arrays of float, or lists of
+        Precise for precise frame. Missing alts means altitude 0.
+        """
+        if self.precise:
+            east, north, up = [], [], []
+        else:
+            east, north, up = array("d"), array("d"), array("d")
+        if alts is None:
+            alts = [0.0] * len(lats)
+        enu = self.enu
+        for lat, lon, alt in zip(lats, lons, alts):
+            e, n, u = enu(lat, lon, alt)
+            east.append(e)
+            north.append(n)
+            up.append(u)
+        return east, north, up
@@ -0,0 +1,285 @@
+import mmap
+import multiprocessing
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+
+from microNMEA import MicroNMEA
+
+
+class NMEALogIndex:
+    """
+    Offset index of recorded NMEA log.
+
+    Log is memory mapped and indexed in one linear pass. For every sentence the
+    index keeps sentence type, time of the epoch and byte offset, so sentences of
+    one type or of a time range are read without rescanning the log. Sentences
+    without time field (e.g. GSA, GSV) get time of the last epoch. Time is in
+    seconds of the first day of the log, day rollover adds 86400. Sentences before
+    the first time field have time -1.
+
+    Index is saved to a sidecar file next to the log and reused while the log
+    size and modification time are unchanged.
+    """
+
+    SIDECAR_SUFFIX = ".idx"
+    MAGIC = b"NMEAIDX1"
+    # Source size, source modification time ns, number of sentences, size of type names.
+    HEADER = struct.Struct("<qqqq")
+    DAY = 86400.0
+    UNKNOWN_TIME = -1.0
+
+    def __init__(self, path: str, sidecar: bool = True) -> None:
+        self.path = path
+        self.sidecar_path = path + self.SIDECAR_SUFFIX
+        self.types = []
+        self.type_ids = array("H")
+        self.times = array("d")
+        self.offsets = array("q")
+        self.lengths = array("H")
+        self.loaded = False
+        self.__file = open(path, "rb")
+        self.__map = b""
+        try:
+            size = os.fstat(self.__file.fileno()).st_size
+            if size:
+                self.__map = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+            if sidecar and self.load():
+                self.loaded = True
+            else:
+                self.build()
+                if sidecar:
+                    try:
+                        self.save()
+                    except OSError:
+                        # Sidecar is only a cache, e.g. directory of the log may be read only.
+                        pass
+        except BaseException:
+            self.close()
+            raise
+
+    def __enter__(self) -> "NMEALogIndex":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def close(self) -> None:
+        if isinstance(self.__map, mmap.mmap):
+            self.__map.close()
+        self.__file.close()
+
+    def build(self) -> None:
+        """
+        Index all sentences of the log in one pass.
+        """
+        data = self.__map
+        type_ids = {}
+        self.types = []
+        self.type_ids = array("H")
+        self.times = array("d")
+        self.offsets = array("q")
+        self.lengths = array("H")
+        time_fields = MicroNMEA.TIME_FIELDS
+        time = self.UNKNOWN_TIME
+        day_offset = 0.0
+        position = 0
+        size = len(data)
+        while position < size:
+            start = data.find(b"$", position)
+            if start < 0:
+                break
+            end = data.find(b"\n", start)
+            if end < 0:
+                end = size
+            # Sentence cut by noise, start from the last sentence start before line end.
+            start = data.rfind(b"$", start, end)
+            stop = end - 1 if data[end - 1] == 13 else end
+            position = end + 1
+            if stop - start < MicroNMEA.HEADER_SIZE:
+                # Line cut right after the start character.
+                continue
+            sentence = data[start:stop]
+            sentence_type = MicroNMEA.get_sentence_type(str(sentence[:16], "ascii", "replace"))
+            field = time_fields.get(sentence_type)
+            if field is not None:
+                time_field = sentence.split(b"*")[0].split(b",")
+                if field < len(time_field) and time_field[field]:
+                    try:
+                        epoch_time = MicroNMEA._to_seconds(str(time_field[field], "ascii")) + day_offset
+                    except ValueError:
+                        epoch_time = time
+                    if time != self.UNKNOWN_TIME and epoch_time < time - self.DAY / 2:
+                        # Midnight passed.
+                        day_offset += self.DAY
+                        epoch_time += self.DAY
+                    time = epoch_time
+            type_id = type_ids.get(sentence_type)
+            if type_id is None:
+                type_id = type_ids[sentence_type] = len(self.types)
+                self.types.append(sentence_type)
+            self.type_ids.append(type_id)
+            self.times.append(time)
+            self.offsets.append(start)
+            self.lengths.append(min(stop - start, 0xFFFF))
+
+    def save(self) -> None:
+        """
+        Write index to the sidecar file.
+        """
+        stat = os.stat(self.path)
+        names = "\n".join(self.types).encode()
+        with open(self.sidecar_path, "wb") as file:
+            file.write(self.MAGIC)
+            file.write(self.HEADER.pack(stat.st_size, stat.st_mtime_ns, len(self.offsets), len(names)))
+            file.write(names)
+            for column in (self.type_ids, self.times, self.offsets, self.lengths):
+                if sys.byteorder == "big":
+                    column = array(column.typecode, column)
+                    column.byteswap()
+                column.tofile(file)
+
+    def load(self) -> bool:
+        """
+        Read index from the sidecar file. Returns False when the sidecar is missing,
+        broken or older than the log.
+        """
+        try:
+            stat = os.stat(self.path)
+            with open(self.sidecar_path, "rb") as file:
+                if file.read(len(self.MAGIC)) != self.MAGIC:
+                    return False
+                size, mtime_ns, count, names_size = self.HEADER.unpack(file.read(self.HEADER.size))
+                if size != stat.st_size or mtime_ns != stat.st_mtime_ns:
+                    return False
+                names = file.read(names_size).decode()
+                columns = (array("H"), array("d"), array("q"), array("H"))
+                for column in columns:
+                    column.fromfile(file, count)
+                    if sys.byteorder == "big":
+                        column.byteswap()
+        except (OSError, EOFError, ValueError, struct.error):
+            return False
+        self.types = names.split("\n") if names else []
+        self.type_ids, self.times, self.offsets, self.lengths = columns
+        return True
+
+    def seek(self, time: float) -> int:
+        """
+        Position of the first sentence of the epoch at or after the time.
+        """
+        return bisect_left(self.times, time)
+
+    def select(self, sentence_type: str = None, start: float = None, end: float = None):
+        """
+        Yield positions of sentences of the type (e.g. "GGA" or "STI,030") with
+        epoch time in [start, end] range. None means no limit.
+        """
+        if sentence_type is not None:
+            if sentence_type not in self.types:
+                return
+            type_id = self.types.index(sentence_type)
+        position = 0 if start is None else self.seek(start)
+        type_ids = self.type_ids
+        times = self.times
+        for position in range(position, len(times)):
+            if end is not None and times[position] > end:
+                return
+            if sentence_type is None or type_ids[position] == type_id:
+                yield position
+
+    def sentence(self, position: int) -> bytes:
+        """
+        Sentence at the position of the index, without line end.
+        """
+        offset = self.offsets[position]
+        return self.__map[offset:offset + self.lengths[position]]
+
+    def sentences(self, sentence_type: str = None, start: float = None, end: float = None):
+        """
+        Yield sentences selected as in select. Result can be passed to
+        MicroNMEA.parse_many.
+        """
+        for position in self.select(sentence_type, start, end):
+            yield self.sentence(position)
+
+
+def decode_parallel(path: str, processes: int = None, chunks_per_process: int = 4, units: int = 1,
+                    formats: int = 2, crc: bool = True, numpy: bool = False, errors="count",
+                    error_counts: dict = None) -> dict:
+    """
+    Decode NMEA log into columns per sentence type (see MicroNMEA.parse_many) in
+    a process pool.
+
+    Log is split into chunks on sentence boundaries, chunks are decoded by
+    separate MicroNMEA instances and columns are merged back in log order. Rows
+    of parse_many depend only on their own sentence, so the result equals
+    parse_file of the whole log. GSV produces no rows, so its groups split by a
+    chunk boundary do not matter.
+
+    Workers report errors with errors policy of MicroNMEA, "count" by default,
+    callable is called in the worker process. Errors counted by kind in workers
+    are added to error_counts dict, when it is given.
+    """
+    processes = processes or os.cpu_count() or 1
+    with open(path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        if not size:
+            return {}
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            boundaries = chunk_boundaries(data, processes * chunks_per_process)
+    tasks = [(path, start, end, units, formats, crc, errors) for start, end in zip(boundaries, boundaries[1:])]
+    if processes == 1 or len(tasks) == 1:
+        return _merge_columns(map(_decode_chunk, tasks), numpy, error_counts)
+    with multiprocessing.Pool(processes) as pool:
+        return _merge_columns(pool.imap(_decode_chunk, tasks), numpy, error_counts)
+
+
+def chunk_boundaries(data, chunks: int) -> list:
+    """
+    Offsets splitting data into at most the number of chunks, each offset is the
+    start of a line.
+    """
+    size = len(data)
+    boundaries = [0]
+    for chunk in range(1, chunks):
+        position = max(size * chunk // chunks, boundaries[-1])
+        if position < size:
+            line_end = data.find(b"\n", position)
+            position = size if line_end < 0 else line_end + 1
+        if position < size and position > boundaries[-1]:
+            boundaries.append(position)
+    boundaries.append(size)
+    return boundaries
+
+
+def _decode_chunk(task: tuple) -> tuple:
+    path, start, end, units, formats, crc, errors = task
+    with open(path, "rb") as file:
+        file.seek(start)
+        lines = file.read(end - start).splitlines()
+    nmea = MicroNMEA(units, formats, crc, errors=errors)
+    return nmea.parse_many(lines), nmea.error_counts
+
+
+def _merge_columns(parts, numpy: bool, error_counts: dict = None) -> dict:
+    results = {}
+    for part, counts in parts:
+        if error_counts is not None:
+            for kind, count in counts.items():
+                error_counts[kind] = error_counts.get(kind, 0) + count
+        for sentence_type, columns in part.items():
+            merged = results.get(sentence_type)
+            if merged is None:
+                results[sentence_type] = columns
+                continue
+            for name, column in columns.items():
+                merged[name].extend(column)
+    if numpy:
+        MicroNMEA.columns_to_numpy(results)
+    return results
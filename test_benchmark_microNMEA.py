@@ -0,0 +1,48 @@
+import datetime
+import json
+import os
+import tempfile
+import unittest
+
+import benchmark_microNMEA
+import microNMEA
+
+
+class BenchmarkMicroNMEA(unittest.TestCase):
+
+    def setUp(self) -> None:
+        print("\n".ljust(90, "-"))
+        print(f"Start {self.id()} {datetime.datetime.today()}".ljust(90, "-"))
+        print("".ljust(90, "-"))
+
+    def tearDown(self) -> None:
+        print("Stop Test".ljust(90, "-"))
+
+    def test_synthetic_workload(self) -> None:
+        sentences = benchmark_microNMEA.synthetic_workload(epochs=5, constellations=2, satellites=9)
+        with self.subTest():
+            # GGA, RMC, STI,030 and per constellation GSA and 3 GSV sentences.
+            self.assertEqual(5 * (3 + 2 * 4), len(sentences), "Number of sentences incorrect.")
+        nm = microNMEA.MicroNMEA()
+        for sentence in sentences:
+            with self.subTest(sentence):
+                self.assertIsNotNone(nm.parse(sentence), "Sentence not decoded.")
+
+    def test_output_and_compare(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "results.json")
+            results = benchmark_microNMEA.main(["--epochs", "5", "--repeat", "1", "--output", path])
+            with open(path) as file:
+                saved = json.load(file)
+        with self.subTest():
+            self.assertEqual(results["parser"]["sentences"], saved["parser"]["sentences"], "Results not saved.")
+        with self.subTest():
+            self.assertSetEqual({"GGA", "RMC", "GSA", "GSV", "STI,030"}, set(saved["parser"]["per_type"]),
+                                "Sentence types incorrect.")
+        with self.subTest():
+            self.assertTrue(benchmark_microNMEA.compare(results, saved)[0].startswith("parser:"),
+                            "Comparison incorrect.")
+
+
+if __name__ == "__main__":
+    unittest.main()
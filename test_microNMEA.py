@@ -1,6 +1,13 @@
+import asyncio
 import datetime
 import math
+import os
+import queue
 import random
+import statistics
+import tempfile
+import threading
+import types
 import unittest
 
 import microNMEA
@@ -55,6 +62,15 @@ class BasicMicroNMEA(unittest.TestCase):
             self.assertEqual("11.4226445666", self.nm.lon, f"Longitude incorrect.")
         with self.subTest():
             self.assertEqual("Autonomous Mode", self.nm.mode, f"Mode incorrect.")
+        self.nm.parse("$GNGLL,5546.7965950,N,01125.3586740,E,215231.000,A,N*41")
+        with self.subTest():
+            self.assertEqual("215230.000", self.nm.time, "Position of invalid mode must not be decoded.")
+        with self.subTest():
+            self.assertEqual("Data Not Valid", self.nm.mode, "Mode incorrect.")
+        self.nm.parse("$GNRMC,215744.000,A,5546.7893300,N,01125.3576699,E,000.0,000.0,080225,,,N,V*0B")
+        self.nm.parse("$GNGLL,5546.7965950,N,01125.3586740,E,215232.000,A,*0C")
+        with self.subTest():
+            self.assertEqual("215232.000", self.nm.time, "Mode of previous sentence must not reject position.")
 
     def test_GSA(self) -> None:
         self.nm.parse("$GNGSA,A,3,06,11,16,21,22,,,,,,,,1.2,0.7,1.0,4*33")
@@ -85,36 +101,12 @@ class BasicMicroNMEA(unittest.TestCase):
         # Stage 1
         self.nm.parse("$GPGSV,3,1,10,01,81,167,33,02,73,168,18,03,63,271,30,21,52,147,,1*68")
         print(self.nm.fields)
-        expected_satellite_data = {
-            'GP':
-                {'satellites_in_view': 10,
-                 'satellites':
-                     {1: [81, 167, 33], 2: [73, 168, 18],
-                      3: [63, 271, 30], 21: [52, 147, 'NA']}
-                 }
-        }
-        with self.subTest("First GSV message"):
-            self.assertDictEqual(expected_satellite_data, self.nm._MicroNMEA__tmp_gsv_part,
-                                 "Satellites tmp map is incorrect.")
         with self.subTest("First GSV message"):
             self.assertDictEqual({}, self.nm.gsv_data, "Satellites map should be empty.")
 
         # Stage 2
         self.nm.parse("$GPGSV,3,2,10,17,37,296,49,32,29,051,33,28,27,092,34,04,20,202,32,1*6C")
         print(self.nm.fields)
-        expected_satellite_data = {
-            'GP':
-                {'satellites_in_view': 10,
-                 'satellites':
-                     {1: [81, 167, 33], 2: [73, 168, 18],
-                      3: [63, 271, 30], 21: [52, 147, 'NA'],
-                      17: [37, 296, 49], 32: [29, 51, 33],
-                      28: [27, 92, 34], 4: [20, 202, 32]}
-                 }
-        }
-        with self.subTest("Second GSV message"):
-            self.assertDictEqual(expected_satellite_data, self.nm._MicroNMEA__tmp_gsv_part,
-                                 "Satellites tmp map is incorrect.")
         with self.subTest("Second GSV message"):
             self.assertDictEqual({}, self.nm.gsv_data, "Satellites map should be empty.")
 
@@ -125,15 +117,59 @@ class BasicMicroNMEA(unittest.TestCase):
             'GP':
                 {'satellites_in_view': 10,
                  'satellites':
-                    {1: [81, 167, 33], 2: [73, 168, 18],
-                     3: [63, 271, 30], 21: [52, 147, 'NA'],
-                     17: [37, 296, 49], 32: [29, 51, 33],
-                     28: [27, 92, 34], 4: [20, 202, 32],
-                     31: [18, 118, 9], 19: [17, 322, 41]}
+                    {1: (81, 167, 33), 2: (73, 168, 18),
+                     3: (63, 271, 30), 21: (52, 147, 'NA'),
+                     17: (37, 296, 49), 32: (29, 51, 33),
+                     28: (27, 92, 34), 4: (20, 202, 32),
+                     31: (18, 118, 9), 19: (17, 322, 41)}
                  }
         }
         with self.subTest("Third, the last one, GSV message"):
-            self.assertDictEqual(expected_satellite_data, self.nm.gsv_data, "Satellites map should be empty.")
+            self.assertDictEqual(expected_satellite_data, self.nm.gsv_data, "Satellites map incorrect.")
+        with self.subTest("Signal"):
+            self.assertDictEqual(self.nm.gsv_data["GP"], self.nm.gsv_signals[("GP", "1")], "Signal snapshot incorrect.")
+
+    def test_GSV_reassembly(self) -> None:
+        group = ["$GPGSV,3,1,10,01,81,167,33,02,73,168,18,03,63,271,30,21,52,147,,1*68",
+                 "$GPGSV,3,2,10,17,37,296,49,32,29,051,33,28,27,092,34,04,20,202,32,1*6C",
+                 "$GPGSV,3,3,10,31,18,118,09,19,17,322,41,1*67"]
+        for sentence in group:
+            self.nm.parse(sentence)
+        snapshot = self.nm.gsv_data["GP"]
+        # Gap, the second sentence is lost.
+        self.nm.parse(group[0])
+        self.nm.parse(group[2])
+        with self.subTest("gap"):
+            self.assertIs(snapshot, self.nm.gsv_data["GP"], "Incomplete group must be dropped.")
+        self.nm.parse("$GPGSV,1,1,02,05,10,020,30,06,11,021,,8*6F")
+        self.nm.parse("$GPGSV,1,1,02,07,12,022,31,08,13,023,32*77")
+        with self.subTest("stale"):
+            self.assertDictEqual({7: (12, 22, 31), 8: (13, 23, 32)}, self.nm.gsv_signals[("GP", "")]["satellites"],
+                                 "Satellites of previous group must not leak.")
+        with self.subTest("merged"):
+            self.assertSetEqual({1, 2, 3, 4, 5, 6, 7, 8, 17, 19, 21, 28, 31, 32},
+                                set(self.nm.gsv_data["GP"]["satellites"]), "Signals of talker must be merged.")
+        with self.subTest("merged"):
+            self.assertEqual(10, self.nm.gsv_data["GP"]["satellites_in_view"], "Satellites in view incorrect.")
+        with self.subTest("signals"):
+            self.assertListEqual([("GP", "1"), ("GP", "8"), ("GP", "")], list(self.nm.gsv_signals),
+                                 "Groups must be kept per signal.")
+        with self.subTest("snapshot"):
+            self.assertEqual(10, len(snapshot["satellites"]), "Published snapshot must not change.")
+        self.nm.parse("$GPGSV,1,1,00,1*64")
+        with self.subTest("empty"):
+            self.assertDictEqual({"satellites_in_view": 0, "satellites": {}}, self.nm.gsv_signals[("GP", "1")],
+                                 "Empty group incorrect.")
+        with self.subTest("cycle"):
+            self.assertIn(("GP", "8"), self.nm.gsv_signals, "Signal of the running cycle must be kept.")
+        # Only signal 1 is sent in the cycle, signals 8 and the one without ID stopped.
+        self.nm.parse(group[0])
+        self.nm.parse(group[1])
+        self.nm.parse(group[2])
+        with self.subTest("expired"):
+            self.assertListEqual([("GP", "1")], list(self.nm.gsv_signals), "Stopped signals must be dropped.")
+        with self.subTest("expired"):
+            self.assertEqual(10, len(self.nm.gsv_data["GP"]["satellites"]), "Stopped signals must not be merged.")
 
     def test_RMC(self) -> None:
         self.nm.parse("$GNRMC,215744.000,A,5546.7893300,N,01125.3576699,E,000.0,000.0,080225,,,A,S*01")
@@ -211,6 +247,874 @@ class BasicMicroNMEA(unittest.TestCase):
             self.assertEqual(3.724, self.nm.rtk_ratio, f"RTK ratio incorrect.")
 
 
+class DispatchMicroNMEA(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.nm = microNMEA.MicroNMEA()
+        print("\n".ljust(90, "-"))
+        print(f"Start {self.id()} {datetime.datetime.today()}".ljust(90, "-"))
+        print("".ljust(90, "-"))
+
+    def tearDown(self) -> None:
+        print(self.nm)
+        print("Stop Test".ljust(90, "-"))
+
+    def test_sentence_type(self) -> None:
+        with self.subTest():
+            self.assertEqual("GGA", self.nm.parse("$GPGGA,215230.000,5546.7965950,N,01125.3586740,E,1,19,0.7,"
+                                                  "225.278,M,36.900,M,,0000*5f"), "Sentence type incorrect.")
+        with self.subTest():
+            self.assertEqual("STI,005", self.nm.parse("$PSTI,005,121959.0000003,20,07,2020,,,,,*34"),
+                             "Sentence type incorrect.")
+        with self.subTest():
+            self.assertEqual(None, self.nm.parse("$GNTHS,121.15,A*10"), "Incorrect CRC must not be decoded.")
+
+    def test_register_handler(self) -> None:
+        sentences = []
+        self.nm.register_handler("TXT", lambda nm: sentences.append(nm.fields[4]))
+        self.nm.register_handler("STI,033", lambda nm: sentences.append(nm.fields[2]))
+        with self.subTest():
+            self.assertEqual("TXT", self.nm.parse("$GPTXT,01,01,02,ANTSTATUS=OK*3B"), "Sentence type incorrect.")
+        with self.subTest():
+            self.assertEqual("STI,033", self.nm.parse("$PSTI,033,034338.000*3F"), "Sentence type incorrect.")
+        with self.subTest():
+            self.assertListEqual(["ANTSTATUS=OK", "034338.000"], sentences, "Custom handlers not called.")
+        with self.subTest():
+            self.assertEqual(None, microNMEA.MicroNMEA().parse("$GPTXT,01,01,02,ANTSTATUS=OK*3B"),
+                             "Handler must be registered only for one instance.")
+
+    def test_register_schema(self) -> None:
+        receivers = []
+        schema = (((lambda nm, field: receivers.append(field), 6),),
+                  ((5, ("A",), True),),
+                  (("get_time", 2), ("get_date", 3)))
+        self.nm.register_schema("STI,033", schema)
+        with self.subTest():
+            self.assertEqual("STI,033", self.nm.parse("$PSTI,033,034338.000,111219,1,A,R,0,0,0*0A"),
+                             "Sentence type incorrect.")
+        with self.subTest():
+            self.assertEqual("034338.000", self.nm.time, "Time incorrect.")
+        with self.subTest():
+            self.assertEqual("111219", self.nm.date, "Date incorrect.")
+        self.nm.parse("$PSTI,033,034339.000,111219,1,V,R,0,0,0*1C")
+        with self.subTest():
+            self.assertEqual("034338.000", self.nm.time, "Guarded fields of invalid status must not be decoded.")
+        with self.subTest():
+            self.assertListEqual(["R", "R"], receivers, "Step function must be called with its field.")
+        nm = microNMEA.MicroNMEA(stats=True, errors="count")
+        with self.subTest():
+            self.assertIsNone(nm.parse("$PSTI,033,034338.000*3F"), "Schema must be registered only for one instance.")
+        with self.subTest():
+            self.assertDictEqual({"STI,033": 1}, nm.stats.unsupported, "Unknown sub ID must be unsupported.")
+        with self.subTest():
+            self.assertDictEqual({}, nm.stats.parsed, "Unknown sub ID must not be parsed.")
+
+    def test_subclass(self) -> None:
+        calls = []
+
+        class SubclassMicroNMEA(microNMEA.MicroNMEA):
+            __slots__ = ()
+
+            def get_lat(self, lat: str, lns: str) -> None:
+                calls.append(lat)
+
+            def gga(self) -> None:
+                calls.append("gga")
+
+        nm = SubclassMicroNMEA()
+        nm.parse("$GNRMC,215744.000,A,5546.7893300,N,01125.3576699,E,000.0,000.0,080225,,,A,S*01")
+        nm.parse("$GPGGA,215231.000,5546.7965950,N,01125.3586740,E,4,19,0.7,225.278,M,36.900,M,,0000*5b")
+        with self.subTest():
+            self.assertListEqual(["5546.7893300", "gga"], calls, "Overrides of subclass must be called.")
+        with self.subTest():
+            self.assertIsNone(nm.lat, "Latitude must be decoded by override.")
+        with self.subTest():
+            self.assertEqual("215744.000", nm.time, "Other fields must be decoded.")
+
+    def test_schema_gga(self) -> None:
+        sentence = "$GPGGA,215231.000,5546.7965950,N,01125.3586740,E,4,19,0.7,225.278,M,36.900,M,1.0,0012*77"
+        self.nm.parse(sentence)
+
+        class HelperMicroNMEA(microNMEA.MicroNMEA):
+            __slots__ = ()
+            INLINE_HELPERS = {}
+
+        nm = HelperMicroNMEA()
+        nm.parse(sentence)
+        for name in ("time", "lat", "lon", "alt", "quality", "number_of_satellites_used", "hdop",
+                     "geoidal_separation", "dgps_age", "dgps_station_id"):
+            with self.subTest(name):
+                self.assertEqual(getattr(nm, name), getattr(self.nm, name), "Inlined helper differs from get_*.")
+
+    def test_handler_methods(self) -> None:
+        for name in ("gga", "gll", "gsa", "gsv", "rmc", "vtg", "zda", "ths", "sti", "sti_030"):
+            with self.subTest(name):
+                self.assertTrue(callable(getattr(microNMEA.MicroNMEA, name, None)), "Handler method is missing.")
+        self.nm.fields = "GNRMC,215744.000,A,5546.7893300,N,01125.3576699,E,000.0,000.0,080225,,,A,S".split(",")
+        self.nm.rmc()
+        with self.subTest():
+            self.assertEqual("215744.000", self.nm.time, "Handler method must decode fields.")
+        self.nm.fields = "PSTI,005,121959.0000003,20,07,2020,,,,,".split(",")
+        self.nm.sti()
+        with self.subTest():
+            self.assertEqual("121959.0000003", self.nm.time, "STI handler must dispatch by sub ID.")
+
+    def test_sentence_types(self) -> None:
+        nm = microNMEA.MicroNMEA(stats=True, errors="raise", sentence_types=("GGA", "STI"))
+        gga = "$GPGGA,215230.000,5546.7965950,N,01125.3586740,E,1,19,0.7,225.278,M,36.900,M,,0000*5f"
+        with self.subTest():
+            self.assertEqual("GGA", nm.parse(gga), "Subscribed sentence must be decoded.")
+        with self.subTest():
+            self.assertEqual("STI,005", nm.parse("$PSTI,005,121959.0000003,20,07,2020,,,,,*34"),
+                             "Sub ID of subscribed generic type must be decoded.")
+        with self.subTest():
+            self.assertIsNone(nm.parse("$GNTHS,121.15,A*10"), "Unwanted sentence must be dropped before CRC.")
+        with self.subTest():
+            self.assertIsNone(nm.parse_bytes(b"$GNTHS,121.15,A*1F"), "Unwanted bytes must be dropped.")
+        with self.subTest():
+            self.assertEqual(2, nm.feed(b"$GNTHS,121.15,A*1F\r\n" + gga.encode() + b"\r\n"), "Feed incorrect.")
+        with self.subTest():
+            self.assertDictEqual({"THS": 3}, nm.stats.filtered, "Filtered incorrect.")
+        with self.subTest():
+            self.assertIsNone(nm.heading, "Unwanted sentence must not be decoded.")
+        nm.subscribe(["STI,030"])
+        with self.subTest():
+            self.assertIsNone(nm.parse(gga), "Subscription must be replaced.")
+        nm.subscribe(None)
+        with self.subTest():
+            self.assertEqual("THS", nm.parse("$GNTHS,121.15,A*1F"), "All sentences must be decoded.")
+        nm.subscribe("GGA")
+        with self.subTest():
+            self.assertSetEqual({"GGA"}, nm.sentence_types, "Single type must not be split to characters.")
+
+
+class ChecksumMicroNMEA(unittest.TestCase):
+
+    SENTENCES = ("$GNTHS,121.15,A*1F",
+                 "$GNZDA,215744.000,08,02,2025,00,00*46",
+                 "$GPGGA,215230.000,5546.7965950,N,01125.3586740,E,1,19,0.7,225.278,M,36.900,M,,0000*5f")
+
+    def setUp(self) -> None:
+        self.nm = microNMEA.MicroNMEA()
+        print("\n".ljust(90, "-"))
+        print(f"Start {self.id()} {datetime.datetime.today()}".ljust(90, "-"))
+        print("".ljust(90, "-"))
+
+    def tearDown(self) -> None:
+        print(self.nm)
+        print("Stop Test".ljust(90, "-"))
+
+    def test_checksum_types(self) -> None:
+        for sentence in self.SENTENCES:
+            message, expected_crc = sentence.split("*")
+            for data in (message, message.encode(), bytearray(message.encode()), memoryview(message.encode())):
+                with self.subTest(type(data).__name__):
+                    self.assertEqual(int(expected_crc, 16), self.nm.checksum(data), "Checksum incorrect.")
+                with self.subTest(type(data).__name__):
+                    self.assertTrue(self.nm.crc_check(data, expected_crc.upper().encode()), "CRC check failed.")
+
+    def test_crc_check_many(self) -> None:
+        sentences = list(self.SENTENCES) + [s.encode() for s in self.SENTENCES]
+        sentences += ["$GNTHS,121.15,A*10", b"$GNTHS,121.15,A*", "$GNTHS,121.15,A"]
+        expected = [True] * 6 + [False] * 3
+        self.assertListEqual(expected, self.nm.crc_check_many(sentences), "Batch CRC check incorrect.")
+
+    def test_parse_bytes(self) -> None:
+        with self.subTest():
+            self.assertEqual("THS", self.nm.parse_bytes(memoryview(b"$GNTHS,121.15,A*1F")), "Not decoded.")
+        with self.subTest():
+            self.assertEqual(121.15, self.nm.heading, f"Heading incorrect.")
+        with self.subTest():
+            self.assertEqual(None, self.nm.parse_bytes(b"$GNTHS,122.15,A*1F"), "Incorrect CRC must not be decoded.")
+        with self.subTest():
+            self.assertEqual(121.15, self.nm.heading, f"Heading incorrect.")
+
+
+class ParseManyMicroNMEA(unittest.TestCase):
+
+    SENTENCES = ["$GPGGA,215230.000,5546.7965950,N,01125.3586740,E,1,19,0.7,225.278,M,36.900,M,,0000*5f\r\n",
+                 "$GNGSA,A,3,06,11,16,21,22,,,,,,,,1.2,0.7,1.0,4*33\r\n",
+                 "$GNRMC,215744.000,A,5546.7893300,N,01125.3576699,E,000.0,000.0,080225,,,A,S*01\r\n",
+                 "$GPGGA,215231.000,5546.7965950,N,01125.3586740,E,4,19,0.7,225.278,M,36.900,M,,0000*5b\r\n",
+                 "$GNTHS,121.15,A*10\r\n"]
+
+    def setUp(self) -> None:
+        self.nm = microNMEA.MicroNMEA()
+        print("\n".ljust(90, "-"))
+        print(f"Start {self.id()} {datetime.datetime.today()}".ljust(90, "-"))
+        print("".ljust(90, "-"))
+
+    def tearDown(self) -> None:
+        print(self.nm)
+        print("Stop Test".ljust(90, "-"))
+
+    def check_columns(self, columns: dict) -> None:
+        with self.subTest():
+            self.assertSetEqual({"GGA", "GSA", "RMC"}, set(columns), "Sentence types incorrect.")
+        with self.subTest():
+            self.assertListEqual([78750.0, 78751.0], list(columns["GGA"]["time"]), "Time incorrect.")
+        with self.subTest():
+            self.assertListEqual([55.77994325, 55.77994325], list(columns["GGA"]["lat"]), "Latitude incorrect.")
+        with self.subTest():
+            self.assertListEqual([1.0, 4.0], list(columns["GGA"]["quality"]), "Quality incorrect.")
+        with self.subTest():
+            self.assertListEqual([1.2], list(columns["GSA"]["pdop"]), "PDOP incorrect.")
+        with self.subTest():
+            self.assertListEqual(["080225"], columns["RMC"]["date"], "Date incorrect.")
+        with self.subTest():
+            self.assertListEqual(["Autonomous Mode"], columns["RMC"]["mode"], "Mode incorrect.")
+
+    def test_parse_many(self) -> None:
+        columns = self.nm.parse_many(self.SENTENCES)
+        self.check_columns(columns)
+        with self.subTest():
+            self.assertEqual("d", columns["GGA"]["lon"].typecode, "Numeric column must be array of floats.")
+        with self.subTest():
+            columns = microNMEA.MicroNMEA().parse_many(["$GNGSA,A,3,06,,,,,,,,,,,,,,,4*1C"])
+            self.assertTrue(math.isnan(columns["GSA"]["pdop"][0]), "Missing value must be nan.")
+
+    def test_parse_many_invalid(self) -> None:
+        columns = self.nm.parse_many([self.SENTENCES[-2], "$GPGGA,120001.000,,,,,0,00,,,M,,M,,*7A",
+                                      self.SENTENCES[-3], "$GNRMC,120002.000,V,,,,,,,080225,,,N,V*25"])
+        with self.subTest():
+            self.assertListEqual([4.0, 0.0], list(columns["GGA"]["quality"]), "Quality incorrect.")
+        for name in ("time", "lat", "lon", "alt", "number_of_satellites_used", "hdop", "geoidal_separation"):
+            with self.subTest(name):
+                self.assertFalse(math.isnan(columns["GGA"][name][0]), "Value of fix missing.")
+            with self.subTest(name):
+                self.assertTrue(math.isnan(columns["GGA"][name][1]), "Row without fix must not repeat values.")
+        for name in ("time", "lat", "lon", "speed", "course"):
+            with self.subTest(name):
+                self.assertTrue(math.isnan(columns["RMC"][name][1]), "Row of invalid status must not repeat values.")
+        with self.subTest():
+            self.assertListEqual(["080225", None], columns["RMC"]["date"], "Date incorrect.")
+
+    def test_parse_many_short_time(self) -> None:
+        columns = self.nm.parse_many(["$GPGGA,2152,5546.7965950,N,01125.3586740,E,1,19,0.7,225.278,M,36.900,M,,0000*42",
+                                      self.SENTENCES[-2]])
+        with self.subTest():
+            self.assertEqual(2, len(columns["GGA"]["time"]), "Incorrect time must not stop parsing.")
+        with self.subTest():
+            self.assertTrue(math.isnan(columns["GGA"]["time"][0]), "Incorrect time must be nan.")
+        with self.subTest():
+            self.assertFalse(math.isnan(columns["GGA"]["lat"][0]), "Other values must be kept.")
+
+    def test_parse_file(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "log.nmea")
+            with open(path, "w", newline="") as file:
+                file.writelines(self.SENTENCES)
+            self.check_columns(self.nm.parse_file(path))
+
+
+class StatsMicroNMEA(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.nm = microNMEA.MicroNMEA(stats=True)
+        print("\n".ljust(90, "-"))
+        print(f"Start {self.id()} {datetime.datetime.today()}".ljust(90, "-"))
+        print("".ljust(90, "-"))
+
+    def tearDown(self) -> None:
+        print(self.nm.stats)
+        print("Stop Test".ljust(90, "-"))
+
+    def test_counters(self) -> None:
+        self.nm.parse("$GNTHS,121.15,A*1F")
+        self.nm.parse("$GNTHS,121.15,A*10")
+        self.nm.parse_bytes(b"$GNTHS,121.15,A*10")
+        self.nm.parse("$GPTXT,01,01,02,ANTSTATUS=OK*3B")
+        self.nm.parse("$GNTHS,121.15,A")
+        self.nm.feed(b"$GNTHS,121.15,A*1F\r\n")
+        stats = self.nm.stats.as_dict()
+        with self.subTest():
+            self.assertDictEqual({"THS": 4, "TXT": 1}, stats["seen"], "Seen incorrect.")
+        with self.subTest():
+            self.assertDictEqual({"THS": 2}, stats["parsed"], "Parsed incorrect.")
+        with self.subTest():
+            self.assertDictEqual({"THS": 2}, stats["crc_failures"], "CRC failures incorrect.")
+        with self.subTest():
+            self.assertDictEqual({"TXT": 1}, stats["unsupported"], "Unsupported incorrect.")
+        with self.subTest():
+            self.assertEqual(1, stats["incomplete"], "Incomplete incorrect.")
+        with self.subTest():
+            self.assertEqual(2, sum(stats["latency"]["THS"]), "Latency histogram incorrect.")
+        with self.subTest():
+            self.assertTrue(stats["handler_ns"]["THS"] > 0, "Handler time incorrect.")
+
+    def test_rejected(self) -> None:
+        self.nm.parse("$GNTHS,abc,A*67")
+        with self.subTest():
+            self.assertDictEqual({"THS": 1}, self.nm.stats.rejected, "Rejected incorrect.")
+        self.nm.stats.reset()
+        with self.subTest():
+            self.assertDictEqual({}, self.nm.stats.seen, "Counters not reset.")
+        with self.subTest():
+            self.assertIsNone(microNMEA.MicroNMEA().stats, "Stats must be disabled by default.")
+
+
+class ErrorsMicroNMEA(unittest.TestCase):
+
+    MALFORMED = ["$GNTHS,121.15,A*10", "$GPTXT,01,01,02,ANTSTATUS=OK*3B", "GNTHS,121.15,A", "$GNTHS,abc,A*67",
+                 "$PSTI,033,034338.000*3F"]
+
+    def setUp(self) -> None:
+        print("\n".ljust(90, "-"))
+        print(f"Start {self.id()} {datetime.datetime.today()}".ljust(90, "-"))
+        print("".ljust(90, "-"))
+
+    def tearDown(self) -> None:
+        print("Stop Test".ljust(90, "-"))
+
+    def test_count(self) -> None:
+        nm = microNMEA.MicroNMEA(errors="count")
+        for sentence in self.MALFORMED:
+            nm.parse(sentence)
+        nm.feed(b"$" * (nm.MAX_SENTENCE_LENGTH + 1))
+        self.assertDictEqual({"crc": 1, "unsupported": 2, "incomplete": 1, "handler": 1, "overflow": 1},
+                             nm.error_counts, "Error counters incorrect.")
+
+    def test_callback(self) -> None:
+        errors = []
+        nm = microNMEA.MicroNMEA(errors=errors.append)
+        for sentence in self.MALFORMED:
+            nm.parse(sentence)
+        with self.subTest():
+            self.assertListEqual(["crc", "unsupported", "incomplete", "handler", "unsupported"],
+                                 [error.kind for error in errors], "Error kinds incorrect.")
+        with self.subTest():
+            self.assertListEqual(["THS", "TXT", None, "THS", "STI,033"],
+                                 [error.sentence_type for error in errors], "Sentence types incorrect.")
+        with self.subTest():
+            self.assertEqual("Incorrect CRC for THS", str(errors[0]), "Message incorrect.")
+
+    def test_short(self) -> None:
+        errors = []
+        nm = microNMEA.MicroNMEA(errors=errors.append)
+        for sentence in ("$", "$P", "$GPGG"):
+            with self.subTest(sentence):
+                self.assertIsNone(nm.parse(sentence), "Sentence shorter than header must not be decoded.")
+        nm.parse_bytes(b"$")
+        with self.subTest():
+            self.assertListEqual(["incomplete"] * 4, [error.kind for error in errors], "Error kinds incorrect.")
+
+    def test_raise(self) -> None:
+        nm = microNMEA.MicroNMEA(errors="raise")
+        for sentence in self.MALFORMED:
+            with self.subTest(sentence):
+                with self.assertRaises(microNMEA.NMEAError):
+                    nm.parse(sentence)
+        with self.subTest():
+            with self.assertRaises(microNMEA.NMEAError):
+                nm.feed(b"$GNTHS,121.15,A*10\r\n$GNTHS,121.15,A*1F\r\n")
+        with self.subTest():
+            self.assertEqual(1, nm.feed(b""), "Sentences after the error must stay in buffer.")
+        with self.subTest():
+            self.assertEqual(121.15, nm.heading, "Heading incorrect.")
+
+    def test_ring(self) -> None:
+        nm = microNMEA.MicroNMEA(errors="ring")
+        for _ in range(nm.ERROR_LOG_SIZE):
+            nm.parse(self.MALFORMED[0])
+        nm.parse(self.MALFORMED[1])
+        errors = nm.recent_errors()
+        with self.subTest():
+            self.assertEqual(nm.ERROR_LOG_SIZE, len(errors), "Ring buffer size incorrect.")
+        with self.subTest():
+            self.assertEqual("unsupported", errors[-1].kind, "The newest error must be the last one.")
+        with self.subTest():
+            self.assertEqual(nm.ERROR_LOG_SIZE + 1, sum(nm.error_counts.values()), "Error counters incorrect.")
+
+    def test_incorrect_policy(self) -> None:
+        with self.assertRaises(ValueError):
+            microNMEA.MicroNMEA(errors="ignore")
+
+
+class FeedMicroNMEA(unittest.TestCase):
+
+    STREAM = (b"$GPGGA,215230.000,5546.7965950,N,01125.3586740,E,1,19,0.7,225.278,M,36.900,M,,0000*5f\r\n"
+              b"$GNVTG,122.7,T,,M,015.1,N,000.0,K,A*10\r\n"
+              b"$GNZDA,215744.000,08,02,2025,00,00*46\r\n")
+
+    def setUp(self) -> None:
+        self.nm = microNMEA.MicroNMEA()
+        print("\n".ljust(90, "-"))
+        print(f"Start {self.id()} {datetime.datetime.today()}".ljust(90, "-"))
+        print("".ljust(90, "-"))
+
+    def tearDown(self) -> None:
+        print(self.nm)
+        print("Stop Test".ljust(90, "-"))
+
+    def test_feed_whole_stream(self) -> None:
+        self.assertEqual(3, self.nm.feed(self.STREAM), "Number of sentences incorrect.")
+        with self.subTest():
+            self.assertEqual("55.7799432500", self.nm.lat, f"Latitude incorrect.")
+        with self.subTest():
+            self.assertEqual(122.7, self.nm.speed, f"Speed incorrect.")
+        with self.subTest():
+            self.assertEqual("080225", self.nm.date, f"Date incorrect.")
+
+    def test_feed_split_chunks(self) -> None:
+        for chunk_size in (1, 2, 7, 33, 64):
+            nm = microNMEA.MicroNMEA()
+            data = memoryview(self.STREAM)
+            count = 0
+            for offset in range(0, len(data), chunk_size):
+                count += nm.feed(data[offset:offset + chunk_size])
+            with self.subTest(chunk_size):
+                self.assertEqual(3, count, "Number of sentences incorrect.")
+            with self.subTest(chunk_size):
+                self.assertEqual("11.4226445666", nm.lon, f"Longitude incorrect.")
+            with self.subTest(chunk_size):
+                self.assertEqual("215744.000", nm.time, f"Time incorrect.")
+
+    def test_feed_noise(self) -> None:
+        count = self.nm.feed(bytearray(b"\x00\xff noise $GNGLL,5546.79" + self.STREAM[:40]))
+        self.assertEqual(0, count, "Partial sentence must wait for line end.")
+        count = self.nm.feed(self.STREAM[40:])
+        with self.subTest():
+            self.assertEqual(3, count, "Truncated sentence must be skipped.")
+        with self.subTest():
+            self.assertEqual("55.7799432500", self.nm.lat, f"Latitude incorrect.")
+        with self.subTest():
+            self.assertEqual(0, self.nm.feed(b"garbage without sentence start\r\n"), "Noise must be dropped.")
+        with self.subTest():
+            self.assertEqual(0, self.nm.feed(b"$" + b"A" * self.nm.MAX_SENTENCE_LENGTH), "Too long input.")
+        with self.subTest():
+            self.assertEqual(1, self.nm.feed(b"$GNTHS,121.15,A*1F\r\n"), "Buffer must recover.")
+
+
+class FixMicroNMEA(unittest.TestCase):
+
+    EPOCHS = ["$GPGGA,215230.000,5546.7965950,N,01125.3586740,E,1,19,0.7,225.278,M,36.900,M,,0000*5f",
+              "$GNGSA,A,3,01,02,03,04,17,19,32,,,,,,1.2,0.7,1.0,1*3F",
+              "$GNRMC,215230.000,A,5546.7893300,N,01125.3576699,E,010.5,000.0,080225,,,A,S*03",
+              "$GPGGA,215231.00,5546.7965950,N,01125.3586740,E,4,19,0.7,225.278,M,36.900,M,,0000*6B",
+              "$GNGSA,A,3,67,68,69,84,,,,,,,,,1.2,0.7,1.0,2*3B"]
+
+    def setUp(self) -> None:
+        self.fixes = []
+        self.nm = microNMEA.MicroNMEA(on_fix=self.fixes.append)
+        print("\n".ljust(90, "-"))
+        print(f"Start {self.id()} {datetime.datetime.today()}".ljust(90, "-"))
+        print("".ljust(90, "-"))
+
+    def tearDown(self) -> None:
+        print(self.nm)
+        print("Stop Test".ljust(90, "-"))
+
+    def test_consumer_error(self) -> None:
+        fixes = queue.Queue(maxsize=1)
+        nm = microNMEA.MicroNMEA(on_fix=fixes.put_nowait, errors="raise")
+        nm.parse(self.EPOCHS[0])
+        nm.parse(self.EPOCHS[3])
+        with self.subTest():
+            with self.assertRaises(queue.Full):
+                nm.parse("$GPGGA,215232.000,5546.7965950,N,01125.3586740,E,1,19,0.7,225.278,M,36.900,M,,0000*5d")
+        with self.subTest():
+            self.assertEqual("215232.000", nm.time, "Sentence completing the epoch must be decoded.")
+        with self.subTest():
+            self.assertEqual("215231.00", nm.fix.time, "Fix of completed epoch incorrect.")
+        with self.subTest():
+            with self.assertRaises(queue.Full):
+                nm.feed(b"$GNTHS,121.15,A*1F\r\n" + self.EPOCHS[0].encode() + b"\r\n$GNTHS,121.15,A*1F\r\n")
+        with self.subTest():
+            self.assertEqual(1, nm.feed(b""), "Sentences after the error must stay in buffer.")
+
+    def test_epochs(self) -> None:
+        for sentence in self.EPOCHS:
+            self.nm.parse(sentence)
+        with self.subTest():
+            self.assertEqual(1, len(self.fixes), "First epoch must complete on time change.")
+        fix = self.fixes[0]
+        with self.subTest():
+            self.assertEqual("215230.000", fix.time, f"Time incorrect.")
+        with self.subTest():
+            self.assertEqual("55.7798221666", fix.lat, f"Latitude incorrect.")
+        with self.subTest():
+            self.assertEqual(10.5, fix.speed, f"Speed incorrect.")
+        with self.subTest():
+            self.assertEqual("SPS Fix", fix.quality, f"Quality incorrect.")
+        with self.subTest():
+            self.assertListEqual(["GPS"], list(fix.satellites_used), "Satellites used must not change.")
+        with self.subTest():
+            self.assertIs(self.nm.flush(), self.nm.fix, "Last epoch must complete on flush.")
+        with self.subTest():
+            self.assertEqual("RTK Fix", self.fixes[1].quality, f"Quality incorrect.")
+        with self.subTest():
+            self.assertListEqual(["GLONASS"], list(self.fixes[1].satellites_used),
+                                 "Satellites of previous epoch must not be carried.")
+        with self.subTest():
+            self.assertEqual(None, self.nm.flush(), "No open epoch.")
+
+    def test_epoch_time(self) -> None:
+        self.nm.parse("$GPGSV,1,1,01,05,40,083,46,1*5D")
+        self.nm.parse("$GPGGA,120000.000,5546.7965950,N,01125.3586740,E,1,19,0.7,225.278,M,36.900,M,,0000*5B")
+        # Epochs without fix.
+        self.nm.parse("$GPGGA,120001.000,,,,,0,00,,,M,,M,,*7A")
+        self.nm.parse("$GNRMC,120002.000,V,,,,,,,080225,,,N,V*25")
+        self.nm.flush()
+        with self.subTest():
+            self.assertListEqual(["120000.000", "120001.000", "120002.000"], [fix.time for fix in self.fixes],
+                                 "Time of fix must be time of its epoch.")
+        with self.subTest():
+            self.assertListEqual(["55.7799432500", None, None], [fix.lat for fix in self.fixes],
+                                 "Position of previous epoch must not be carried.")
+        with self.subTest():
+            self.assertIn("GP", self.fixes[0].gsv_data, "Satellites in view must be in fix.")
+
+    def test_incorrect_time(self) -> None:
+        sentence = "$GPGGA,12:00,5546.7965950,N,01125.3586740,E,1,19,0.7,225.278,M,36.900,M,,0000*7F"
+        nm = microNMEA.MicroNMEA(errors="count")
+        self.nm.errors = "count"
+        with self.subTest():
+            self.assertEqual(nm.parse(sentence), self.nm.parse(sentence), "on_fix must not change decoding.")
+        with self.subTest():
+            self.assertDictEqual(nm.error_counts, self.nm.error_counts, "on_fix must not change errors.")
+
+    def test_immutable(self) -> None:
+        self.nm.parse(self.EPOCHS[0])
+        fix = self.nm.flush()
+        with self.assertRaises(AttributeError):
+            fix.lat = "0"
+        with self.assertRaises(AttributeError):
+            fix.extra = "0"
+
+
+class FixHistory(unittest.TestCase):
+
+    def setUp(self) -> None:
+        print("\n".ljust(90, "-"))
+        print(f"Start {self.id()} {datetime.datetime.today()}".ljust(90, "-"))
+        print("".ljust(90, "-"))
+
+    def tearDown(self) -> None:
+        print("Stop Test".ljust(90, "-"))
+
+    @staticmethod
+    def make_fix(i: int, hdop, lat: float = 55.78, lon: float = 11.42):
+        return types.SimpleNamespace(time=f"{12 + i // 3600:02d}{i // 60 % 60:02d}{i % 60:02d}.000", lat=lat,
+                                     lon=lon, alt=225.0 + i % 7, hdop=hdop, speed=float(i % 11))
+
+    def test_window(self) -> None:
+        history = microNMEA.FixHistory(25)
+        fixes = []
+        for i in range(200):
+            hdop = None if i % 13 == 0 else random.uniform(0.5, 3.0)
+            fixes.append(self.make_fix(i, hdop, 55.78 + random.gauss(0, 1e-5), 11.42 + random.gauss(0, 1e-5)))
+            history.append(fixes[-1])
+            window = fixes[-25:]
+            with self.subTest(i):
+                self.assertEqual(len(window), len(history), "Length incorrect.")
+            for name in ("alt", "hdop", "speed"):
+                values = [getattr(fix, name) for fix in window if getattr(fix, name) is not None]
+                with self.subTest(f"{i} {name}"):
+                    self.assertEqual(len(values), history.count(name), "Count incorrect.")
+                if not values:
+                    continue
+                with self.subTest(f"{i} {name}"):
+                    self.assertAlmostEqual(statistics.mean(values), history.mean(name), 9, "Mean incorrect.")
+                with self.subTest(f"{i} {name}"):
+                    self.assertEqual(min(values), history.minimum(name), "Minimum incorrect.")
+                with self.subTest(f"{i} {name}"):
+                    self.assertEqual(max(values), history.maximum(name), "Maximum incorrect.")
+                if len(values) > 1:
+                    with self.subTest(f"{i} {name}"):
+                        self.assertAlmostEqual(statistics.variance(values), history.variance(name), 9,
+                                               "Variance incorrect.")
+        with self.subTest():
+            self.assertListEqual([fix.lat for fix in fixes[-25:]], list(history.column("lat")), "Column incorrect.")
+        with self.subTest():
+            self.assertEqual(43399.0, history.column("time")[-1], "Time incorrect.")
+
+    def test_cep(self) -> None:
+        history = microNMEA.FixHistory(2000)
+        generator = random.Random(1)
+        # 1 m standard deviation in east and north.
+        sigma = math.degrees(1 / microNMEA.FixHistory.EARTH_RADIUS)
+        for i in range(2000):
+            history.append(self.make_fix(i, 1.0, 55.78 + generator.gauss(0, sigma),
+                                         11.42 + generator.gauss(0, sigma / math.cos(math.radians(55.78)))))
+        distances = sorted(math.hypot(east - history.mean("east"), north - history.mean("north"))
+                           for east, north in zip(history.column("east"), history.column("north")))
+        with self.subTest():
+            self.assertAlmostEqual(1.1774, history.cep(), delta=0.06, msg="CEP incorrect.")
+        with self.subTest():
+            self.assertAlmostEqual(distances[len(distances) // 2], history.cep(), delta=0.06,
+                                   msg="CEP differs from median distance.")
+
+    def test_on_fix(self) -> None:
+        history = microNMEA.FixHistory(2)
+        nm = microNMEA.MicroNMEA(on_fix=history.append, formats=4)
+        for sentence in FixMicroNMEA.EPOCHS:
+            nm.parse(sentence)
+        nm.flush()
+        with self.subTest():
+            self.assertListEqual([78750.0, 78751.0], list(history.column("time")), "Epochs incorrect.")
+        with self.subTest():
+            self.assertAlmostEqual(55.7799433, history.column("lat")[-1], 9, "Scaled latitude incorrect.")
+        with self.subTest():
+            self.assertEqual(10.5, history.maximum("speed"), "Maximum speed incorrect.")
+        with self.assertRaises(ValueError):
+            microNMEA.FixHistory(0)
+
+    def test_incorrect_time(self) -> None:
+        history = microNMEA.FixHistory(3)
+        nm = microNMEA.MicroNMEA(on_fix=history.append, errors="raise")
+        nm.parse("$GPGGA,2152,5546.7965950,N,01125.3586740,E,1,19,0.7,225.278,M,36.900,M,,0000*42")
+        nm.parse(FixMicroNMEA.EPOCHS[3])
+        nm.flush()
+        with self.subTest():
+            self.assertEqual(2, len(history), "Fix with incorrect time must be kept.")
+        with self.subTest():
+            self.assertTrue(math.isnan(history.column("time")[0]), "Incorrect time must be nan.")
+        with self.subTest():
+            self.assertEqual(78751.0, history.column("time")[1], "Time of next fix incorrect.")
+
+
+class SlotsMicroNMEA(unittest.TestCase):
+
+    GGA = "$GPGGA,215230.000,5546.7965950,N,01125.3586740,E,1,19,0.7,225.278,M,36.900,M,,0000*5f"
+
+    def setUp(self) -> None:
+        print("\n".ljust(90, "-"))
+        print(f"Start {self.id()} {datetime.datetime.today()}".ljust(90, "-"))
+        print("".ljust(90, "-"))
+
+    def tearDown(self) -> None:
+        print("Stop Test".ljust(90, "-"))
+
+    def test_slots(self) -> None:
+        nm = microNMEA.MicroNMEA()
+        nm.parse(self.GGA)
+        with self.subTest():
+            self.assertFalse(hasattr(nm, "__dict__"), "Parser state must not have instance dict.")
+        with self.subTest():
+            self.assertFalse(hasattr(microNMEA.NMEAPool().stream(1), "__dict__"), "Pool parser must be slotted.")
+        with self.assertRaises(AttributeError):
+            nm.extra = "0"
+
+    def test_keep_fields(self) -> None:
+        nm = microNMEA.MicroNMEA(keep_fields=False)
+        texts = []
+        nm.register_handler("TXT", lambda nm: texts.append(nm.fields[4]))
+        for sentence in (self.GGA, "$GPTXT,01,01,02,ANTSTATUS=OK*3B", "$GPXYZ,1*51"):
+            nm.parse(sentence)
+            with self.subTest(sentence):
+                self.assertEqual((), nm.fields, "Fields must be dropped after dispatch.")
+        with self.subTest():
+            self.assertEqual("55.7799432500", nm.lat, "Latitude incorrect.")
+        with self.subTest():
+            self.assertListEqual(["ANTSTATUS=OK"], texts, "Handler must see fields.")
+        nm = microNMEA.MicroNMEA()
+        nm.parse(self.GGA)
+        with self.subTest():
+            self.assertEqual(15, len(nm.fields), "Fields must be kept by default.")
+
+
+class LazyMicroNMEA(unittest.TestCase):
+
+    SENTENCES = ["$GPGGA,215230.000,5546.7965950,N,01125.3586740,E,1,19,0.7,225.278,M,36.900,M,,0000*5f",
+                 "$GNGSA,A,3,01,02,03,04,17,19,32,,,,,,1.2,0.7,1.0,1*3F",
+                 "$GNRMC,215744.000,A,3346.7893300,S,07025.3576699,W,000.0,000.0,080225,,,A,S*09",
+                 "$GNGLL,5546.7965950,N,01125.3586740,E,215230.000,A,A*4f",
+                 "$GNVTG,122.7,T,,M,015.1,N,000.0,K,A*10",
+                 "$GNZDA,215744.000,08,02,2025,00,00*46",
+                 "$GNTHS,121.15,A*1F",
+                 "$PSTI,005,121959.0000003,20,07,2020,,,,,*34",
+                 "$PSTI,030,033010.000,A,2447.0895508,N,12100.5234656,E,"
+                 "94.615,0.00,-0.01,0.04,111219,R,0.999,3.724*1A",
+                 "$PSTI,032,033010.000,111219,A,R,0.212,-0.312,0.032,0.379,124.5,,,,,*08"]
+    ATTRIBUTES = ("time", "date", "lat", "lat_ns", "lon", "lon_ew", "alt", "quality", "mode", "nav_status",
+                  "number_of_satellites_used", "hdop", "vdop", "pdop", "dgps_station_id", "dgps_age",
+                  "geoidal_separation", "speed", "course", "heading", "heading_mode", "east_velocity",
+                  "north_velocity", "up_velocity", "rtk_age", "rtk_ratio", "east_pob", "north_pob", "up_pob",
+                  "baseline_length", "baseline_course")
+
+    def setUp(self) -> None:
+        print("\n".ljust(90, "-"))
+        print(f"Start {self.id()} {datetime.datetime.today()}".ljust(90, "-"))
+        print("".ljust(90, "-"))
+
+    def tearDown(self) -> None:
+        print("Stop Test".ljust(90, "-"))
+
+    def test_same_values(self) -> None:
+        for units, formats in ((1, 1), (1, 2), (2, 3), (2, 4)):
+            eager = microNMEA.MicroNMEA(units, formats)
+            lazy = microNMEA.LazyMicroNMEA(units, formats)
+            for i, sentence in enumerate(self.SENTENCES):
+                eager.parse(sentence)
+                lazy.parse(sentence)
+                # Attributes of every other sentence are read, the rest stay pending.
+                if i % 2:
+                    continue
+                for name in self.ATTRIBUTES:
+                    with self.subTest(f"{units} {formats} {sentence[:10]} {name}"):
+                        self.assertEqual(getattr(eager, name), getattr(lazy, name), "Lazy attribute incorrect.")
+            fix = microNMEA.Fix(lazy)
+            for name in self.ATTRIBUTES:
+                with self.subTest(f"{units} {formats} {name}"):
+                    self.assertEqual(getattr(eager, name), getattr(lazy, name), "Lazy attribute incorrect.")
+            with self.subTest(f"{units} {formats} fix"):
+                self.assertEqual(eager.lat, fix.lat, "Fix of lazy parser incorrect.")
+
+    def test_pending(self) -> None:
+        nm = microNMEA.LazyMicroNMEA()
+        nm.parse(self.SENTENCES[0])
+        with self.subTest():
+            self.assertIn("lat", nm._pending, "Latitude must wait for access.")
+        with self.subTest():
+            self.assertIs(nm.fields, nm._pending["lat"][0], "Fields of sentence must be kept, not copied.")
+        with self.subTest():
+            self.assertEqual("E", nm.lon_ew, "Hemisphere must be decoded with its coordinate.")
+        with self.subTest():
+            self.assertNotIn("lon", nm._pending, "Longitude must be decoded with its hemisphere.")
+        with self.subTest():
+            self.assertEqual("55.7799432500", nm.lat, "Latitude incorrect.")
+        with self.subTest():
+            self.assertNotIn("lat", nm._pending, "Latitude must be converted once.")
+        nm.parse(self.SENTENCES[2])
+        with self.subTest():
+            self.assertEqual("-33.7798221666", nm.lat, "Latitude of next sentence incorrect.")
+        with self.subTest():
+            self.assertEqual(225.278, nm.alt, "Altitude of previous sentence must be kept.")
+        nm.parse(self.SENTENCES[0])
+        nm.lat = None
+        with self.subTest():
+            self.assertIsNone(nm.lat, "Assigned value must replace pending field.")
+
+    def test_incorrect_field(self) -> None:
+        nm = microNMEA.LazyMicroNMEA(errors="count")
+        with self.subTest():
+            self.assertEqual("THS", nm.parse("$GNTHS,abc,A*67"), "Conversion must wait for access.")
+        with self.subTest():
+            self.assertIsNone(nm.heading, "Incorrect heading must be None.")
+        with self.subTest():
+            self.assertDictEqual({"attribute": 1}, nm.error_counts, "Error must be reported on access.")
+
+
+class PoolMicroNMEA(unittest.TestCase):
+
+    GGA = "$GPGGA,215230.000,5546.7965950,N,01125.3586740,E,1,19,0.7,225.278,M,36.900,M,,0000*5f"
+    RMC = "$GNRMC,215744.000,A,3346.7893300,S,07025.3576699,W,000.0,000.0,080225,,,A,S*09"
+
+    def setUp(self) -> None:
+        print("\n".ljust(90, "-"))
+        print(f"Start {self.id()} {datetime.datetime.today()}".ljust(90, "-"))
+        print("".ljust(90, "-"))
+
+    def tearDown(self) -> None:
+        print("Stop Test".ljust(90, "-"))
+
+    def test_streams(self) -> None:
+        pool = microNMEA.NMEAPool()
+        with self.subTest():
+            self.assertEqual("GGA", pool.parse("rover", self.GGA), "Sentence type incorrect.")
+        with self.subTest():
+            self.assertEqual("RMC", pool.parse_bytes(7, self.RMC.encode()), "Sentence type incorrect.")
+        with self.subTest():
+            self.assertEqual("55.7799432500", pool["rover"].lat, "Latitude of first stream incorrect.")
+        with self.subTest():
+            self.assertEqual("-33.7798221666", pool[7].lat, "Latitude of second stream incorrect.")
+        with self.subTest():
+            self.assertListEqual(["rover", 7], list(pool), "Streams incorrect.")
+        with self.subTest():
+            self.assertEqual(0, pool.feed("base", self.GGA[:30].encode()), "Incomplete sentence dispatched.")
+        with self.subTest():
+            self.assertEqual(1, pool.feed("base", (self.GGA[30:] + "\r\n").encode()), "Sentence not dispatched.")
+        with self.subTest():
+            self.assertEqual("55.7799432500", pool["base"].lat, "Latitude of fed stream incorrect.")
+        pool.remove("base")
+        with self.subTest():
+            self.assertNotIn("base", pool, "Stream not removed.")
+
+    def test_callbacks(self) -> None:
+        fixes = []
+        errors = []
+        pool = microNMEA.NMEAPool(on_fix=lambda stream_id, fix: fixes.append((stream_id, fix.lat)),
+                                  errors=lambda stream_id, error: errors.append((stream_id, error.kind)))
+        pool.parse("a", self.GGA)
+        pool.parse("b", self.RMC)
+        pool.parse("b", self.RMC[:-2] + "00")
+        pool.flush()
+        with self.subTest():
+            self.assertListEqual([("a", "55.7799432500"), ("b", "-33.7798221666")], fixes, "Fixes incorrect.")
+        with self.subTest():
+            self.assertListEqual([("b", "crc")], errors, "Errors incorrect.")
+
+    def test_handlers(self) -> None:
+        pool = microNMEA.NMEAPool()
+        texts = []
+        pool.parse(1, self.GGA)
+        pool.register_handler("TXT", lambda nm: texts.append(nm.fields[4]))
+        pool.parse(1, "$GPTXT,01,01,02,ANTSTATUS=OK*3B")
+        pool.parse(2, "$GPTXT,01,01,02,ANTSTATUS=OK*3B")
+        with self.subTest():
+            self.assertListEqual(["ANTSTATUS=OK", "ANTSTATUS=OK"], texts, "Pool handler not shared.")
+        with self.subTest():
+            self.assertIsNone(microNMEA.MicroNMEA().parse("$GPTXT,01,01,02,ANTSTATUS=OK*3B"),
+                              "Pool handler must not change other parsers.")
+
+    def test_max_streams(self) -> None:
+        pool = microNMEA.NMEAPool(max_streams=2)
+        pool.parse(1, self.GGA)
+        pool.parse(2, self.GGA)
+        pool.parse(1, self.RMC)
+        pool.parse(3, self.GGA)
+        with self.subTest():
+            self.assertListEqual([1, 3], sorted(pool), "Longest idle stream must be dropped.")
+
+    def test_flat_tables(self) -> None:
+        with self.subTest():
+            self.assertEqual("GLONASS", microNMEA.MicroNMEA.TALKER_SYSTEMS["GL"], "Talker system incorrect.")
+        with self.subTest():
+            self.assertEqual("BDS", microNMEA.MicroNMEA.GNSS_SYSTEMS[4], "GNSS system incorrect.")
+        nm = microNMEA.MicroNMEA()
+        nm.parse("$GNGSV,1,1,01,01,81,167,33,1*43")
+        with self.subTest():
+            self.assertDictEqual({}, nm.gsv_data, "Unsupported talker must be ignored.")
+
+
+class AsyncMicroNMEA(unittest.TestCase):
+
+    def setUp(self) -> None:
+        print("\n".ljust(90, "-"))
+        print(f"Start {self.id()} {datetime.datetime.today()}".ljust(90, "-"))
+        print("".ljust(90, "-"))
+
+    def tearDown(self) -> None:
+        print("Stop Test".ljust(90, "-"))
+
+    async def receive_fixes(self, connections: int) -> list:
+        data = "".join(f"{sentence}\r\n" for sentence in FixMicroNMEA.EPOCHS).encode()
+
+        async def send(reader, writer) -> None:
+            # Sentences split between writes.
+            for offset in range(0, len(data), 50):
+                writer.write(data[offset:offset + 50])
+                await writer.drain()
+            writer.close()
+
+        async def receive() -> list:
+            reader, writer = await asyncio.open_connection(*server.sockets[0].getsockname()[:2])
+            fixes = [fix async for fix in microNMEA.AsyncNMEAReader(reader, chunk_size=64)]
+            writer.close()
+            return fixes
+
+        server = await asyncio.start_server(send, "127.0.0.1", 0)
+        async with server:
+            return await asyncio.gather(*(receive() for _ in range(connections)))
+
+    def test_stream_reader(self) -> None:
+        for fixes in asyncio.run(self.receive_fixes(20)):
+            with self.subTest():
+                self.assertListEqual(["215230.000", "215231.00"], [fix.time for fix in fixes], "Fixes incorrect.")
+            with self.subTest():
+                self.assertListEqual(["SPS Fix", "RTK Fix"], [fix.quality for fix in fixes], "Fixes incorrect.")
+
+
 class UnitsISO8601MicroNMEA(unittest.TestCase):
 
     def setUp(self) -> None:
@@ -263,6 +1167,55 @@ class FormatsMicroNMEA(unittest.TestCase):
             self.assertEqual("01125.3586740", self.nm.lon, f"Longitude incorrect.")
 
 
+class FloatFormatsMicroNMEA(unittest.TestCase):
+
+    def setUp(self) -> None:
+        print("\n".ljust(90, "-"))
+        print(f"Start {self.id()} {datetime.datetime.today()}".ljust(90, "-"))
+        print("".ljust(90, "-"))
+
+    def tearDown(self) -> None:
+        print("Stop Test".ljust(90, "-"))
+
+    def test_coordinates_float_GGA(self) -> None:
+        nm = microNMEA.MicroNMEA(formats=3)
+        nm.parse("$GPGGA,215230.000,5546.7965950,N,01125.3586740,E,1,19,0.7,225.278,M,36.900,M,,0000*5f")
+        with self.subTest():
+            self.assertAlmostEqual(55.77994325, nm.lat, 12, f"Latitude incorrect.")
+        with self.subTest():
+            self.assertAlmostEqual(11.422644566667, nm.lon, 12, f"Longitude incorrect.")
+
+    def test_coordinates_e7_RMC(self) -> None:
+        nm = microNMEA.MicroNMEA(formats=4)
+        nm.parse("$GNRMC,215744.000,A,3346.7893300,S,07025.3576699,W,000.0,000.0,080225,,,A,S*09")
+        with self.subTest():
+            self.assertEqual(-337798222, nm.lat, f"Latitude incorrect.")
+        with self.subTest():
+            self.assertEqual(-704226278, nm.lon, f"Longitude incorrect.")
+
+    def test_west_precise(self) -> None:
+        nm = microNMEA.MicroNMEA()
+        nm.parse("$GNRMC,215744.000,A,3346.7893300,S,07025.3576699,W,000.0,000.0,080225,,,A,S*09")
+        with self.subTest():
+            self.assertEqual("-33.7798221666", nm.lat, f"Latitude incorrect.")
+        with self.subTest():
+            self.assertEqual("-70.4226278316", nm.lon, f"Longitude incorrect.")
+
+    def test_random_error_bounds(self) -> None:
+        precise = microNMEA.MicroNMEA(formats=2)
+        fast = microNMEA.MicroNMEA(formats=3)
+        scaled = microNMEA.MicroNMEA(formats=4)
+        for iteration in range(200):
+            lon = f"{random.randint(0, 179):03d}{random.uniform(0, 59.9999999):010.7f}"
+            for nm in (precise, fast, scaled):
+                nm.get_lon(lon, "E")
+            with self.subTest(lon):
+                self.assertLessEqual(abs(float(precise.lon) - fast.lon), 1e-10, "Float error bound exceeded.")
+            with self.subTest(lon):
+                self.assertLessEqual(abs(float(precise.lon) - scaled.lon / 1e7), 0.5e-7 + 1e-10,
+                                     "Scaled integer error bound exceeded.")
+
+
 class Precise(unittest.TestCase):
 
     def setUp(self) -> None:
@@ -351,9 +1304,122 @@ class Precise(unittest.TestCase):
                          f"Divide floats both negative")
         print("PASSED test division with sign")
 
+    def test_precise_hypot(self) -> None:
+        values = (
+            ("5.0000000000", ("3", "4")),
+            ("0.0000000005", ("0.0000000003", "-0.0000000004")),
+            ("1.4142135623", ("1", "1")),
+        )
+        for expected, arguments in values:
+            with self.subTest(expected):
+                self.assertEqual(expected, microNMEA.Precise.hypot(*arguments).value_str, "Hypot incorrect.")
+        print("PASSED test hypot")
+
+
+class ContextPrecise(unittest.TestCase):
+
+    def setUp(self) -> None:
+        print("\n".ljust(90, "-"))
+        print(f"Start {self.id()} {datetime.datetime.today()}".ljust(90, "-"))
+        print("".ljust(90, "-"))
+
+    def tearDown(self) -> None:
+        print("Stop Test".ljust(90, "-"))
+
+    def test_context(self) -> None:
+        with self.subTest():
+            self.assertEqual(10, microNMEA.Precise("1").places, "Default decimal places incorrect.")
+        with microNMEA.Precise.context(7):
+            with self.subTest():
+                self.assertEqual("1.1234567", microNMEA.Precise("1.123456789").value_str, "Truncation incorrect.")
+            with self.subTest():
+                self.assertEqual("-0.3333333", (microNMEA.Precise("-1") / "3").value_str, "Division incorrect.")
+            with microNMEA.Precise.context(20):
+                with self.subTest():
+                    self.assertEqual(20, microNMEA.Precise.current_places(), "Nested context incorrect.")
+            with self.subTest():
+                self.assertEqual(7, microNMEA.Precise.current_places(), "Nested context not restored.")
+        with self.subTest():
+            self.assertEqual(10, microNMEA.Precise.current_places(), "Context not restored.")
+        with self.subTest():
+            self.assertEqual("2.50", microNMEA.Precise("2.5", places=2).value_str, "Explicit places incorrect.")
+        for places in (0, 31, "7"):
+            with self.subTest(places):
+                with self.assertRaises(ValueError):
+                    microNMEA.Precise.context(places)
+
+    def test_mixed_precision(self) -> None:
+        with microNMEA.Precise.context(7):
+            short = microNMEA.Precise("1.1234567")
+        long = microNMEA.Precise("2.0000000001")
+        values = (
+            ("3.1234567001", short + long),
+            ("-0.8765433001", short - long),
+            ("2.2469134001", short * long),
+            ("0.5617283499", short / long),
+            ("3.1234567001", long + short),
+        )
+        for expected, result in values:
+            with self.subTest(expected):
+                self.assertEqual(expected, result.value_str, "Mixed precision result incorrect.")
+        with self.subTest("with_places"):
+            self.assertEqual("-2.00", (microNMEA.Precise("0") - long).with_places(2).value_str,
+                             "Conversion of decimal places incorrect.")
+        with self.subTest("with_places"):
+            self.assertEqual("1.123456700000", short.with_places(12).value_str,
+                             "Conversion of decimal places incorrect.")
+
+    def test_trigonometry_precision(self) -> None:
+        with microNMEA.Precise.context(20):
+            values = (
+                ("3.14159265358979323846", microNMEA.Precise.acos("-1")),
+                ("0.78539816339744830962", microNMEA.Precise.atan("1")),
+                ("0.86602540378443864676", microNMEA.Precise.sin(microNMEA.Precise.acos("-1") / "3")),
+                ("0.01745329251994329577", microNMEA.Precise.radians("1")),
+            )
+        for expected, result in values:
+            with self.subTest(expected):
+                self.assertEqual(20, result.places, "Decimal places of result incorrect.")
+            with self.subTest(expected):
+                self.assertAlmostEqual(0, int((result - expected).value_str.replace(".", "")), delta=1,
+                                       msg=f"20 places result {result} incorrect.")
+        with microNMEA.Precise.context(5):
+            with self.subTest():
+                self.assertEqual("3.14159", microNMEA.Precise.atan2("0", "-1").value_str, "5 places pi incorrect.")
+
+    def test_threads(self) -> None:
+        barrier = threading.Barrier(2, timeout=5)
+        results = {}
+
+        def worker(places: int) -> None:
+            with microNMEA.Precise.context(places):
+                barrier.wait()
+                # Both threads are inside their contexts now.
+                results[places] = (microNMEA.Precise("1") / "3").value_str
+                barrier.wait()
+
+        threads = [threading.Thread(target=worker, args=(places,)) for places in (3, 12)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        with self.subTest():
+            self.assertDictEqual({3: "0.333", 12: "0.333333333333"}, results, "Thread contexts mixed.")
+        with self.subTest():
+            self.assertEqual(10, microNMEA.Precise.current_places(), "Context of main thread changed.")
+
+    def test_parser_context(self) -> None:
+        nm = microNMEA.MicroNMEA()
+        with microNMEA.Precise.context(7):
+            nm.parse("$GPGGA,215230.000,5546.7965950,N,01125.3586740,E,1,19,0.7,225.278,M,36.900,M,,0000*5f")
+        with self.subTest():
+            self.assertEqual("55.7799432", nm.lat, "Latitude with 7 places incorrect.")
+        with self.subTest():
+            self.assertEqual("11.4226445", nm.lon, "Longitude with 7 places incorrect.")
+
 
 class RandomPrecise(unittest.TestCase):
-    import randoma
+
     def setUp(self) -> None:
         print("\n".ljust(90, "-"))
         print(f"Start {self.id()} {datetime.datetime.today()}".ljust(90, "-"))
@@ -423,6 +1489,62 @@ class RandomPrecise(unittest.TestCase):
                                        f"FAILED test {iteration}, atan2({x}, {y}) = {expected} but it is {result}")
                 print(f"PASSED test {iteration}, atan2({x}, {y}) = {result} expected {expected}")
 
+    def test_random_precise_trigonometry(self) -> None:
+        decimal_places_precision = 9
+        print(f"Test random sin, cos, tan, atan, asin, acos and atan2, "
+              f"{decimal_places_precision} decimal places precision")
+        functions = (
+            (microNMEA.Precise.sin, math.sin, 7),
+            (microNMEA.Precise.cos, math.cos, 7),
+            (microNMEA.Precise.tan, math.tan, 1.2),
+            (microNMEA.Precise.atan, math.atan, 100),
+            (microNMEA.Precise.asin, math.asin, 1),
+            (microNMEA.Precise.acos, math.acos, 1),
+        )
+        iterations = 100
+        for function, expected_function, max_value in functions:
+            for iteration in range(1, iterations + 1):
+                # Argument with DECIMAL_PLACES, so expected value is computed from the same number.
+                value = f"{random.uniform(-max_value, max_value):.10f}"
+                with self.subTest(f"{function.__name__} {iteration}"):
+                    result = float(function(value).value_str)
+                    expected = expected_function(float(value))
+                    self.assertAlmostEqual(expected, result, decimal_places_precision,
+                                           f"FAILED test {iteration}, {function.__name__}({value}) = {expected} "
+                                           f"but it is {result}")
+                    print(f"PASSED test {iteration}, {function.__name__}({value}) = {result} expected {expected}")
+        for iteration in range(1, iterations + 1):
+            y = f"{random.uniform(-2, 2):.10f}"
+            x = f"{random.uniform(-2, 2):.10f}"
+            with self.subTest(f"atan2 {iteration}"):
+                result = float(microNMEA.Precise.atan2(y, x).value_str)
+                expected = math.atan2(float(y), float(x))
+                self.assertAlmostEqual(expected, result, decimal_places_precision,
+                                       f"FAILED test {iteration}, atan2({y}, {x}) = {expected} but it is {result}")
+                print(f"PASSED test {iteration}, atan2({y}, {x}) = {result} expected {expected}")
+
+    def test_precise_trigonometry_limits(self) -> None:
+        values = (
+            ("1.5707963268", microNMEA.Precise.asin("1")),
+            ("-1.5707963268", microNMEA.Precise.asin("-1")),
+            ("3.1415926536", microNMEA.Precise.acos("-1")),
+            ("0.0000000000", microNMEA.Precise.acos("1")),
+            ("0.0000141421", microNMEA.Precise.acos("0.9999999999")),
+            ("1.5707963268", microNMEA.Precise.atan2("0.0000000001", "0")),
+            ("3.1415926536", microNMEA.Precise.atan2("0", "-2")),
+            ("0.0000000000", microNMEA.Precise.atan2("0", "0")),
+            ("0.7853981634", microNMEA.Precise.atan2("0.0000000001", "0.0000000001")),
+            ("-1.0000000000", microNMEA.Precise.cos(microNMEA.Precise("3.1415926536"))),
+            ("0.0000000000", microNMEA.Precise.sin("0")),
+        )
+        for expected, result in values:
+            with self.subTest(expected):
+                self.assertEqual(expected, result.value_str, "Limit value incorrect.")
+        with self.subTest("asin domain"):
+            with self.assertRaises(ValueError):
+                microNMEA.Precise.asin("1.0000000001")
+        print("PASSED test trigonometry limits")
+
     def test_random_precise_sqrt(self) -> None:
         decimal_places_precision = 3
         print(f"Test random sqrt, {decimal_places_precision} decimal places precision")
@@ -0,0 +1,150 @@
+import datetime
+import math
+import random
+import unittest
+
+import microNMEA
+import microNMEA_geodesy
+
+
+class Geodesy(unittest.TestCase):
+
+    # Flinders Peak and Buninyong, reference example of Vincenty formula.
+    FLINDERS_PEAK = ("-37.9510334167", "144.4248678944")
+    BUNINYONG = ("-37.6528210861", "143.9264955250")
+
+    def setUp(self) -> None:
+        print("\n".ljust(90, "-"))
+        print(f"Start {self.id()} {datetime.datetime.today()}".ljust(90, "-"))
+        print("".ljust(90, "-"))
+
+    def tearDown(self) -> None:
+        print("Stop Test".ljust(90, "-"))
+
+    def test_vincenty(self) -> None:
+        with self.subTest("reference"):
+            self.assertAlmostEqual(54972.271, microNMEA_geodesy.vincenty(*self.FLINDERS_PEAK, *self.BUNINYONG), 2,
+                                   "Vincenty distance incorrect.")
+        with self.subTest("equator"):
+            self.assertAlmostEqual(111319.491, microNMEA_geodesy.vincenty(0, 0, 0, 1), 3,
+                                   "Vincenty distance along equator incorrect.")
+        with self.subTest("coincident"):
+            self.assertEqual(0.0, microNMEA_geodesy.vincenty(10, 20, 10, 20), "Distance of coincident points.")
+        with self.subTest("antipodal"):
+            with self.assertRaises(ValueError):
+                microNMEA_geodesy.vincenty(0, 0, 0.5, 179.7)
+
+    def test_haversine(self) -> None:
+        with self.subTest("degree"):
+            self.assertAlmostEqual(math.radians(1) * microNMEA_geodesy.MEAN_RADIUS,
+                                   microNMEA_geodesy.haversine("10", "20", "11", "20"), 6,
+                                   "Distance of one degree of meridian incorrect.")
+        with self.subTest("sphere"):
+            self.assertAlmostEqual(1, microNMEA_geodesy.haversine(*self.FLINDERS_PEAK, *self.BUNINYONG) /
+                                   microNMEA_geodesy.vincenty(*self.FLINDERS_PEAK, *self.BUNINYONG), 2,
+                                   "Haversine differs from ellipsoid distance.")
+        for iteration in range(1, 51):
+            lat1 = f"{random.uniform(-80, 80):.10f}"
+            lon1 = f"{random.uniform(-180, 180):.10f}"
+            lat2 = f"{float(lat1) + random.uniform(-1, 1):.10f}"
+            lon2 = f"{float(lon1) + random.uniform(-1, 1):.10f}"
+            expected = microNMEA_geodesy.haversine(lat1, lon1, lat2, lon2)
+            result = microNMEA_geodesy.haversine_precise(lat1, lon1, lat2, lon2)
+            with self.subTest(iteration):
+                self.assertIsInstance(result, microNMEA.Precise, "Precise result expected.")
+            with self.subTest(iteration):
+                self.assertAlmostEqual(expected, float(result.value_str), delta=0.005,
+                                       msg=f"Precise haversine ({lat1}, {lon1}) ({lat2}, {lon2}) incorrect.")
+        with microNMEA.Precise.context(14):
+            result = microNMEA_geodesy.haversine_precise("55.7799", "11.4226", "55.7800", "11.4227")
+        with self.subTest("context"):
+            self.assertAlmostEqual(microNMEA_geodesy.haversine("55.7799", "11.4226", "55.7800", "11.4227"),
+                                   float(result.value_str), delta=1e-5, msg="14 places haversine incorrect.")
+        print("PASSED test haversine")
+
+    def test_haversine_many(self) -> None:
+        lats = ["55.7799432500", 55.78, microNMEA.Precise("55.7801")]
+        lons = ["11.4226445667", 11.4227, microNMEA.Precise("11.4226")]
+        distances = microNMEA_geodesy.haversine_many(lats, lons)
+        with self.subTest():
+            self.assertEqual(2, len(distances), "Number of distances incorrect.")
+        for i, distance in enumerate(distances):
+            with self.subTest(i):
+                self.assertAlmostEqual(microNMEA_geodesy.haversine(lats[i], lons[i], lats[i + 1], lons[i + 1]),
+                                       distance, 9, "Batch distance incorrect.")
+
+    def test_initial_bearing(self) -> None:
+        values = (
+            (0.0, (0, 0, 1, 0)),
+            (90.0, (0, 0, 0, 1)),
+            (180.0, (1, 0, 0, 0)),
+            (270.0, (0, 1, 0, 0)),
+            (45.0, (0, 0, 0.0001, 0.0001)),
+        )
+        for expected, points in values:
+            with self.subTest(expected):
+                self.assertAlmostEqual(expected, microNMEA_geodesy.initial_bearing(*points), 5,
+                                       "Bearing incorrect.")
+            with self.subTest(f"precise {expected}"):
+                self.assertAlmostEqual(expected % 360, float(microNMEA_geodesy.initial_bearing_precise(
+                    *(str(point) for point in points)).value_str), 5, "Precise bearing incorrect.")
+        with self.subTest("reference"):
+            self.assertAlmostEqual(microNMEA_geodesy.initial_bearing(*self.FLINDERS_PEAK, *self.BUNINYONG),
+                                   float(microNMEA_geodesy.initial_bearing_precise(
+                                       *self.FLINDERS_PEAK, *self.BUNINYONG).value_str), 5,
+                                   "Precise bearing differs from float.")
+
+    def test_lla_to_ecef(self) -> None:
+        values = (
+            ((6378137.0, 0.0, 0.0), ("0", "0", "0")),
+            ((0.0, 6378237.0, 0.0), ("0", "90", "100")),
+            ((0.0, 0.0, microNMEA_geodesy.WGS84_B), ("90", "0", "0")),
+        )
+        for expected, point in values:
+            result = microNMEA_geodesy.lla_to_ecef(*point)
+            precise = microNMEA_geodesy.lla_to_ecef_precise(*point)
+            for axis in range(3):
+                with self.subTest(f"{point} {axis}"):
+                    self.assertAlmostEqual(expected[axis], result[axis], 6, "ECEF coordinate incorrect.")
+                with self.subTest(f"precise {point} {axis}"):
+                    self.assertAlmostEqual(expected[axis], float(precise[axis].value_str), delta=0.002,
+                                           msg="Precise ECEF coordinate incorrect.")
+
+    def test_local_frame(self) -> None:
+        base = ("55.7799432500", "11.4226445667", 225.278)
+        frame = microNMEA_geodesy.LocalFrame(*base)
+        precise_frame = microNMEA_geodesy.LocalFrame(*base, precise=True)
+        for axis, value in enumerate(frame.enu(*base)):
+            with self.subTest(axis):
+                self.assertAlmostEqual(0, value, 6, "Reference point must be the origin.")
+        east, north, up = frame.enu(base[0], base[1], base[2] + 10)
+        with self.subTest("up"):
+            self.assertAlmostEqual(10, up, 6, "Up offset incorrect.")
+        with self.subTest("horizontal"):
+            self.assertAlmostEqual(0, math.hypot(east, north), 6, "Horizontal offset of vertical point.")
+        lats = ["55.78", "55.7799432500", "55.7795"]
+        lons = ["11.4226445667", "11.4236", "11.4220"]
+        alts = [225.278, 225.278, 220.0]
+        columns = frame.enu_many(lats, lons, alts)
+        precise_columns = precise_frame.enu_many(lats, lons, alts)
+        for i in range(len(lats)):
+            expected = frame.enu(lats[i], lons[i], alts[i])
+            with self.subTest(f"distance {i}"):
+                self.assertAlmostEqual(microNMEA_geodesy.vincenty(base[0], base[1], lats[i], lons[i]),
+                                       math.hypot(expected[0], expected[1]), delta=0.01,
+                                       msg="Horizontal offset differs from distance.")
+            for axis in range(3):
+                with self.subTest(f"{i} {axis}"):
+                    self.assertEqual(expected[axis], columns[axis][i], "Batch ENU incorrect.")
+                with self.subTest(f"precise {i} {axis}"):
+                    self.assertAlmostEqual(expected[axis], float(precise_columns[axis][i].value_str), delta=0.002,
+                                           msg="Precise ENU incorrect.")
+        with self.subTest("north"):
+            self.assertGreater(columns[1][0], 0, "Point north of reference must have positive north offset.")
+        with self.subTest("east"):
+            self.assertGreater(columns[0][1], 0, "Point east of reference must have positive east offset.")
+        print("PASSED test local frame")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,196 @@
+import contextlib
+import datetime
+import io
+import os
+import tempfile
+import unittest
+
+import microNMEA
+import microNMEA_log
+
+
+LOG = ("$GPGGA,235958.000,5546.7965950,N,01125.3586740,E,1,19,0.7,225.278,M,36.900,M,,0000*58\r\n"
+       "$GNGSA,A,3,06,11,16,21,22,,,,,,,,1.2,0.7,1.0,4*33\r\n"
+       "$PSTI,030,235958.000,A,2447.0895508,N,12100.5234656,E,94.615,0.00,-0.01,0.04,111219,R,0.999,3.724*1B\r\n"
+       "garbage\r\n"
+       "$GPGGA,235959.000,5546.7965950,N,01125.3586740,E,1,19,0.7,225.278,M,36.900,M,,0000*59\r\n"
+       "$GNGSA,A,3,06,11,16,21,22,,,,,,,,1.2,0.7,1.0,4*33\r\n"
+       "$GPGGA,000000.000,5546.7965950,N,01125.3586740,E,4,19,0.7,225.278,M,36.900,M,,0000*5D\r\n"
+       "$PSTI,030,000000.000,A,2447.0895508,N,12100.5234656,E,94.615,0.00,-0.01,0.04,111219,R,0.999,3.724*1B\r\n")
+
+
+class NMEALogIndex(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "log.nmea")
+        with open(self.path, "w", newline="") as file:
+            file.write(LOG)
+        print("\n".ljust(90, "-"))
+        print(f"Start {self.id()} {datetime.datetime.today()}".ljust(90, "-"))
+        print("".ljust(90, "-"))
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+        print("Stop Test".ljust(90, "-"))
+
+    def test_index(self) -> None:
+        with microNMEA_log.NMEALogIndex(self.path) as index:
+            with self.subTest():
+                self.assertEqual(7, len(index), "Number of sentences incorrect.")
+            with self.subTest():
+                self.assertListEqual(["GGA", "GSA", "STI,030"], index.types, "Sentence types incorrect.")
+            with self.subTest():
+                self.assertListEqual([86398.0, 86398.0, 86398.0, 86399.0, 86399.0, 86400.0, 86400.0],
+                                     list(index.times), "Epoch times incorrect.")
+            with self.subTest():
+                self.assertEqual(LOG.split("\r\n")[4].encode(), index.sentence(3), "Sentence incorrect.")
+
+    def test_corrupt_lines(self) -> None:
+        with open(self.path, "w", newline="") as file:
+            file.write("$\r\n$GP\r\n" + LOG.replace("garbage", "$") + "$")
+        with microNMEA_log.NMEALogIndex(self.path) as index:
+            with self.subTest():
+                self.assertEqual(7, len(index), "Truncated lines must be skipped.")
+            with self.subTest():
+                self.assertListEqual(["GGA", "GSA", "STI,030"], index.types, "Sentence types incorrect.")
+
+    def test_select(self) -> None:
+        with microNMEA_log.NMEALogIndex(self.path) as index:
+            with self.subTest():
+                self.assertListEqual([0, 3, 5], list(index.select("GGA")), "GGA sentences incorrect.")
+            with self.subTest():
+                self.assertListEqual([6], list(index.select("STI,030", start=86399)), "STI sentences incorrect.")
+            with self.subTest():
+                self.assertListEqual([3, 4], list(index.select(start=86399, end=86399)), "Time range incorrect.")
+            with self.subTest():
+                self.assertListEqual([], list(index.select("RMC")), "Missing type must be empty.")
+            columns = microNMEA.MicroNMEA().parse_many(index.sentences("GGA", start=86399))
+            with self.subTest():
+                self.assertListEqual([86399.0, 0.0], list(columns["GGA"]["time"]), "Decoded time incorrect.")
+
+    def test_sidecar(self) -> None:
+        with microNMEA_log.NMEALogIndex(self.path) as index:
+            with self.subTest():
+                self.assertFalse(index.loaded, "Index must be built on first use.")
+            with self.subTest():
+                self.assertTrue(os.path.exists(index.sidecar_path), "Sidecar not saved.")
+            times = list(index.times)
+        with microNMEA_log.NMEALogIndex(self.path) as index:
+            with self.subTest():
+                self.assertTrue(index.loaded, "Sidecar not reused.")
+            with self.subTest():
+                self.assertListEqual(times, list(index.times), "Loaded index incorrect.")
+            with self.subTest():
+                self.assertListEqual([0, 3, 5], list(index.select("GGA")), "Loaded GGA sentences incorrect.")
+        with open(self.path, "a", newline="") as file:
+            file.write("$GNTHS,121.15,A*1F\r\n")
+        with microNMEA_log.NMEALogIndex(self.path) as index:
+            with self.subTest():
+                self.assertFalse(index.loaded, "Stale sidecar must be rebuilt.")
+            with self.subTest():
+                self.assertEqual(8, len(index), "Number of sentences incorrect.")
+
+    def test_sidecar_error(self) -> None:
+        files = []
+
+        class ReadOnlyIndex(microNMEA_log.NMEALogIndex):
+
+            def save(self) -> None:
+                files.append(self._NMEALogIndex__file)
+                raise PermissionError("read only directory")
+
+        class FailingIndex(microNMEA_log.NMEALogIndex):
+
+            def build(self) -> None:
+                files.append(self._NMEALogIndex__file)
+                raise MemoryError("index too large")
+
+        with ReadOnlyIndex(self.path) as index:
+            with self.subTest():
+                self.assertEqual(7, len(index), "Index must be usable without sidecar.")
+        with self.subTest():
+            with self.assertRaises(MemoryError):
+                FailingIndex(self.path)
+        with self.subTest():
+            self.assertTrue(files[-1].closed, "Log must be closed when constructor fails.")
+
+
+class DecodeParallel(unittest.TestCase):
+
+    GSV = ("$GPGSV,3,1,10,01,81,167,33,02,73,168,18,03,63,271,30,21,52,147,,1*68\r\n"
+           "$GPGSV,3,2,10,17,37,296,49,32,29,051,33,28,27,092,34,04,20,202,32,1*6C\r\n"
+           "$GPGSV,3,3,10,31,18,118,09,19,17,322,41,1*67\r\n")
+    NO_FIX = "$GPGGA,120001.000,,,,,0,00,,,M,,M,,*7A\r\n"
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "log.nmea")
+        with open(self.path, "w", newline="") as file:
+            for _ in range(50):
+                file.write(LOG)
+                file.write(self.GSV)
+        print("\n".ljust(90, "-"))
+        print(f"Start {self.id()} {datetime.datetime.today()}".ljust(90, "-"))
+        print("".ljust(90, "-"))
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+        print("Stop Test".ljust(90, "-"))
+
+    def test_chunk_boundaries(self) -> None:
+        with open(self.path, "rb") as file:
+            data = file.read()
+        boundaries = microNMEA_log.chunk_boundaries(data, 97)
+        with self.subTest():
+            self.assertEqual([0, len(data)], [boundaries[0], boundaries[-1]], "Boundaries must cover whole log.")
+        for boundary in boundaries[1:-1]:
+            with self.subTest(boundary):
+                self.assertEqual(b"\n", data[boundary - 1:boundary], "Chunk must start at line start.")
+
+    def test_decode_parallel(self) -> None:
+        expected = microNMEA.MicroNMEA().parse_file(self.path)
+        for processes in (1, 3):
+            columns = microNMEA_log.decode_parallel(self.path, processes=processes)
+            with self.subTest(processes):
+                self.assertSetEqual(set(expected), set(columns), "Sentence types incorrect.")
+            for sentence_type, sentence_columns in expected.items():
+                for name, column in sentence_columns.items():
+                    with self.subTest(f"{processes} {sentence_type} {name}"):
+                        self.assertListEqual(list(column), list(columns[sentence_type][name]),
+                                             "Merged column incorrect.")
+
+    def test_decode_parallel_no_fix(self) -> None:
+        with open(self.path, "w", newline="") as file:
+            for epoch in range(400):
+                file.write(LOG.split("\r\n")[epoch % 7] + "\r\n")
+                if epoch % 3 == 0:
+                    file.write(self.NO_FIX)
+        expected = microNMEA.MicroNMEA().parse_file(self.path)
+        columns = microNMEA_log.decode_parallel(self.path, processes=4)
+        for sentence_type, sentence_columns in expected.items():
+            for name, column in sentence_columns.items():
+                with self.subTest(f"{sentence_type} {name}"):
+                    self.assertEqual(repr(list(column)), repr(list(columns[sentence_type][name])),
+                                     "Rows must not depend on sentences of the previous chunk.")
+
+    def test_decode_parallel_errors(self) -> None:
+        with open(self.path, "a", newline="") as file:
+            file.write("$GNTHS,121.15,A*10\r\n$GPXYZ,1*51\r\n")
+        nm = microNMEA.MicroNMEA(errors="count")
+        nm.parse_file(self.path)
+        error_counts = {}
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            columns = microNMEA_log.decode_parallel(self.path, processes=2, error_counts=error_counts)
+        with self.subTest():
+            self.assertEqual("", output.getvalue(), "Workers must not print errors by default.")
+        with self.subTest():
+            self.assertDictEqual(nm.error_counts, error_counts, "Errors of workers must be counted.")
+        with self.subTest():
+            self.assertIn("GGA", columns, "Columns must be decoded.")
+        with self.subTest():
+            with self.assertRaises(microNMEA.NMEAError):
+                microNMEA_log.decode_parallel(self.path, processes=2, errors="raise")
+
+if __name__ == "__main__":
+    unittest.main()